@@ -15,6 +15,7 @@ from data.memory import ChromaMemoryStore
 from data.model import Game
 from data.types.action_decision import ActionDecision, ActionType
 from data.types.discard_decision import DiscardDecision
+from game.discard_solver import solve_discard
 from game.evaluator import HandEvaluation
 from game.player import Player
 from game.utils import get_min_bet, validate_bet_amount
@@ -27,6 +28,9 @@ API_KEY = os.getenv("OPENAI_API_KEY", "")
 class Agent(Player):
     """An intelligent poker agent that uses LLM-based decision making and various cognitive modules."""
 
+    # Every decision is an LLM round-trip
+    blocking_decisions = True
+
     def __init__(
         self,
         name: str,
@@ -156,6 +160,7 @@ class Agent(Player):
                 del self.conversation_history
 
             if hasattr(self, "strategy_planner"):
+                self.strategy_planner.close()
                 self.strategy_planner.current_plan = None
                 del self.strategy_planner.current_plan
 
@@ -233,6 +238,12 @@ class Agent(Player):
         except Exception:
             pass  # Suppress errors during interpreter shutdown
 
+    def start_planning(self, game: "Game") -> None:
+        """Start generating this hand's plan while earlier seats act."""
+        if self.use_planning:
+            hand_eval = self.hand.evaluate() if self.hand else None
+            self.strategy_planner.start_planning(self, game, hand_eval)
+
     def decide_action(self, game: "Game") -> ActionDecision:
         """Determine the next poker action based on the current game state."""
         # Get hand evaluation before making decision
@@ -263,14 +274,32 @@ class Agent(Player):
                 current_plan=current_plan,
                 hand_eval=hand_eval,
             )
+            return self._finalize_action(game, action)
+
+        except Exception as e:
+            AgentLogger.log_action(None, error=e)
+            return ActionDecision(
+                action_type=ActionType.CALL, reasoning="Failed to decide action"
+            )
 
-            # Validate raise amount if it's a raise action
-            if action.action_type == ActionType.RAISE:
-                min_bet = get_min_bet(game)
-                action.raise_amount = validate_bet_amount(action.raise_amount, min_bet)
+    async def decide_action_async(self, game: "Game") -> ActionDecision:
+        """Determine the next action, awaiting the planning and action queries."""
+        hand_eval: HandEvaluation = self.hand.evaluate() if self.hand else None
 
-            AgentLogger.log_action(action)
-            return action
+        if self.use_planning:
+            await self.strategy_planner.plan_strategy_async(self, game, hand_eval)
+
+        try:
+            current_plan = (
+                self.strategy_planner.current_plan if self.use_planning else None
+            )
+            action: ActionDecision = await LLMResponseGenerator.generate_action_async(
+                player=self,
+                game=game,
+                current_plan=current_plan,
+                hand_eval=hand_eval,
+            )
+            return self._finalize_action(game, action)
 
         except Exception as e:
             AgentLogger.log_action(None, error=e)
@@ -278,6 +307,15 @@ class Agent(Player):
                 action_type=ActionType.CALL, reasoning="Failed to decide action"
             )
 
+    def _finalize_action(self, game: "Game", action: ActionDecision) -> ActionDecision:
+        """Clamp a raise to the table's minimum bet and log the action."""
+        if action.action_type == ActionType.RAISE:
+            min_bet = get_min_bet(game)
+            action.raise_amount = validate_bet_amount(action.raise_amount, min_bet)
+
+        AgentLogger.log_action(action)
+        return action
+
     def get_message(self, game) -> str:
         """Generate table talk using LLM.
 
@@ -382,7 +420,10 @@ class Agent(Player):
     def decide_discard(
         self, game_state: Optional[Dict[str, Any]] = None
     ) -> DiscardDecision:
-        """Decide which cards to discard."""
+        """Decide which cards to discard.
+
+        Falls back to the exact discard solver if the LLM decision fails.
+        """
         try:
             discard: DiscardDecision = LLMResponseGenerator.generate_discard(
                 self, game_state, self.hand.cards
@@ -392,10 +433,27 @@ class Agent(Player):
 
         except Exception as e:
             AgentLogger.log_discard_error(e)
-            return DiscardDecision(
-                discard_indices=[], reasoning="Failed to decide discard"
+            try:
+                return solve_discard(self.hand.cards)
+            except Exception:
+                return DiscardDecision(discard=[], reasoning="Failed to decide discard")
+
+    async def decide_discard_async(
+        self, game_state: Optional[Dict[str, Any]] = None
+    ) -> DiscardDecision:
+        """Awaitable form of decide_discard(), with the same solver fallback."""
+        try:
+            return await LLMResponseGenerator.generate_discard_async(
+                self, game_state, self.hand.cards
             )
 
+        except Exception as e:
+            AgentLogger.log_discard_error(e)
+            try:
+                return solve_discard(self.hand.cards)
+            except Exception:
+                return DiscardDecision(discard=[], reasoning="Failed to decide discard")
+
     def update_strategy(self, game_outcome: Dict[str, Any]) -> None:
         #! need to refactor and combine with strategy_planner (with strategy_manager)
         """Update agent's strategy based on game outcomes and performance.
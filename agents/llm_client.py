@@ -208,8 +208,22 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: int = 150,
         system_message: Optional[str] = None,
+        tags: Optional[List[str]] = None,
     ) -> str:
-        """Execute asynchronous LLM query with retry logic."""
+        """Execute an asynchronous LLM query.
+
+        Awaiting the response lets the event loop run other games meanwhile.
+
+        Args:
+            prompt: The prompt to send
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            system_message: Optional system context
+            tags: Optional labels for the prompt log
+
+        Returns:
+            str: LLM response text
+        """
         start_time = time.time()
         self.metrics["total_queries"] += 1
 
@@ -226,16 +240,26 @@ class LLMClient:
                 max_tokens=max_tokens,
             )
 
+            response_text = response.choices[0].message.content
+
             # Add a small delay after successful response
             await asyncio.sleep(0.5)
 
+            LLMLogger.log_prompt_and_response(
+                prompt=prompt,
+                response=response_text,
+                system_message=system_message,
+                model=self.model,
+                tags=", ".join(tags) if tags else None,
+            )
+
             # Update metrics
             duration = time.time() - start_time
             self.metrics["query_times"].append(duration)
             self.metrics["total_tokens"] += response.usage.total_tokens
 
             LLMLogger.log_metrics_update(duration, response.usage.total_tokens)
-            return response.choices[0].message.content
+            return response_text
 
         except Exception as e:
             self.metrics["failed_queries"] += 1
@@ -17,15 +17,47 @@ class LLMResponseGenerator:
         Create a plan by calling the LLM with the appropriate planning prompt.
         Returns the parsed dictionary of plan data.
         """
-        prompt = PLANNING_PROMPT.format(
+        return cls.query_plan(
+            player.llm_client, cls.plan_prompt(player, game_state, hand_eval)
+        )
+
+    @classmethod
+    async def generate_plan_async(cls, player, game_state, hand_eval) -> "PlanResponse":
+        """Awaitable form of generate_plan(), using the client's async query."""
+        return await cls.query_plan_async(
+            player.llm_client, cls.plan_prompt(player, game_state, hand_eval)
+        )
+
+    @classmethod
+    def query_plan(cls, llm_client, prompt: str) -> "PlanResponse":
+        """Send an already formatted planning prompt and parse the plan data."""
+        response = llm_client.query(
+            prompt=prompt,
+            temperature=0.7,
+            max_tokens=200,
+            tags=["planning"],
+        )
+        return PlanResponse.parse_llm_response(response)
+
+    @classmethod
+    async def query_plan_async(cls, llm_client, prompt: str) -> "PlanResponse":
+        """Awaitable form of query_plan(), using the client's async query."""
+        response = await llm_client.query_async(
+            prompt=prompt,
+            temperature=0.7,
+            max_tokens=200,
+            tags=["planning"],
+        )
+        return PlanResponse.parse_llm_response(response)
+
+    @classmethod
+    def plan_prompt(cls, player, game_state, hand_eval) -> str:
+        """Format the planning prompt."""
+        return PLANNING_PROMPT.format(
             strategy_style=player.strategy_style,
             game_state=game_state,
             hand_eval=hand_eval,
         )
-        response = player.llm_client.query(
-            prompt=prompt, temperature=0.7, max_tokens=200, tags=["planning"]
-        )
-        return PlanResponse.parse_llm_response(response)
 
     @classmethod
     def generate_action(
@@ -35,6 +67,30 @@ class LLMResponseGenerator:
         Create an action by calling the LLM with the action prompt.
         Returns the raw LLM response string for further parsing.
         """
+        response = player.llm_client.query(
+            prompt=cls._action_prompt(player, game, current_plan, hand_eval),
+            temperature=0.7,
+            max_tokens=100,
+            tags=["action_generation"],
+        )
+        return ActionDecision.parse_llm_response(response)
+
+    @classmethod
+    async def generate_action_async(
+        cls, player, game, current_plan: Plan, hand_eval
+    ) -> "ActionDecision":
+        """Awaitable form of generate_action(), using the client's async query."""
+        response = await player.llm_client.query_async(
+            prompt=cls._action_prompt(player, game, current_plan, hand_eval),
+            temperature=0.7,
+            max_tokens=100,
+            tags=["action_generation"],
+        )
+        return ActionDecision.parse_llm_response(response)
+
+    @classmethod
+    def _action_prompt(cls, player, game, current_plan: Plan, hand_eval) -> str:
+        """Format the action prompt from the plan and the betting situation."""
         # Set default values if planning is disabled
         plan_approach = getattr(current_plan, "approach", "No specific approach")
         plan_reasoning = getattr(current_plan, "reasoning", "Direct decision making")
@@ -55,7 +111,7 @@ class LLMResponseGenerator:
             else ""
         )
 
-        execution_prompt = ACTION_PROMPT.format(
+        return ACTION_PROMPT.format(
             strategy_style=player.strategy_style,
             game_state=game.get_state(),
             hand_eval=hand_eval,
@@ -68,13 +124,6 @@ class LLMResponseGenerator:
             max_raise=max_raise,
             current_bet=current_bet
         )
-        response = player.llm_client.query(
-            prompt=execution_prompt,
-            temperature=0.7,
-            max_tokens=100,
-            tags=["action_generation"],
-        )
-        return ActionDecision.parse_llm_response(response)
 
     @classmethod
     def generate_discard(cls, player, game_state, cards) -> "DiscardDecision":
@@ -91,14 +140,33 @@ class LLMResponseGenerator:
         Raises:
             ValueError: If LLM response cannot be parsed into a valid discard decision
         """
-        prompt = DISCARD_PROMPT.format(
-            strategy_style=player.strategy_style,
-            game_state=game_state,
-            cards=cards,
-        )
-
         response = player.llm_client.query(
-            prompt=prompt, temperature=0.7, max_tokens=100, tags=["discard_generation"]
+            prompt=cls._discard_prompt(player, game_state, cards),
+            temperature=0.7,
+            max_tokens=100,
+            tags=["discard_generation"],
         )
 
         return DiscardDecision.parse_llm_response(response)
+
+    @classmethod
+    async def generate_discard_async(
+        cls, player, game_state, cards
+    ) -> "DiscardDecision":
+        """Awaitable form of generate_discard(), using the client's async query."""
+        response = await player.llm_client.query_async(
+            prompt=cls._discard_prompt(player, game_state, cards),
+            temperature=0.7,
+            max_tokens=100,
+            tags=["discard_generation"],
+        )
+        return DiscardDecision.parse_llm_response(response)
+
+    @classmethod
+    def _discard_prompt(cls, player, game_state, cards) -> str:
+        """Format the discard prompt."""
+        return DISCARD_PROMPT.format(
+            strategy_style=player.strategy_style,
+            game_state=game_state,
+            cards=cards,
+        )
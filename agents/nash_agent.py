@@ -3,6 +3,8 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
+from data.types.discard_decision import DiscardDecision
+from game.discard_solver import solve_discard
 from game.player import Player
 
 
@@ -21,8 +23,10 @@ class NashAgent(Player):
         bluff_frequency (float): Base probability of executing a bluff
     """
 
-    def __init__(self, name: str, chips: int = 1000) -> None:
-        super().__init__(name, chips)
+    def __init__(
+        self, name: str, chips: int = 1000, rng: Optional[random.Random] = None
+    ) -> None:
+        super().__init__(name, chips, rng)
         self.action_values = {"fold": 0.0, "call": 0.0, "raise": 0.0}
         self.learning_rate = 0.1  # Optional: For evolving weights
         self.temperature = 0.8  # Softmax temperature for probabilities
@@ -34,8 +38,9 @@ class NashAgent(Player):
         """
         Determines the next poker action using weighted probabilities.
 
-        Uses pot odds and current game state to adjust action weights, then applies
-        softmax normalization to select between folding, calling, or raising.
+        Uses pot odds, current game state and the post-draw percentile of the hand
+        to adjust action weights, then applies softmax normalization to select
+        between folding, calling, or raising.
 
         Args:
             game_state: String representation of the current game state
@@ -57,25 +62,37 @@ class NashAgent(Player):
             )  # Call more often if pot odds are favorable
             self.action_values["raise"] = 0.3  # Static raise probability for balance
 
+        # Shift weight from folding to raising as hand strength grows
+        values = dict(self.action_values)
+        if self.hand and len(self.hand.cards) == 5:
+            edge = self.hand.percentile(after_draw=True) - 0.5
+            values["fold"] -= edge
+            values["raise"] += edge
+
         # Apply softmax for probabilistic decisions
-        probabilities = self._softmax(self.action_values)
-        return random.choices(list(self.action_values.keys()), weights=probabilities)[0]
+        probabilities = self._softmax(values)
+        return self.rng.choices(list(values.keys()), weights=probabilities)[0]
+
+    def decide_discard(self) -> DiscardDecision:
+        """
+        Decide which cards to discard during the draw phase.
+
+        Uses the exact discard solver, which picks the discard with the best
+        expected final hand against the remaining deck.
+
+        Returns:
+            DiscardDecision: Positions (0-4) to discard
+        """
+        return solve_discard(self.hand.cards)
 
     def decide_draw(self) -> List[int]:
         """
         Determines which cards to discard during the draw phase.
 
-        Uses a simple value-based heuristic to keep the highest ranking cards
-        and discard the lowest ones.
-
         Returns:
             List[int]: Indices of cards to discard (0-4)
         """
-        hand = self.get_hand()  # Assuming this method returns a list of cards
-        card_values = [card.rank for card in hand]
-        return sorted(range(len(hand)), key=lambda i: card_values[i])[
-            :3
-        ]  # Keep top 2 cards
+        return self.decide_discard().discard
 
     def update_from_reward(self, reward: int, game_state: Dict[str, Any]) -> None:
         """
@@ -91,7 +108,7 @@ class NashAgent(Player):
         """
         Generate a strategic message to maintain unpredictability.
         """
-        return random.choice(
+        return self.rng.choice(
             ["I think I've got this.", "Hmmm... Let's see.", "Your move."]
         )
 
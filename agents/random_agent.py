@@ -8,15 +8,18 @@ from data.types.discard_decision import DiscardDecision
 from game.evaluator import HandEvaluation
 from game.player import Player
 
+# Log with lazy %-style arguments: headless games drop these before formatting
 logger = logging.getLogger(__name__)
 
 
 class RandomAgent(Player):
     """A poker player that makes random decisions."""
 
-    def __init__(self, name: str, chips: int = 1000):
-        """Initialize the random agent."""
-        super().__init__(name, chips)
+    def __init__(
+        self, name: str, chips: int = 1000, rng: Optional[random.Random] = None
+    ):
+        """Initialize the random agent, optionally with a seeded random source."""
+        super().__init__(name, chips, rng)
 
     def decide_action(
         self, game: "Game", hand_eval: Optional[HandEvaluation] = None
@@ -35,7 +38,7 @@ class RandomAgent(Player):
 
             # If we can't afford the current bet, fold
             if current_bet > self.chips:
-                logger.info(f"{self.name} cannot afford current bet, folding")
+                logger.info("%s cannot afford current bet, folding", self.name)
                 return ActionDecision(action_type=ActionType.FOLD)
 
             # Randomly choose between available actions
@@ -46,7 +49,7 @@ class RandomAgent(Player):
             if self.chips >= min_raise:
                 actions.append(ActionType.RAISE)
 
-            action = random.choice(actions)
+            action = self.rng.choice(actions)
 
             if action == ActionType.RAISE:
                 # Calculate valid raise range
@@ -54,15 +57,15 @@ class RandomAgent(Player):
                     self.chips, current_bet * 3
                 )  # Limit to 3x current bet or all chips
                 if max_raise > min_raise:
-                    raise_amount = random.randrange(
+                    raise_amount = self.rng.randrange(
                         min_raise, max_raise + 1, 10
                     )  # Step by 10 chips
-                    logger.info(f"{self.name} raised by {raise_amount}")
+                    logger.info("%s raised by %s", self.name, raise_amount)
                     return ActionDecision(
                         action_type=ActionType.RAISE, raise_amount=raise_amount
                     )
                 else:
-                    logger.info(f"{self.name} cannot raise, falling back to call")
+                    logger.info("%s cannot raise, falling back to call", self.name)
                     return ActionDecision(action_type=ActionType.CALL)
 
             return ActionDecision(action_type=action)
@@ -78,13 +81,13 @@ class RandomAgent(Player):
             DiscardDecision: Contains list of card indices (0-4) to discard
         """
         # Randomly discard 0-3 cards
-        num_to_discard = random.randint(0, 3)
+        num_to_discard = self.rng.randint(0, 3)
         if num_to_discard == 0:
             return DiscardDecision(discard=[])
 
         # Get random positions to discard
         positions = list(range(5))  # 5 card positions
-        discard_indices = sorted(random.sample(positions, num_to_discard))
+        discard_indices = sorted(self.rng.sample(positions, num_to_discard))
         return DiscardDecision(discard=discard_indices)
 
     def get_message(self, game_state: str) -> str:
@@ -94,13 +97,13 @@ class RandomAgent(Player):
     def decide_draw(self) -> List[int]:
         """Randomly decide which cards to draw."""
         # Randomly discard 0-3 cards
-        num_to_discard = random.randint(0, 3)
+        num_to_discard = self.rng.randint(0, 3)
         if num_to_discard == 0:
             return []
 
         # Get random positions to discard
         positions = list(range(5))  # 5 card positions
-        return sorted(random.sample(positions, num_to_discard))
+        return sorted(self.rng.sample(positions, num_to_discard))
 
     def perceive(self, game_state: str, opponent_message: str) -> Dict[str, Any]:
         """Do nothing as random agent doesn't track game state."""
@@ -1,5 +1,7 @@
+import asyncio
 import time
-from typing import TYPE_CHECKING, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Tuple, Union
 
 from data.types.plan import Approach, BetSizing, Plan
 from game.evaluator import HandEvaluation
@@ -31,6 +33,10 @@ class StrategyPlanner:
         REPLAN_STACK_THRESHOLD (int): Stack size change that triggers a replan
         current_plan (Optional[Plan]): The currently active strategic plan
         last_metrics (Optional[dict]): Last recorded game metrics used for planning
+
+    Planning can also start speculatively when a hand is dealt (start_planning),
+    so the LLM round-trip overlaps earlier players' turns. The player's turn then
+    adopts that plan instead of querying again.
     """
 
     def __init__(
@@ -52,6 +58,9 @@ class StrategyPlanner:
         self.REPLAN_STACK_THRESHOLD = replan_threshold
         self.current_plan = None
         self.last_metrics = None
+        # (round number, request) of a plan generating in the background
+        self._pending: Optional[Tuple[int, Union[Future, asyncio.Future]]] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def plan_strategy(
         self,
@@ -75,6 +84,16 @@ class StrategyPlanner:
             Exception: If plan generation fails, falls back to default plan
         """
         try:
+            pending = self._take_pending(game)
+            if isinstance(pending, Future):
+                # Started at the deal; wait for whatever is left of it, then
+                # fall through to replan if the hand has moved past it
+                self._adopt_plan(pending.result())
+                if not self.requires_replanning(game, player):
+                    return
+            elif pending is not None:
+                pending.cancel()  # An event loop task cannot be awaited here
+
             if self.current_plan and not self.requires_replanning(game, player):
                 StrategyLogger.log_plan_reuse(self.current_plan)
                 return  # Early return when reusing existing plan
@@ -85,13 +104,124 @@ class StrategyPlanner:
                 game_state=game.get_state(),
                 hand_eval=hand_eval,
             )
-            self.current_plan = self._create_plan_from_response(plan_data)
-            StrategyLogger.log_new_plan(self.current_plan)
+            self._adopt_plan(plan_data)
+
+        except Exception as e:
+            StrategyLogger.log_plan_error(e)
+            self.current_plan = self._create_default_plan()
+
+    async def plan_strategy_async(
+        self,
+        player: "Player",
+        game: "Game",
+        hand_eval: Optional[HandEvaluation] = None,
+    ) -> None:
+        """Awaitable form of plan_strategy(), querying the LLM asynchronously.
+
+        Args:
+            player (Player): The player for whom to generate the strategy
+            game (Game): Current game state including all relevant poker information
+            hand_eval (Optional[HandEvaluation], optional): Pre-computed hand evaluation.
+                Defaults to None.
+        """
+        try:
+            pending = self._take_pending(game)
+            if pending is not None:
+                if not asyncio.isfuture(pending):
+                    pending = asyncio.wrap_future(pending)
+                self._adopt_plan(await pending)
+                if not self.requires_replanning(game, player):
+                    return
+
+            if self.current_plan and not self.requires_replanning(game, player):
+                StrategyLogger.log_plan_reuse(self.current_plan)
+                return
+
+            plan_data = await LLMResponseGenerator.generate_plan_async(
+                player=player,
+                game_state=game.get_state(),
+                hand_eval=hand_eval,
+            )
+            self._adopt_plan(plan_data)
 
         except Exception as e:
             StrategyLogger.log_plan_error(e)
             self.current_plan = self._create_default_plan()
 
+    def start_planning(
+        self,
+        player: "Player",
+        game: "Game",
+        hand_eval: Optional[HandEvaluation] = None,
+    ) -> None:
+        """Start generating this hand's plan in the background, if one is needed.
+
+        Called when the cards are dealt. The prompt is built here from a snapshot
+        of the game state, so only the LLM request itself runs as a task on the
+        running event loop if there is one, otherwise on the planner's own thread.
+        The player's next plan_strategy() call adopts the result, then replans
+        anyway if requires_replanning() says the game has moved on since; a plan
+        started for an earlier hand is discarded.
+
+        Args:
+            player (Player): The player for whom to generate the strategy
+            game (Game): Game whose current state the plan is based on
+            hand_eval (Optional[HandEvaluation], optional): Pre-computed hand evaluation.
+                Defaults to None.
+        """
+        self._discard_pending()
+        if self.current_plan and not self.requires_replanning(game, player):
+            return
+
+        # Read the player and game here; the planner thread only sees the prompt
+        prompt = LLMResponseGenerator.plan_prompt(player, game.get_state(), hand_eval)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="planner"
+                )
+            pending = self._executor.submit(
+                LLMResponseGenerator.query_plan, player.llm_client, prompt
+            )
+        else:
+            pending = asyncio.ensure_future(
+                LLMResponseGenerator.query_plan_async(player.llm_client, prompt)
+            )
+        self._pending = (game.round_number, pending)
+        StrategyLogger.log_planning_check("Started planning for the hand in the background")
+
+    def close(self) -> None:
+        """Drop any background plan and stop the planner thread."""
+        self._discard_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _take_pending(self, game: "Game") -> Optional[Union[Future, asyncio.Future]]:
+        """Hand over the background plan request for this hand, dropping a stale one."""
+        if self._pending is None:
+            return None
+        round_number, pending = self._pending
+        self._pending = None
+        if round_number != game.round_number:
+            pending.cancel()
+            StrategyLogger.log_planning_check("Discarded a plan from an earlier hand")
+            return None
+        return pending
+
+    def _discard_pending(self) -> None:
+        """Cancel a background plan request that will not be used."""
+        if self._pending is not None:
+            self._pending[1].cancel()
+            self._pending = None
+
+    def _adopt_plan(self, plan_data: dict) -> None:
+        """Make the plan described by an LLM response the current plan."""
+        self.current_plan = self._create_plan_from_response(plan_data)
+        StrategyLogger.log_new_plan(self.current_plan)
+
     def _create_default_plan(self) -> Plan:
         """Create a default Plan object when errors occur or no plan is available.
 
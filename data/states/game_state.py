@@ -12,6 +12,16 @@ from data.types.pot_types import PotState
 
 if TYPE_CHECKING:
     from game.game import AgenticPoker
+    from game.player import Player
+
+# Positions by seat offset from the dealer button
+_POSITIONS = {
+    0: PlayerPosition.DEALER,
+    1: PlayerPosition.SMALL_BLIND,
+    2: PlayerPosition.BIG_BLIND,
+    3: PlayerPosition.UNDER_THE_GUN,
+    -1: PlayerPosition.CUTOFF,  # Second to last position
+}
 
 
 class GameState(BaseModel):
@@ -150,17 +160,22 @@ class GameState(BaseModel):
             return default
 
     @classmethod
-    def from_game(cls, game: "AgenticPoker") -> "GameState":
+    def from_game(
+        cls, game: "AgenticPoker", previous: Optional["GameState"] = None
+    ) -> "GameState":
         """Create a GameState instance from a Game object.
 
         Args:
             game (Game): The game instance to create state from
+            previous (Optional[GameState]): Earlier snapshot of the same game. Its
+                player states are reused for seats whose player is unchanged.
 
         Returns:
             GameState: A new GameState instance representing the current game state
         """
         players_count = len(game.table)
         player_states = []
+        previous_states = previous.players if previous is not None else []
 
         # Calculate blind positions
         sb_pos = (game.dealer_index + 1) % players_count
@@ -170,19 +185,17 @@ class GameState(BaseModel):
         for i, player in enumerate(game.table):
             # Calculate position relative to dealer
             position_index = (i - game.dealer_index) % players_count
-            position = {
-                0: PlayerPosition.DEALER,
-                1: PlayerPosition.SMALL_BLIND,
-                2: PlayerPosition.BIG_BLIND,
-                3: PlayerPosition.UNDER_THE_GUN,
-                -1: PlayerPosition.CUTOFF,  # Second to last position
-            }.get(position_index, PlayerPosition.MIDDLE)
+            position = _POSITIONS.get(position_index, PlayerPosition.MIDDLE)
 
-            # Get player's current state
-            player_state = player.get_state()
+            # Share the previous snapshot's state if this seat has not changed
+            if i < len(previous_states) and _same_player_state(
+                previous_states[i], player, position
+            ):
+                player_states.append(previous_states[i])
+                continue
 
-            # Update position-specific information
-            player_state.position = position
+            # Get player's current state at its position relative to the dealer
+            player_state = player.get_state(position=position)
 
             player_states.append(player_state)
 
@@ -251,3 +264,20 @@ class GameState(BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+
+
+def _same_player_state(
+    state: PlayerState, player: "Player", position: PlayerPosition
+) -> bool:
+    """Whether a public player state still describes the player at a position."""
+    return (
+        state.name == player.name
+        and state.position == position
+        and state.chips == player.chips
+        and state.bet == player.bet
+        and state.folded == player.folded
+        and state.is_all_in == player.is_all_in
+        and state.checked == player.checked
+        and state.called == player.called
+        and state.hand is None
+    )
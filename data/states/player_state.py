@@ -91,13 +91,17 @@ class PlayerState(BaseModel):
 
     @classmethod
     def from_player(
-        cls, player: "Player", private_attributes: bool = False
+        cls,
+        player: "Player",
+        private_attributes: bool = False,
+        position: Optional[PlayerPosition] = None,
     ) -> "PlayerState":
         """Create a PlayerState instance from a Player object.
 
         Args:
             player: The player instance to create state from
             private_attributes: Whether to include private attributes
+            position: Position to record instead of player.position
 
         Returns:
             PlayerState: A new PlayerState instance representing the player's current state
@@ -108,7 +112,7 @@ class PlayerState(BaseModel):
             bet=player.bet,
             folded=player.folded,
             hand=player.hand if private_attributes else None,
-            position=player.position,
+            position=position if position is not None else player.position,
             is_all_in=player.is_all_in,
             checked=player.checked,
             called=player.called,
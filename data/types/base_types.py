@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -5,3 +7,7 @@ class DeckState(BaseModel):
     """Represents the state of the deck."""
 
     cards_remaining: int
+    cards_dealt: int = 0  # Since the last reset; returned discards still count
+    cards_discarded: int = 0
+    needs_shuffle: bool = False
+    last_action: Optional[str] = None
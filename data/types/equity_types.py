@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass
+class EquityResult:
+    """Monte-Carlo estimate of each player's share of the pot at showdown."""
+
+    equities: List[float]  # Expected pot share per player (ties split), sums to 1
+    win_rates: List[float] = field(default_factory=list)  # Outright wins per player
+    tie_rates: List[float] = field(default_factory=list)  # Split pots per player
+    samples: int = 0  # Number of simulated runouts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert equity result to dictionary representation."""
+        return {
+            "equities": self.equities,
+            "win_rates": self.win_rates,
+            "tie_rates": self.tie_rates,
+            "samples": self.samples,
+        }
+
+
+@dataclass
+class DiscardOption:
+    """Exact outcome distribution of one discard choice in the draw."""
+
+    discard: List[int]  # Card positions (0-4) to discard
+    expected_percentile: float  # Mean percentile of the final hand among all hands
+    category_probabilities: Dict[str, float] = field(default_factory=dict)
+    outcomes: int = 0  # Number of equally likely draws enumerated
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert discard option to dictionary representation."""
+        return {
+            "discard": self.discard,
+            "expected_percentile": self.expected_percentile,
+            "category_probabilities": self.category_probabilities,
+            "outcomes": self.outcomes,
+        }
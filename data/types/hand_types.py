@@ -11,6 +11,25 @@ class HandState:
     rank_value: Optional[int] = None  # Numerical rank value
     tiebreakers: List[int] = field(default_factory=list)
     is_evaluated: bool = False
+    strength: int = 0  # Packed strength key; 0 if not evaluated
+
+    @property
+    def percentile(self) -> Optional[float]:
+        """Share of dealt hands this hand beats, looked up on access."""
+        return self._percentile(after_draw=False)
+
+    @property
+    def draw_percentile(self) -> Optional[float]:
+        """Share of hands after the draw this hand beats, looked up on access."""
+        return self._percentile(after_draw=True)
+
+    def _percentile(self, after_draw: bool) -> Optional[float]:
+        if not self.strength:
+            return None
+        # Imported here: the game package depends on these types
+        from game.percentile import hand_percentile
+
+        return hand_percentile(self.strength, after_draw)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert hand state to dictionary representation."""
@@ -21,5 +40,7 @@ class HandState:
                 "rank_value": self.rank_value,
                 "tiebreakers": self.tiebreakers,
                 "is_evaluated": self.is_evaluated,
+                "percentile": self.percentile,
+                "draw_percentile": self.draw_percentile,
             },
         }
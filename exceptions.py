@@ -22,6 +22,14 @@ class InvalidGameStateError(PokerGameError):
     pass
 
 
+class ChipAuditError(InvalidGameStateError):
+    """Raised when a chip audit finds chips created or lost during a hand."""
+
+    def __init__(self, message: str, replay=None):
+        super().__init__(f"{message} (replay: {replay})")
+        self.replay = replay
+
+
 class InvalidActionError(PokerGameError):
     """Raised when player action is invalid."""
 
@@ -0,0 +1,144 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from exceptions import ChipAuditError, InvalidGameStateError
+from loggers.game_logger import GameLogger
+
+if TYPE_CHECKING:
+    from .game import AgenticPoker
+
+
+@dataclass
+class HandReplay:
+    """
+    What is needed to replay an audited hand.
+
+    The hand's random streams are rng.child("hand", round_number) of the game's
+    root seed, so the seed and round number reproduce the shuffle and every bot
+    decision. The starting hands cover games whose decks come from a provider.
+
+    Attributes:
+        session_id (Optional[str]): Session the hand belongs to
+        seed (int): Root seed of the game's GameRNG
+        rng_path (Tuple[int, ...]): Path of the game's GameRNG below the root
+        round_number (int): Round in which the hand was played
+        dealer_index (int): Dealer position for the hand
+        starting_stacks (Dict[str, int]): Chips each player had before blinds and antes
+        hands (Dict[str, List[str]]): Cards each player was dealt
+    """
+
+    session_id: Optional[str]
+    seed: int
+    rng_path: Tuple[int, ...]
+    round_number: int
+    dealer_index: int
+    starting_stacks: Dict[str, int] = field(default_factory=dict)
+    hands: Dict[str, List[str]] = field(default_factory=dict)
+
+
+class ChipAuditor:
+    """
+    Checks chip conservation at round boundaries on a sample of hands.
+
+    Rather than recomputing chip totals on every action, the invariants are
+    checked here once per audited hand:
+    - After the deal, the chips in stacks and in the pot are recorded
+    - Before the showdown, the pot must hold at least the current bets and
+      stacks plus pots must still match the recorded total
+    - After the round, no stack may be negative and the stacks must add up to
+      the recorded total
+
+    A violation is logged and raised as ChipAuditError, carrying the hand's
+    HandReplay.
+
+    Attributes:
+        every (int): Audit every Nth hand; 1 audits every hand, 0 none
+        replay (Optional[HandReplay]): Record of the hand being audited, if any
+
+    Usage:
+        ChipAuditor()  # Every hand, e.g. in tests
+        ChipAuditor(every=100)  # Every 100th hand, e.g. in staging
+        ChipAuditor(every=0)  # Never, e.g. in production simulations
+    """
+
+    def __init__(self, every: int = 1) -> None:
+        """
+        Create an auditor.
+
+        Args:
+            every: Audit every Nth hand, by round number; 0 disables auditing
+
+        Raises:
+            ValueError: If every is negative
+        """
+        if every < 0:
+            raise ValueError("Audit interval cannot be negative")
+        self.every = every
+        self.replay: Optional[HandReplay] = None
+        self._total = 0
+
+    def should_audit(self, round_number: int) -> bool:
+        """Whether the hand played in round_number is sampled."""
+        return self.every > 0 and round_number % self.every == 0
+
+    def begin_hand(self, game: "AgenticPoker") -> None:
+        """
+        Record the chip total and replay record once the hand is dealt.
+
+        Args:
+            game: Game whose hand has just been dealt and its blinds collected
+        """
+        if not self.should_audit(game.round_number):
+            self.replay = None
+            return
+
+        players = game.table.players
+        self._total = sum(p.chips for p in players) + game.pot.pot
+        self.replay = HandReplay(
+            session_id=game.session_id,
+            seed=game.rng.seed,
+            rng_path=game.rng.path,
+            round_number=game.round_number,
+            dealer_index=game.dealer_index,
+            starting_stacks={
+                p.name: chips for p, chips in game.round_starting_stacks.items()
+            },
+            hands={p.name: [str(card) for card in p.hand.cards] for p in players},
+        )
+
+    def before_showdown(self, game: "AgenticPoker") -> None:
+        """
+        Check the pot against the bets and the recorded chip total.
+
+        Raises:
+            ChipAuditError: If the pot state is inconsistent
+        """
+        if self.replay is None:
+            return
+        try:
+            game.pot.validate_pot_state(game.table.players, self._total)
+        except InvalidGameStateError as error:
+            self._report(str(error))
+
+    def end_hand(self, game: "AgenticPoker") -> None:
+        """
+        Check that the finished hand returned every chip to a stack.
+
+        Raises:
+            ChipAuditError: If chips were created or lost
+        """
+        if self.replay is None:
+            return
+        players = game.table.players
+        negative = [p.name for p in players if p.chips < 0]
+        if negative:
+            self._report(f"Negative chip stacks: {negative}")
+        total = sum(p.chips for p in players)
+        if total != self._total:
+            self._report(f"Total chips changed: initial={self._total}, final={total}")
+        self.replay = None
+
+    def _report(self, message: str) -> None:
+        """Log a violation with its replay record and raise it."""
+        GameLogger.log_audit_violation(message, self.replay)
+        raise ChipAuditError(message, self.replay)
@@ -10,6 +10,8 @@ This module handles all betting-related logic for a poker game, including:
 The main components are:
 - handle_betting_round: Entry point for managing a complete betting round
 - betting_round: Core betting mechanics for a single round
+- handle_betting_round_async / betting_round_async: The same round with
+  awaitable player decisions, for the asyncio game loop
 - collect_blinds_and_antes: Handles forced bets at the start of each hand
 
 The module ensures proper poker betting rules are followed:
@@ -21,14 +23,19 @@ The module ensures proper poker betting rules are followed:
 - Side pots are created when players go all-in
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Generator, Optional
 
 from data.enums import ActionType
 from data.types.action_decision import ActionDecision
 from loggers.betting_logger import BettingLogger
+from loggers.config import loggers_silenced
 
 if TYPE_CHECKING:
     from game.game import Game
+    from game.player import Player
+
+# Yields each player due to act and receives the decision they made
+BettingTurns = Generator["Player", ActionDecision, None]
 
 
 def handle_betting_round(game: "Game") -> bool:
@@ -54,6 +61,35 @@ def handle_betting_round(game: "Game") -> bool:
         - May modify player chip counts and betting amounts
         - Updates betting state in game.table
     """
+    _validate_betting_round(game)
+
+    # Run betting round with validated GameState
+    betting_round(game)
+
+    return _should_continue(game)
+
+
+async def handle_betting_round_async(game: "Game") -> bool:
+    """Manages a complete betting round, awaiting each player's decision.
+
+    Same rules and result as handle_betting_round(), for the asyncio game loop.
+
+    Args:
+        game: Game object containing all game state and player information
+
+    Returns:
+        bool: Whether the game should continue (True if multiple players remain)
+
+    Raises:
+        ValueError: If there are no players or if the pot amount is negative
+    """
+    _validate_betting_round(game)
+    await betting_round_async(game)
+    return _should_continue(game)
+
+
+def _validate_betting_round(game: "Game") -> None:
+    """Check that a betting round can run, initializing an unset pot to 0."""
     if not game.table:
         raise ValueError("Cannot run betting round with no players")
 
@@ -63,14 +99,11 @@ def handle_betting_round(game: "Game") -> bool:
     elif game.pot.pot < 0:
         raise ValueError("Pot amount cannot be negative")
 
-    # Run betting round with validated GameState
-    betting_round(game)
 
-    # Determine if game should continue
+def _should_continue(game: "Game") -> bool:
+    """Whether more than one player is still in the hand."""
     active_count = sum(1 for p in game.table if not p.folded)
-    should_continue = active_count > 1
-
-    return should_continue
+    return active_count > 1
 
 
 def betting_round(game: "Game") -> None:
@@ -95,8 +128,60 @@ def betting_round(game: "Game") -> None:
     game.pot.end_betting_round(game.table.players)
 
 
+async def betting_round_async(game: "Game") -> None:
+    """Manages a complete round of betting, awaiting each player's decision.
+
+    Args:
+        game: The Game instance containing all game state, including players,
+             pot manager, and round state.
+    """
+    game.table.reset_action_tracking()
+
+    await _process_betting_cycle_async(game)
+
+    # After betting cycle completes, move all bets to pot
+    game.pot.end_betting_round(game.table.players)
+
+
 def _process_betting_cycle(game: "Game") -> None:
-    """Process a single cycle of betting for all active players.
+    """Process a single cycle of betting, asking each player for a decision.
+
+    Args:
+        game: The Game instance containing the current game state
+    """
+    turns = _betting_turns(game)
+    agent = next(turns, None)
+    while agent is not None:
+        agent = _next_turn(turns, agent.decide_action(game))
+
+
+async def _process_betting_cycle_async(game: "Game") -> None:
+    """Process a single cycle of betting, awaiting each player's decision.
+
+    While a player's decision is awaited, other games on the event loop run.
+
+    Args:
+        game: The Game instance containing the current game state
+    """
+    turns = _betting_turns(game)
+    agent = next(turns, None)
+    while agent is not None:
+        agent = _next_turn(turns, await agent.decide_action_async(game))
+
+
+def _next_turn(turns: BettingTurns, decision: ActionDecision) -> Optional["Player"]:
+    """Apply a decision and return the next player to act, or None when done."""
+    try:
+        return turns.send(decision)
+    except StopIteration:
+        return None
+
+
+def _betting_turns(game: "Game") -> BettingTurns:
+    """Run the betting rules for one cycle, yielding whenever a player must decide.
+
+    The generator holds every rule of the cycle, so the sync and async drivers
+    differ only in how they obtain each decision.
 
     This function manages the core betting loop where each player takes their turn
     to act. It continues until the betting round is complete (all players have acted
@@ -114,6 +199,9 @@ def _process_betting_cycle(game: "Game") -> None:
              - table: Table object with player and betting state
              - pot: Manages main pot and side pots
 
+    Yields:
+        Player: The player to act; the driver sends back their ActionDecision
+
     Side Effects:
         - Updates player betting amounts
         - Updates pot size
@@ -163,18 +251,21 @@ def _process_betting_cycle(game: "Game") -> None:
             game.current_bet = all_in_bet
 
         # Log player turn
-        BettingLogger.log_player_turn(
-            player_name=agent.name,
-            hand=agent.hand.show() if hasattr(agent, "hand") else "Unknown",
-            chips=agent.chips,
-            current_bet=agent.bet,
-            pot=game.pot.pot,
-            active_players=[p.name for p in game.table.players if not p.folded],
-            last_raiser=game.table.last_raiser.name if game.table.last_raiser else None,
-        )
+        if not loggers_silenced():
+            BettingLogger.log_player_turn(
+                player_name=agent.name,
+                hand=agent.hand.show() if hasattr(agent, "hand") else "Unknown",
+                chips=agent.chips,
+                current_bet=agent.bet,
+                pot=game.pot.pot,
+                active_players=[p.name for p in game.table.players if not p.folded],
+                last_raiser=(
+                    game.table.last_raiser.name if game.table.last_raiser else None
+                ),
+            )
 
         # Get player's action
-        action_decision = agent.decide_action(game)
+        action_decision = yield agent
 
         # Handle all-in situations
         if action_decision.action_type == ActionType.RAISE:
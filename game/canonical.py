@@ -0,0 +1,177 @@
+from functools import lru_cache
+from itertools import chain, combinations
+from math import comb
+from typing import NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from .card import Card
+
+# Number of distinct five-card hands and of hands up to a relabelling of suits
+NUM_HANDS = comb(52, 5)
+NUM_CLASSES = 134459
+
+# Binomial coefficients C(n, k) for the combinatorial (colex) index
+_BINOMIAL = np.array([[comb(n, k) for k in range(6)] for n in range(52)], dtype=np.int64)
+
+CardLike = Union[Card, int]
+
+
+class CanonicalHand(NamedTuple):
+    """A hand (and optional dead cards) with suits relabelled to a canonical order."""
+
+    hand: Tuple[int, ...]  # Canonical card ids, ascending
+    dead: Tuple[int, ...]  # Canonical dead card ids, ascending
+    positions: Tuple[int, ...]  # Original position of each canonical hand card
+
+    @property
+    def key(self) -> int:
+        """Integer cache key: hand bitmask in the low 52 bits, dead cards above."""
+        key = 0
+        for card_id in self.hand:
+            key |= 1 << card_id
+        for card_id in self.dead:
+            key |= 1 << (card_id + 52)
+        return key
+
+
+def canonicalize(
+    cards: Sequence[CardLike], dead_cards: Sequence[CardLike] = ()
+) -> CanonicalHand:
+    """
+    Relabel suits so that every suit-isomorphic hand maps to the same form.
+
+    Suits are reordered by the ranks they hold in the hand (then among the dead
+    cards), strongest pattern first. Suits with identical patterns are
+    interchangeable, so any order between them gives the same result.
+
+    Args:
+        cards: Cards (or card ids) in the hand
+        dead_cards: Cards (or card ids) known to be out of the deck
+
+    Returns:
+        CanonicalHand: Canonical hand and dead card ids, plus the original
+            position of each canonical hand card
+
+    Example:
+        >>> a = canonicalize([Card("A", "♠"), Card("K", "♠"), Card("2", "♦")])
+        >>> b = canonicalize([Card("A", "♥"), Card("K", "♥"), Card("2", "♣")])
+        >>> a.hand == b.hand
+        True
+    """
+    hand_ids = _card_ids(cards)
+    dead_ids = _card_ids(dead_cards)
+
+    hand_masks = [0, 0, 0, 0]
+    dead_masks = [0, 0, 0, 0]
+    for card_id in hand_ids:
+        hand_masks[card_id // 13] |= 1 << (card_id % 13)
+    for card_id in dead_ids:
+        dead_masks[card_id // 13] |= 1 << (card_id % 13)
+
+    order = sorted(range(4), key=lambda s: (hand_masks[s], dead_masks[s]), reverse=True)
+    relabel = [0] * 4
+    for new_suit, old_suit in enumerate(order):
+        relabel[old_suit] = new_suit
+
+    mapped = [relabel[i // 13] * 13 + i % 13 for i in hand_ids]
+    ranked = sorted(range(len(mapped)), key=mapped.__getitem__)
+    return CanonicalHand(
+        hand=tuple(mapped[i] for i in ranked),
+        dead=tuple(sorted(relabel[i // 13] * 13 + i % 13 for i in set(dead_ids))),
+        positions=tuple(ranked),
+    )
+
+
+def colex_index(cards: Sequence[CardLike]) -> int:
+    """
+    Return the combinatorial index of a set of distinct cards.
+
+    The k-card sets are numbered 0 .. C(52, k) - 1 in colexicographic order, so
+    five-card hands map onto 0 .. 2,598,959 without gaps.
+    """
+    return sum(comb(card_id, i + 1) for i, card_id in enumerate(sorted(_card_ids(cards))))
+
+
+def hand_class(cards: Sequence[CardLike]) -> int:
+    """
+    Return the suit-isomorphism class of a five-card hand.
+
+    Classes are numbered 0 .. NUM_CLASSES - 1 and are stable across runs, so they
+    can key dense arrays as well as dictionaries.
+
+    Raises:
+        ValueError: If the hand does not hold 5 distinct cards
+    """
+    card_ids = _card_ids(cards)
+    if len(card_ids) != 5 or len(set(card_ids)) != 5:
+        raise ValueError("Hand must contain exactly 5 distinct cards")
+    return int(_class_tables()[0][colex_index(card_ids)])
+
+
+def hand_classes(cards: np.ndarray) -> np.ndarray:
+    """
+    Vectorized hand_class over an integer array of card ids with shape (N, 5).
+
+    Returns:
+        np.ndarray: int32 class of each hand
+    """
+    card_ids = np.sort(np.asarray(cards, dtype=np.int64), axis=1)
+    if card_ids.ndim != 2 or card_ids.shape[1] != 5:
+        raise ValueError("Expected an array of shape (N, 5)")
+    if card_ids.size and (card_ids.min() < 0 or card_ids.max() > 51):
+        raise ValueError("Card ids must be between 0 and 51")
+    if np.any(card_ids[:, 1:] == card_ids[:, :-1]):
+        raise ValueError("Duplicate card found in hand")
+    return _class_tables()[0][_colex_indices(card_ids)]
+
+
+def class_representative(index: int) -> Tuple[int, ...]:
+    """Return the canonical card ids (ascending) of a hand class."""
+    if not 0 <= index < NUM_CLASSES:
+        raise ValueError(f"Hand class must be between 0 and {NUM_CLASSES - 1}")
+    packed = int(_class_tables()[1][index])
+    return tuple(
+        suit * 13 + value
+        for suit in range(4)
+        for value in range(13)
+        if packed >> (13 * (3 - suit) + value) & 1
+    )
+
+
+def _card_ids(cards: Sequence[CardLike]) -> Tuple[int, ...]:
+    """Normalize Cards or integer card ids to a tuple of ids."""
+    return tuple(card if isinstance(card, (int, np.integer)) else card.id for card in cards)
+
+
+def _colex_indices(sorted_ids: np.ndarray) -> np.ndarray:
+    """Colex index of each row of ascending card ids."""
+    return sum(_BINOMIAL[sorted_ids[:, i], i + 1] for i in range(sorted_ids.shape[1]))
+
+
+@lru_cache(maxsize=None)
+def _class_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the dense class index of every five-card hand.
+
+    Each hand's canonical form is the four per-suit rank masks sorted in
+    descending order, packed into one integer. Classes are numbered in order
+    of that packed form.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (class of each hand by colex index,
+            packed canonical form of each class)
+    """
+    hands = np.fromiter(
+        chain.from_iterable(combinations(range(52), 5)), dtype=np.int64, count=5 * NUM_HANDS
+    ).reshape(NUM_HANDS, 5)
+
+    card_bits = np.left_shift(1, hands).sum(axis=1)
+    masks = np.stack([(card_bits >> (13 * s)) & 0x1FFF for s in range(4)], axis=1)
+    masks = -np.sort(-masks, axis=1)
+    packed = (masks[:, 0] << 39) | (masks[:, 1] << 26) | (masks[:, 2] << 13) | masks[:, 3]
+
+    forms, classes = np.unique(packed, return_inverse=True)
+    table = np.empty(NUM_HANDS, dtype=np.int32)
+    table[_colex_indices(hands)] = classes
+    return table, forms
@@ -1,31 +1,126 @@
+from typing import Dict, Tuple, Union
+
+# Canonical rank names in ascending order (index = value - 2)
+RANKS = ("2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A")
+
+# Canonical suit glyphs (index = suit number)
+SUITS = ("♣", "♦", "♥", "♠")
+
+# Convert face cards to numeric values (J=11, Q=12, K=13, A=14)
+RANK_VALUES = {rank: value for value, rank in enumerate(RANKS, start=2)}
+
+# One prime per rank value (index = value - 2). The product of five primes is
+# unique for every multiset of ranks, so it identifies a hand regardless of order.
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Accepted spellings of each rank and suit, mapped to their index
+_RANK_ALIASES: Dict[Union[str, int], int] = {}
+for _index, _rank in enumerate(RANKS):
+    _RANK_ALIASES[_rank] = _index
+    _RANK_ALIASES[_index + 2] = _index
+    _RANK_ALIASES[str(_index + 2)] = _index
+
+_SUIT_ALIASES: Dict[str, int] = {}
+for _index, _names in enumerate(
+    (
+        ("♣", "Clubs", "C", "&clubs;"),
+        ("♦", "Diamonds", "D", "&diams;"),
+        ("♥", "Hearts", "H", "&hearts;"),
+        ("♠", "Spades", "S", "&spades;"),
+    )
+):
+    for _name in _names:
+        _SUIT_ALIASES[_name] = _index
+        _SUIT_ALIASES[_name.lower()] = _index
+
+
 class Card:
     """
     Represents a single playing card with rank and suit.
-    
-    A card is immutable after creation and provides a string
-    representation for display and logging purposes.
-    
+
+    There are exactly 52 Card instances, built once at import time. Constructing
+    a card returns the shared instance for that rank and suit, so cards can be
+    compared by identity and carry no per-deal allocation. Each card holds
+    precomputed integer encodings used by the hand evaluator.
+
     Attributes:
         rank (str): The card's rank ('2'-'10', 'J', 'Q', 'K', 'A')
-        suit (str): The card's suit ('Clubs', 'Diamonds', 'Hearts', 'Spades')
+        suit (str): The card's suit glyph ('♣', '♦', '♥', '♠')
+        id (int): Unique card id 0-51 (suit * 13 + value - 2)
+        value (int): Numeric rank value (2-14, ace high)
+        rank_bit (int): Single bit 1 << (value - 2) for rank masks
+        suit_bit (int): Single bit 1 << suit for flush detection
+        prime (int): Prime assigned to the rank for prime-product lookups
     """
-    
-    def __init__(self, rank: str, suit: str):
+
+    __slots__ = ("rank", "suit", "id", "value", "rank_bit", "suit_bit", "prime")
+
+    def __new__(cls, rank: Union[str, int], suit: str) -> "Card":
         """
-        Initialize a new card with specified rank and suit.
-        
+        Return the interned card with the specified rank and suit.
+
         Args:
-            rank (str): The card's rank value
-            suit (str): The card's suit name
+            rank (str | int): The card's rank, e.g. '10', 10, 'J' or 11
+            suit (str): The card's suit glyph, name ('Spades'), letter ('S') or
+                HTML entity ('&spades;')
+
+        Raises:
+            KeyError: If the rank or suit is unknown
         """
-        self.rank = rank
-        self.suit = suit
-    
+        rank_index = _RANK_ALIASES.get(rank)
+        if rank_index is None:
+            rank_index = _RANK_ALIASES[str(rank).upper()]
+        return CARDS[_SUIT_ALIASES[suit] * 13 + rank_index]
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """Return the interned card for an id in the range 0-51."""
+        return CARDS[card_id]
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError("Card objects are immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Card objects are immutable")
+
+    def __reduce__(self):
+        # Unpickling and copying resolve back to the interned instance
+        return (Card.from_id, (self.id,))
+
+    def __copy__(self) -> "Card":
+        return self
+
+    def __deepcopy__(self, memo) -> "Card":
+        return self
+
     def __repr__(self) -> str:
         """
         Returns string representation of the card.
-        
+
         Returns:
             str: Card in format "rank of suit"
         """
         return f"{self.rank} of {self.suit}"
+
+
+def _build_cards() -> Tuple[Card, ...]:
+    """Create the 52 interned cards in id order."""
+    cards = []
+    for suit_index, suit in enumerate(SUITS):
+        for rank_index, rank in enumerate(RANKS):
+            card = object.__new__(Card)
+            for name, value in (
+                ("rank", rank),
+                ("suit", suit),
+                ("id", suit_index * 13 + rank_index),
+                ("value", rank_index + 2),
+                ("rank_bit", 1 << rank_index),
+                ("suit_bit", 1 << suit_index),
+                ("prime", RANK_PRIMES[rank_index]),
+            ):
+                object.__setattr__(card, name, value)
+            cards.append(card)
+    return tuple(cards)
+
+
+CARDS: Tuple[Card, ...] = _build_cards()
@@ -20,6 +20,13 @@ class GameConfig:
         max_raise_multiplier (int): Maximum raise as multiplier of current bet (default: 3)
         max_raises_per_round (int): Maximum number of raises allowed per betting round (default: 4)
         min_bet (Optional[int]): Minimum bet amount, defaults to big blind if not specified
+        seed (Optional[int]): Root seed for shuffles and bot decisions, None for fresh entropy (default: None)
+        headless (bool): Run without logging, database snapshots or strict chip validation,
+            for high-volume bot-only simulation (default: False)
+        audit_every (Optional[int]): Check chip conservation every Nth hand, 0 for never;
+            None audits every hand, or none when headless (default: None)
+        save_snapshots (bool): Write game and round snapshots to the database; headless
+            games never do (default: True)
 
     Raises:
         ValueError: If any of the numerical parameters are invalid (negative or zero where not allowed)
@@ -34,6 +41,10 @@ class GameConfig:
     max_raise_multiplier: int = 3
     max_raises_per_round: int = 4
     min_bet: Optional[int] = None
+    seed: Optional[int] = None
+    headless: bool = False
+    audit_every: Optional[int] = None
+    save_snapshots: bool = True
 
     def __post_init__(self):
         """Validate configuration parameters."""
@@ -43,6 +54,8 @@ class GameConfig:
             raise ValueError("Blinds must be positive")
         if self.ante < 0:
             raise ValueError("Ante cannot be negative")
+        if self.audit_every is not None and self.audit_every < 0:
+            raise ValueError("Audit interval cannot be negative")
         if self.max_raise_multiplier <= 0:
             raise ValueError("Max raise multiplier must be positive")
         if self.max_raises_per_round <= 0:
@@ -1,36 +1,151 @@
-import random
-from typing import List
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from data.types.base_types import DeckState
 from loggers.deck_logger import DeckLogger
 
-from .card import Card
+from .card import CARDS, RANKS, SUITS, Card
+
+# Slot numbers 0-51, used to refresh the id -> slot index after a permutation
+_SLOTS = np.arange(52, dtype=np.int8)
 
 
 class Deck:
-    """A standard 52-card deck with tracking of dealt and discarded cards."""
+    """
+    A standard 52-card deck with tracking of dealt and discarded cards.
+
+    The deck is a fixed array of 52 card ids split into three ranges:
+
+        [0, discard_end)        discarded cards
+        [discard_end, cursor)   dealt cards still held by players
+        [cursor, 52)            cards remaining in the deck, top first
+
+    Dealing advances the cursor, and discarding or reshuffling permutes ids
+    between ranges in place, so the deck never allocates new storage. Dealt
+    cards include discarded ones, as both have left the deck. The number of
+    cards dealt since the last reset is counted separately, since returning
+    discards to the deck moves the cursor back.
+
+    The card-list properties build a new list on every access; use
+    remaining() and get_state() for counts.
+    """
+
+    ranks = list(RANKS)
+    suits = list(SUITS)  # Using Unicode symbols for better readability
+
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        """
+        Initialize a new deck with all 52 interned cards, ordered by id.
+
+        Args:
+            rng: Generator used for shuffling; defaults to a freshly seeded one
+        """
+        self._ids = _SLOTS.copy()  # Card id in each slot
+        self._slot_of = _SLOTS.copy()  # Slot holding each card id
+        self._slots_stale = False  # Set when a shuffle invalidates _slot_of
+        self._discard_end = 0
+        self._cursor = 0
+        self._dealt = 0  # Cards dealt since the last reset, reshuffles included
+        self._rng = rng if rng is not None else np.random.default_rng()
+        # ((cursor, discard end, dealt, last action), state) from the last get_state
+        self._state: Optional[Tuple[tuple, DeckState]] = None
+
+    @property
+    def cards(self) -> List[Card]:
+        """Cards remaining in the deck, top first, as a new list."""
+        return [CARDS[i] for i in self._ids[self._cursor :].tolist()]
+
+    @cards.setter
+    def cards(self, cards: List[Card]) -> None:
+        """
+        Replace the cards remaining in the deck, top first.
 
-    ranks = [2, 3, 4, 5, 6, 7, 8, 9, 10, "J", "Q", "K", "A"]
-    suits = ["♣", "♦", "♥", "♠"]  # Using Unicode symbols for better readability
+        Cards left out are taken out of the deck as held cards; discards stay
+        on the pile unless they are put back. Mainly for staging a test deck.
+
+        Raises:
+            ValueError: If a card appears more than once
+        """
+        ids = np.fromiter((card.id for card in cards), dtype=np.int8, count=len(cards))
+        if np.bincount(ids, minlength=52).max(initial=0) > 1:
+            raise ValueError("Deck cards must be distinct")
+        out = np.ones(52, dtype=bool)
+        out[ids] = False
+        discards = self._ids[: self._discard_end]
+        discards = discards[out[discards]]
+        rest = self._ids[self._discard_end :]
+        held = rest[out[rest]]
+        self._ids[:] = np.concatenate((discards, held, ids))
+        self._slots_stale = True
+        self._discard_end = len(discards)
+        self._cursor = 52 - len(ids)
+
+    @property
+    def dealt_cards(self) -> List[Card]:
+        """Cards out of the deck, including those since discarded, as a new list."""
+        return [CARDS[i] for i in self._ids[: self._cursor].tolist()]
+
+    @property
+    def discarded_cards(self) -> List[Card]:
+        """Cards on the discard pile, as a new list."""
+        return [CARDS[i] for i in self._ids[: self._discard_end].tolist()]
+
+    def reset(self, rng: Optional[np.random.Generator] = None) -> None:
+        """
+        Return every card to the deck in id order.
+
+        Args:
+            rng: Optional new generator for shuffling. With a fresh generator per
+                hand, the next deal depends only on that generator.
+        """
+        self._ids[:] = _SLOTS
+        self._slot_of[:] = _SLOTS
+        self._slots_stale = False
+        self._discard_end = 0
+        self._cursor = 0
+        self._dealt = 0
+        if rng is not None:
+            self._rng = rng
+
+    def load(self, order: np.ndarray) -> None:
+        """
+        Start a new hand from a pre-shuffled deck order.
+
+        All cards return to the deck in the given order, which replaces both
+        reset() and shuffle() for decks staged by a DeckFactory.
+
+        Args:
+            order: Permutation of the card ids 0-51, top card first
 
-    def __init__(self):
-        """Initialize a new deck with all 52 cards."""
-        self.cards = [Card(rank, suit) for suit in self.suits for rank in self.ranks]
-        self.dealt_cards: List[Card] = []  # Track dealt cards
-        self.discarded_cards: List[Card] = []  # Track discarded cards
+        Raises:
+            ValueError: If order is not a permutation of the 52 card ids
+        """
+        order = np.asarray(order)
+        if (
+            order.shape != (52,)
+            or order.min() < 0
+            or order.max() > 51
+            or np.bincount(order, minlength=52).max() != 1
+        ):
+            raise ValueError("Deck order must be a permutation of the card ids 0-51")
+        self._ids[:] = order
+        self._slots_stale = True
+        self._discard_end = 0
+        self._cursor = 0
+        self._dealt = 0
+        self.last_action = "shuffle"
 
     def shuffle(self) -> None:
         """
         Shuffle the current deck.
         """
-        # Reset tracking lists when shuffling a fresh deck
-        if len(self.cards) == 52:
-            self.dealt_cards = []
-            self.discarded_cards = []
-        else:
-            DeckLogger.log_shuffle(len(self.cards))
+        # Dealt and discarded ranges are already empty for a full deck
+        if self._cursor:
+            DeckLogger.log_shuffle(self.remaining())
 
-        random.shuffle(self.cards)
+        self._rng.shuffle(self._ids[self._cursor :])
+        self._slots_stale = True
         self.last_action = "shuffle"
 
     def deal(self, num: int = 1) -> List[Card]:
@@ -46,63 +161,162 @@ class Deck:
         Raises:
             ValueError: If requesting more cards than available
         """
-        if num > len(self.cards):
-            DeckLogger.log_deal_error(num, len(self.cards))
+        if num > self.remaining():
+            DeckLogger.log_deal_error(num, self.remaining())
             raise ValueError("Insufficient cards remaining")
 
-        dealt = self.cards[:num]
-        self.cards = self.cards[num:]
-        self.dealt_cards.extend(dealt)
+        start = self._cursor
+        self._cursor += num
+        self._dealt += num
         self.last_action = f"deal_{num}"
-        return dealt
+        return [CARDS[i] for i in self._ids[start : self._cursor].tolist()]
 
     def add_discarded(self, cards: List[Card]) -> None:
-        """Add discarded cards to the discard pile."""
-        self.discarded_cards.extend(cards)
+        """
+        Add discarded cards to the discard pile.
+
+        Cards already on the pile are ignored. A card that is still in the deck
+        is taken out of it, since it can only be discarded after leaving it.
+        """
+        if self._slots_stale:
+            self._slot_of[self._ids] = _SLOTS
+            self._slots_stale = False
+
+        for card in cards:
+            slot = int(self._slot_of[card.id])
+            if slot < self._discard_end:
+                continue
+            if slot >= self._cursor:
+                self._swap(slot, self._cursor)
+                slot = self._cursor
+                self._cursor += 1
+            self._swap(slot, self._discard_end)
+            self._discard_end += 1
 
     def reshuffle_discards(self) -> None:
         """Shuffle discarded cards back into the deck."""
-        self.cards.extend(self.discarded_cards)
-        self.discarded_cards = []
+        discarded = self._discard_end
+        if discarded:
+            # Rotate the discards to the end of the dealt range, next to the deck
+            held = self._ids[: self._cursor]
+            held[:] = np.roll(held, -discarded)
+            self._slots_stale = True
+            self._cursor -= discarded
+            self._discard_end = 0
         self.shuffle()
 
     def remaining(self) -> int:
         """Return number of cards remaining in deck."""
-        return len(self.cards)
+        return 52 - self._cursor
 
     def remaining_cards(self) -> int:
         """Get count of remaining cards in deck."""
-        return len(self.cards)
+        return 52 - self._cursor
 
     def needs_reshuffle(self, needed_cards: int) -> bool:
         """Check if deck needs reshuffling based on needed cards."""
-        return len(self.cards) < needed_cards
+        return self.remaining() < needed_cards
 
     def reshuffle_all(self) -> None:
         """Reshuffle ALL cards (including dealt and discarded) back into deck."""
-        self.cards.extend(self.dealt_cards)
-        self.cards.extend(self.discarded_cards)
-        self.dealt_cards = []
-        self.discarded_cards = []
+        self._discard_end = 0
+        self._cursor = 0
+        self._dealt = 0
         self.shuffle()
         DeckLogger.log_reshuffle()
 
+    def _swap(self, a: int, b: int) -> None:
+        """Exchange the cards in two slots."""
+        ids = self._ids
+        ids[a], ids[b] = ids[b], ids[a]
+        self._slot_of[ids[a]] = a
+        self._slot_of[ids[b]] = b
+
     def __str__(self) -> str:
         """Return string representation of current deck state."""
         return (
-            f"Deck: {len(self.cards)} cards remaining, "
-            f"{len(self.dealt_cards)} dealt, "
-            f"{len(self.discarded_cards)} discarded"
+            f"Deck: {self.remaining()} cards remaining, "
+            f"{self._dealt} dealt, "
+            f"{self._discard_end} discarded"
         )
 
     def get_state(self) -> DeckState:
-        """Get the current state of the deck."""
-        return DeckState(
-            cards_remaining=len(self.cards),
-            cards_dealt=len(self.dealt_cards),
-            cards_discarded=len(self.discarded_cards),
+        """Get the current state of the deck.
+
+        The state is cached and the same instance returned until a deal,
+        discard or reset changes the deck, so treat it as read-only.
+        """
+        last_action = getattr(self, "last_action", None)
+        key = (self._cursor, self._discard_end, self._dealt, last_action)
+        if self._state is not None and self._state[0] == key:
+            return self._state[1]
+
+        state = DeckState(
+            cards_remaining=self.remaining(),
+            cards_dealt=self._dealt,
+            cards_discarded=self._discard_end,
             needs_shuffle=self.needs_reshuffle(
                 5
             ),  # Check if we need shuffle for a 5-card deal
-            last_action=getattr(self, "last_action", None),
+            last_action=last_action,
         )
+        self._state = (key, state)
+        return state
+
+
+class DeckFactory:
+    """
+    Produces shuffled deck orders in bulk for high-volume simulation.
+
+    Orders are generated batch_size at a time as a (batch_size, 52) matrix of
+    card-id permutations, which amortizes generator overhead across hands. A
+    game given a factory as its deck provider loads one row per hand instead
+    of shuffling.
+
+    Attributes:
+        batch_size (int): Number of orders generated per refill
+    """
+
+    def __init__(
+        self, rng: Optional[np.random.Generator] = None, batch_size: int = 1024
+    ) -> None:
+        """
+        Args:
+            rng: Generator for the shuffles; defaults to a freshly seeded one
+            batch_size: Orders generated per refill
+
+        Raises:
+            ValueError: If batch_size is not positive
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+        self.batch_size = batch_size
+        self._rng = rng if rng is not None else np.random.default_rng()
+        self._orders = np.empty((0, 52), dtype=np.int8)
+        self._next = 0
+
+    def shuffles(self, count: int) -> np.ndarray:
+        """
+        Generate independent shuffled deck orders.
+
+        Args:
+            count: Number of decks
+
+        Returns:
+            np.ndarray: int8 array of shape (count, 52); each row is a
+                permutation of the card ids, top card first
+        """
+        return self._rng.random((count, 52)).argsort(axis=1).astype(np.int8)
+
+    def next_order(self) -> np.ndarray:
+        """Return the next staged deck order, generating a new batch when empty."""
+        if self._next == len(self._orders):
+            self._orders = self.shuffles(self.batch_size)
+            self._next = 0
+        order = self._orders[self._next]
+        self._next += 1
+        return order
+
+    def deal_into(self, deck: Deck) -> None:
+        """Load the next staged order into a deck."""
+        deck.load(self.next_order())
@@ -0,0 +1,222 @@
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from data.types.discard_decision import DiscardDecision
+from data.types.equity_types import DiscardOption
+from data.types.hand_rank import HandRank
+
+from .canonical import canonicalize
+from .card import CARDS, Card
+from .evaluator import _FLUSH_LOOKUP, _PRODUCT_LOOKUP
+from .percentile import percentiles_of
+
+# Most cards a player may exchange (see DiscardDecision)
+MAX_DISCARD = 3
+
+# Number of suit-canonical solutions kept in memory
+CACHE_SIZE = 65536
+
+
+def solve_discard(
+    cards: Sequence[Card],
+    dead_cards: Sequence[Card] = (),
+    max_discard: int = MAX_DISCARD,
+) -> DiscardDecision:
+    """
+    Return the discard that maximizes the expected strength of the final hand.
+
+    Args:
+        cards: The 5 cards currently held
+        dead_cards: Cards known to be out of the deck (e.g. already discarded)
+        max_discard: Most cards that may be exchanged
+
+    Returns:
+        DiscardDecision: Positions to discard (empty to keep all five cards), with
+            the expected percentile of the resulting hand as reasoning
+
+    Raises:
+        ValueError: If the hand does not hold 5 distinct cards
+    """
+    best = analyze_discards(cards, dead_cards, max_discard)[0]
+    return DiscardDecision(
+        discard=best.discard,
+        reasoning=(
+            f"Exact draw analysis: expected final hand beats "
+            f"{best.expected_percentile:.0%} of all hands"
+        ),
+    )
+
+
+def analyze_discards(
+    cards: Sequence[Card],
+    dead_cards: Sequence[Card] = (),
+    max_discard: int = MAX_DISCARD,
+) -> List[DiscardOption]:
+    """
+    Evaluate every legal discard exactly against the remaining deck.
+
+    For each subset of at most max_discard positions, every possible replacement
+    draw from the unseen cards is enumerated and scored. The result gives the
+    exact distribution of final hand categories and the expected percentile of the
+    final hand among all 2,598,960 five-card hands. Results are memoized by the
+    suit-canonical form of the hand and dead cards, so hands that differ only by
+    a relabelling of suits share one computation.
+
+    Args:
+        cards: The 5 cards currently held
+        dead_cards: Cards known to be out of the deck
+        max_discard: Most cards that may be exchanged (0-5)
+
+    Returns:
+        List[DiscardOption]: All options, best expected percentile first; ties
+            prefer discarding fewer cards
+
+    Raises:
+        ValueError: If the hand does not hold 5 distinct cards or max_discard is
+            out of range
+    """
+    hand_ids = [card.id for card in cards]
+    if len(hand_ids) != 5 or len(set(hand_ids)) != 5:
+        raise ValueError("Hand must contain exactly 5 distinct cards")
+    if not 0 <= max_discard <= 5:
+        raise ValueError("max_discard must be between 0 and 5")
+    dead_ids = sorted({card.id for card in dead_cards} - set(hand_ids))
+
+    canonical = canonicalize(hand_ids, dead_ids)
+    options = _solve_canonical(canonical.hand, canonical.dead, max_discard)
+
+    # Map discard positions in the canonical (sorted) hand back to the caller's order
+    return [
+        DiscardOption(
+            discard=sorted(canonical.positions[i] for i in discard),
+            expected_percentile=expected,
+            category_probabilities=dict(categories),
+            outcomes=outcomes,
+        )
+        for discard, expected, categories, outcomes in options
+    ]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _solve_canonical(
+    hand_ids: Tuple[int, ...], dead_ids: Tuple[int, ...], max_discard: int
+) -> Tuple[tuple, ...]:
+    """Exact analysis of one canonical hand; discard positions index hand_ids."""
+    excluded = set(hand_ids) | set(dead_ids)
+    pool = np.array([c.id for c in CARDS if c.id not in excluded], dtype=np.int64)
+    hand = np.array(hand_ids, dtype=np.int64)
+
+    # Prime product, suit intersection and rank mask of every draw, per draw size;
+    # shared by all options exchanging that many cards
+    draws = {
+        size: _draw_features(pool[_draw_indices(len(pool), size)])
+        for size in range(max_discard + 1)
+    }
+
+    options = []
+    for size in range(max_discard + 1):
+        products, suits, masks = draws[size]
+        for discard in combinations(range(5), size):
+            kept = np.delete(hand, discard)
+            suited = (np.bitwise_and.reduce(_SUIT_BITS[kept], initial=15) & suits) != 0
+            rank_mask = np.bitwise_or.reduce(_RANK_BITS[kept], initial=0) | masks
+            product_index = np.searchsorted(
+                _PRODUCTS, np.prod(_PRIMES[kept]) * products
+            )
+            ranks = np.where(
+                suited, _FLUSH_RANKS[rank_mask], _PRODUCT_RANKS[product_index]
+            )
+            percentiles = np.where(
+                suited,
+                _FLUSH_PERCENTILES[rank_mask],
+                _PRODUCT_PERCENTILES[product_index],
+            )
+
+            counts = np.bincount(ranks, minlength=len(HandRank) + 1)
+            categories = tuple(
+                (str(rank), float(counts[rank.value] / len(ranks)))
+                for rank in HandRank
+                if counts[rank.value]
+            )
+            options.append((discard, float(percentiles.mean()), categories, len(ranks)))
+
+    # Best expectation first; stable sort keeps smaller discards ahead on ties
+    options.sort(key=lambda option: -option[1])
+    return tuple(options)
+
+
+def _draw_features(draws: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Combine the cards of every draw into the parts a final hand is looked up by.
+
+    Args:
+        draws: Card ids of shape (N, k)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Per draw, the product of the
+            rank primes, the suit bits all cards share (15 for an empty draw)
+            and the mask of ranks drawn
+    """
+    return (
+        np.prod(_PRIMES[draws], axis=1),
+        np.bitwise_and.reduce(_SUIT_BITS[draws], axis=1, initial=15),
+        np.bitwise_or.reduce(_RANK_BITS[draws], axis=1, initial=0),
+    )
+
+
+@lru_cache(maxsize=None)
+def _draw_indices(pool_size: int, draw: int) -> np.ndarray:
+    """Index array of every draw of `draw` cards from a pool, shape (C(n, k), k)."""
+    if draw == 0:
+        return np.zeros((1, 0), dtype=np.int64)
+    return np.array(list(combinations(range(pool_size), draw)), dtype=np.int64)
+
+
+def _build_class_tables() -> tuple:
+    """
+    Build lookups from a hand's prime product or suited rank mask to its
+    rank and percentile, so solving a hand needs no per-hand evaluation.
+
+    Returns:
+        tuple: (sorted products, rank and percentile per product, and rank and
+            percentile indexed by 13-bit rank mask for suited hands)
+    """
+    products = np.array(sorted(_PRODUCT_LOOKUP), dtype=np.int64)
+    product_evaluations = [_PRODUCT_LOOKUP[product] for product in products.tolist()]
+    product_ranks = np.array([e.rank.value for e in product_evaluations], dtype=np.int8)
+    product_percentiles = percentiles_of(
+        np.array([e.strength for e in product_evaluations], dtype=np.int64)
+    )
+
+    flush_ranks = np.zeros(1 << 13, dtype=np.int8)
+    flush_percentiles = np.zeros(1 << 13, dtype=np.float64)
+    masks = np.array(list(_FLUSH_LOOKUP), dtype=np.int64)
+    flush_evaluations = list(_FLUSH_LOOKUP.values())
+    flush_ranks[masks] = [e.rank.value for e in flush_evaluations]
+    flush_percentiles[masks] = percentiles_of(
+        np.array([e.strength for e in flush_evaluations], dtype=np.int64)
+    )
+    return (
+        products,
+        product_ranks,
+        product_percentiles,
+        flush_ranks,
+        flush_percentiles,
+    )
+
+
+# Per-card-id rank prime, suit bit and rank bit (see Card)
+_PRIMES = np.array([card.prime for card in CARDS], dtype=np.int64)
+_SUIT_BITS = np.array([card.suit_bit for card in CARDS], dtype=np.int64)
+_RANK_BITS = np.array([card.rank_bit for card in CARDS], dtype=np.int64)
+
+(
+    _PRODUCTS,
+    _PRODUCT_RANKS,
+    _PRODUCT_PERCENTILES,
+    _FLUSH_RANKS,
+    _FLUSH_PERCENTILES,
+) = _build_class_tables()
@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from data.types.discard_decision import DiscardDecision
 from loggers.draw_logger import DrawLogger
@@ -11,6 +13,9 @@ if TYPE_CHECKING:
 
 MAX_DISCARD = 5
 
+# A player's discard decision, or the error raised while deciding
+DiscardOutcome = Tuple[Optional[DiscardDecision], Optional[Exception]]
+
 
 def handle_draw_phase(game: "Game") -> None:
     """
@@ -33,6 +38,11 @@ def handle_draw_phase(game: "Game") -> None:
         InvalidActionError: If a player tries to discard invalid card indexes
         PokerGameError: For other game-related errors during the draw phase
 
+    Every decision is collected before any cards move, concurrently for
+    players whose decisions block on I/O. Discards and replacement cards are
+    then applied in seat order, so the dealt cards do not depend on which
+    decision finished first.
+
     Note:
         - Players who have folded are skipped
         - Players without a decide_discard() method are skipped
@@ -40,6 +50,33 @@ def handle_draw_phase(game: "Game") -> None:
         - All actions are logged through DrawLogger
     """
 
+    _prepare_draws(game)
+
+    # Ask every player first, then deal in seat order so the cards stay deterministic
+    players = [p for p in game.table if not p.folded]
+    for player, (decision, error) in zip(players, _decide_discards(players)):
+        _apply_discard(game, player, _discard_indices(player, decision, error))
+
+
+async def handle_draw_phase_async(game: "Game") -> None:
+    """
+    Handle the draw phase, awaiting every player's discard decision together.
+
+    Same rules and seat order as handle_draw_phase(), for the asyncio game loop.
+
+    Args:
+        game: Game instance containing the table and deck
+    """
+    _prepare_draws(game)
+
+    players = [p for p in game.table if not p.folded]
+    outcomes = await asyncio.gather(*(_decide_discard_async(p) for p in players))
+    for player, (decision, error) in zip(players, outcomes):
+        _apply_discard(game, player, _discard_indices(player, decision, error))
+
+
+def _prepare_draws(game: "Game") -> None:
+    """Reshuffle up front if the deck cannot cover every possible draw."""
     # First, figure out how many cards might possibly be drawn.
     active_players = [
         p for p in game.table if not p.folded and hasattr(p, "decide_discard")
@@ -48,30 +85,26 @@ def handle_draw_phase(game: "Game") -> None:
 
     handle_preemptive_reshuffle(game.deck, max_possible_draws)
 
-    # Process each player's draw
-    for player in game.table:
-        if player.folded:
-            continue
-
-        # Get discard decisions, if possible.
-        discard_indices = get_discard_indices(player)
-        if discard_indices is None:
-            # This means the player either doesn't have decide_draw or we hit an error
-            # in deciding discards. We skip discarding/drawing but still log accordingly.
-            DrawLogger.log_keep_hand(
-                player.name,
-                explicit_decision=(
-                    False if not hasattr(player, "decide_discard") else True
-                ),
-            )
-            continue
-
-        # Perform discarding logic if the player actually wants to discard.
-        if discard_indices:
-            process_discard_and_draw(player, game.deck, discard_indices)
-        else:
-            # The player explicitly decided to keep the entire hand (no discard).
-            DrawLogger.log_keep_hand(player.name, explicit_decision=True)
+
+def _apply_discard(
+    game: "Game", player: "Player", discard_indices: Optional[List[int]]
+) -> None:
+    """Discard and redraw a player's chosen cards, or log that they keep the hand."""
+    if discard_indices is None:
+        # This means the player either doesn't have decide_draw or we hit an error
+        # in deciding discards. We skip discarding/drawing but still log accordingly.
+        DrawLogger.log_keep_hand(
+            player.name,
+            explicit_decision=(False if not hasattr(player, "decide_discard") else True),
+        )
+        return
+
+    # Perform discarding logic if the player actually wants to discard.
+    if discard_indices:
+        process_discard_and_draw(player, game.deck, discard_indices)
+    else:
+        # The player explicitly decided to keep the entire hand (no discard).
+        DrawLogger.log_keep_hand(player.name, explicit_decision=True)
 
 
 def handle_preemptive_reshuffle(deck: "Deck", needed_cards: int) -> None:
@@ -91,7 +124,7 @@ def handle_preemptive_reshuffle(deck: "Deck", needed_cards: int) -> None:
         - Logs the reshuffle action through DrawLogger
     """
     if deck.needs_reshuffle(needed_cards):
-        if len(deck.cards) == needed_cards:
+        if deck.remaining() == needed_cards:
             DrawLogger.log_preemptive_reshuffle(needed_cards, skip=True)
         else:
             DrawLogger.log_preemptive_reshuffle(needed_cards, deck.remaining_cards())
@@ -110,37 +143,96 @@ def get_discard_indices(player: "Player") -> List[int] | None:
         None: If the player has no decide_discard() method, makes invalid choices,
               or encounters an error
     """
+    return _discard_indices(player, *_decide_discard(player))
+
+
+def _decide_discards(players: List["Player"]) -> List[DiscardOutcome]:
+    """
+    Collect every player's discard decision, in seat order.
+
+    Decisions depend only on each player's own hand, so players whose decisions
+    block on I/O (see Player.blocking_decisions) are asked concurrently in a
+    thread pool; with six LLM agents the phase waits one round-trip, not six.
+    Everyone else is asked inline.
+    """
+    blocking = [p for p in players if getattr(p, "blocking_decisions", False)]
+    if len(blocking) < 2:
+        return [_decide_discard(p) for p in players]
+
+    with ThreadPoolExecutor(max_workers=len(blocking)) as executor:
+        futures = {p: executor.submit(_decide_discard, p) for p in blocking}
+        return [
+            futures[p].result() if p in futures else _decide_discard(p)
+            for p in players
+        ]
+
+
+def _decide_discard(player: "Player") -> DiscardOutcome:
+    """Ask a player for a discard decision, capturing any error to log in seat order."""
     if not hasattr(player, "decide_discard"):
-        # If the player has no AI or method for deciding, return None so we skip
-        DrawLogger.log_non_ai_player(player.name)
-        return None
+        return None, None
+    try:
+        return player.decide_discard(), None
+    except Exception as e:
+        return None, e
+
 
+async def _decide_discard_async(player: "Player") -> DiscardOutcome:
+    """Await a player's discard decision, capturing any error to log in seat order."""
+    if not hasattr(player, "decide_discard"):
+        return None, None
     try:
-        discard_decision: DiscardDecision = player.decide_discard()
-        if not discard_decision:  # Handle None case
-            return []
+        return await player.decide_discard_async(), None
+    except Exception as e:
+        return None, e
 
-        if len(discard_decision.discard) > MAX_DISCARD:
-            # Log and trim if too many discards
-            DrawLogger.log_discard_validation_error(
-                player.name, len(discard_decision.discard)
-            )
-            # Return trimmed list rather than modifying in place
-            return discard_decision.discard[:MAX_DISCARD]
 
-        # Validate all indices are between 0 and 4 (assuming 5-card hands)
-        if any(idx < 0 or idx >= 5 for idx in discard_decision.discard):
-            DrawLogger.log_invalid_indexes(player.name)
-            return None
+def _discard_indices(
+    player: "Player",
+    discard_decision: Optional[DiscardDecision],
+    error: Optional[Exception],
+) -> List[int] | None:
+    """Turn a decision into validated discard indices, logging any problem."""
+    if not hasattr(player, "decide_discard"):
+        # If the player has no AI or method for deciding, return None so we skip
+        DrawLogger.log_non_ai_player(player.name)
+        return None
 
-        return discard_decision.discard
+    if error is not None:
+        # If there's an error in decide_draw, we log and return None so the player keeps the hand
+        DrawLogger.log_draw_error(player.name, error)
+        return None
 
+    try:
+        return _validate_discard(player, discard_decision)
     except Exception as e:
-        # If there's an error in decide_draw, we log and return None so the player keeps the hand
         DrawLogger.log_draw_error(player.name, e)
         return None
 
 
+def _validate_discard(
+    player: "Player", discard_decision: Optional[DiscardDecision]
+) -> List[int] | None:
+    """Trim or reject a discard decision; None means the player keeps the hand."""
+    if not discard_decision:  # Handle None case
+        return []
+
+    if len(discard_decision.discard) > MAX_DISCARD:
+        # Log and trim if too many discards
+        DrawLogger.log_discard_validation_error(
+            player.name, len(discard_decision.discard)
+        )
+        # Return trimmed list rather than modifying in place
+        return discard_decision.discard[:MAX_DISCARD]
+
+    # Validate all indices are between 0 and 4 (assuming 5-card hands)
+    if any(idx < 0 or idx >= 5 for idx in discard_decision.discard):
+        DrawLogger.log_invalid_indexes(player.name)
+        return None
+
+    return discard_decision.discard
+
+
 def process_discard_and_draw(
     player: "Player", deck: "Deck", discard_indices: List[int]
 ) -> None:
@@ -161,7 +253,7 @@ def process_discard_and_draw(
 
     # Check if we need to reshuffle before drawing
     if deck.needs_reshuffle(discard_count):
-        if len(deck.cards) == discard_count:
+        if deck.remaining() == discard_count:
             DrawLogger.log_reshuffle_status(discard_count, 0, skip=True)
         else:
             DrawLogger.log_reshuffle_status(discard_count, deck.remaining_cards())
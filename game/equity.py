@@ -0,0 +1,184 @@
+import time
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from data.types.equity_types import EquityResult
+
+from .card import CARDS, Card
+from .evaluator import evaluate_hands_batch
+
+# Largest number of cards a player can exchange in the draw
+MAX_DRAW = 5
+
+
+def estimate_equity(
+    hands: Sequence[Optional[Sequence[Card]]],
+    draws: Optional[Sequence[Union[int, Sequence[int]]]] = None,
+    deck: Optional[Sequence[Card]] = None,
+    dead_cards: Sequence[Card] = (),
+    samples: int = 10000,
+    time_budget: Optional[float] = None,
+    seed: Optional[int] = None,
+    batch_size: int = 2048,
+) -> EquityResult:
+    """
+    Estimate each live player's share of the pot at showdown by Monte-Carlo draws.
+
+    Every sample shuffles the unseen cards, deals unknown hands, performs the draw
+    for every player and scores all final hands in one vectorized call per player.
+    Split pots are shared equally between the tied players.
+
+    Args:
+        hands: One entry per live player: the player's 5 known cards, or None for
+            an opponent whose cards are unknown.
+        draws: One entry per player (defaults to no draws). For a known hand, either
+            the indices of the cards to discard or a number of cards; a number
+            discards the weakest cards, keeping pairs and high cards. For an unknown
+            hand, the number of cards the opponent is assumed to draw; the opponent
+            keeps the best cards of a random deal in the same way.
+        deck: Cards that may still be dealt or drawn. Defaults to every card not in
+            a known hand or in dead_cards. Cards held by unknown opponents must be
+            included, since from the caller's point of view they are unseen.
+        dead_cards: Cards known to be out of play, e.g. already discarded.
+        samples: Maximum number of simulated runouts.
+        time_budget: Optional limit in seconds; sampling stops after the first
+            batch that ends past the budget.
+        seed: Seed for reproducible estimates.
+        batch_size: Runouts simulated per vectorized batch.
+
+    Returns:
+        EquityResult: Equities (summing to 1), outright win and tie rates per
+            player, and the number of samples actually simulated.
+
+    Raises:
+        ValueError: If a hand or draw is malformed, cards are repeated, or the deck
+            cannot supply the cards needed for a runout.
+
+    Example:
+        >>> # Our hand, discarding the last card, against one opponent drawing 3
+        >>> result = estimate_equity([my_cards, None], draws=[[4], 3], seed=7)
+        >>> result.equities[0]
+    """
+    if not hands:
+        raise ValueError("At least one hand is required")
+    if samples < 1 or batch_size < 1:
+        raise ValueError("samples and batch_size must be positive")
+    if draws is None:
+        draws = [0] * len(hands)
+    if len(draws) != len(hands):
+        raise ValueError("draws must have one entry per hand")
+
+    plans = [_plan_player(hand, draw) for hand, draw in zip(hands, draws)]
+    known_ids = []
+    for kept, _, discarded in plans:
+        if kept is not None:
+            known_ids.extend(kept.tolist() + discarded)
+    if len(set(known_ids)) != len(known_ids):
+        raise ValueError("The same card appears in more than one hand")
+
+    excluded = set(known_ids) | {card.id for card in dead_cards}
+    if deck is None:
+        pool = np.array([c.id for c in CARDS if c.id not in excluded], dtype=np.int64)
+    else:
+        pool = np.array([card.id for card in deck], dtype=np.int64)
+        if excluded.intersection(pool.tolist()):
+            raise ValueError("Deck contains cards that are already known")
+
+    needed = sum(draw + (5 if kept is None else 0) for kept, draw, _ in plans)
+    if needed > len(pool):
+        raise ValueError(f"Deck has {len(pool)} cards but a runout needs {needed}")
+
+    rng = np.random.default_rng(seed)
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+    equity = np.zeros(len(plans))
+    wins = np.zeros(len(plans))
+    ties = np.zeros(len(plans))
+    done = 0
+    while done < samples:
+        size = min(batch_size, samples - done)
+        runouts = rng.permuted(np.tile(pool, (size, 1)), axis=1)[:, :needed]
+        keys = _score_runouts(plans, runouts)
+
+        best = keys.max(axis=0)
+        winners = keys == best
+        winner_count = winners.sum(axis=0)
+        equity += (winners / winner_count).sum(axis=1)
+        wins += (winners & (winner_count == 1)).sum(axis=1)
+        ties += (winners & (winner_count > 1)).sum(axis=1)
+
+        done += size
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+
+    return EquityResult(
+        equities=(equity / done).tolist(),
+        win_rates=(wins / done).tolist(),
+        tie_rates=(ties / done).tolist(),
+        samples=done,
+    )
+
+
+def _plan_player(
+    hand: Optional[Sequence[Card]], draw: Union[int, Sequence[int]]
+) -> tuple:
+    """
+    Resolve a player's hand and draw into (kept_ids, draw_count, discarded_ids).
+
+    kept_ids is None for unknown hands.
+    """
+    if hand is None:
+        if not isinstance(draw, (int, np.integer)):
+            raise ValueError("Draws for unknown hands must be a card count")
+        if not 0 <= draw <= MAX_DRAW:
+            raise ValueError(f"Draw count must be between 0 and {MAX_DRAW}")
+        return None, int(draw), []
+
+    if len(hand) != 5:
+        raise ValueError("Known hands must contain exactly 5 cards")
+    ids = [card.id for card in hand]
+
+    if isinstance(draw, (int, np.integer)):
+        if not 0 <= draw <= MAX_DRAW:
+            raise ValueError(f"Draw count must be between 0 and {MAX_DRAW}")
+        order = np.argsort(-_keep_priority(np.array([ids])), axis=1, kind="stable")
+        indices = order[0, 5 - draw:].tolist()
+    else:
+        indices = list(draw)
+        if len(set(indices)) != len(indices) or any(i < 0 or i > 4 for i in indices):
+            raise ValueError("Discard indices must be distinct and between 0 and 4")
+
+    kept = np.array([ids[i] for i in range(5) if i not in indices], dtype=np.int64)
+    return kept, len(indices), [ids[i] for i in indices]
+
+
+def _score_runouts(plans: List[tuple], runouts: np.ndarray) -> np.ndarray:
+    """Build every player's final hand for each runout and return their strength keys."""
+    keys = np.empty((len(plans), len(runouts)), dtype=np.int64)
+    offset = 0
+    for player, (kept, draw, _) in enumerate(plans):
+        if kept is None:
+            dealt = runouts[:, offset : offset + 5]
+            offset += 5
+            order = np.argsort(-_keep_priority(dealt), axis=1, kind="stable")
+            kept_cards = np.take_along_axis(dealt, order[:, : 5 - draw], axis=1)
+        else:
+            kept_cards = np.broadcast_to(kept, (len(runouts), len(kept)))
+
+        final = np.concatenate(
+            [kept_cards, runouts[:, offset : offset + draw]], axis=1
+        )
+        offset += draw
+        _, keys[player] = evaluate_hands_batch(final)
+    return keys
+
+
+def _keep_priority(cards: np.ndarray) -> np.ndarray:
+    """
+    Rank each card by how worth keeping it is: cards in larger rank groups first,
+    then higher ranks (count * 16 + value).
+    """
+    ranks = cards % 13
+    counts = (ranks[:, :, None] == ranks[:, None, :]).sum(axis=2)
+    return counts * 16 + ranks + 2
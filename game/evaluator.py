@@ -1,33 +1,145 @@
-from typing import List, NamedTuple
+from itertools import combinations, combinations_with_replacement
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from .card import Card
+import numpy as np
+
+from .card import RANK_PRIMES, RANK_VALUES, Card
 from data.types.hand_rank import HandRank
 
 
-class HandEvaluation(NamedTuple):
+class HandEvaluation(tuple):
     """
-    A named tuple containing the evaluation of a poker hand.
+    The evaluation of a poker hand.
+
+    A (rank, tiebreakers, description) tuple: it can be unpacked, indexed and
+    compared with other evaluations or plain tuples. The description is only
+    formatted the first time it is read, so callers that only compare hands
+    never pay for string building.
 
     Attributes:
         rank (HandRank): The rank of the hand (HIGH_CARD to ROYAL_FLUSH)
         tiebreakers (List[int]): Tiebreaker values in descending order of importance
-        description (str): Human readable description of the hand
+        description (str): Human readable description of the hand (computed lazily)
+        strength (int): Packed integer strength key; see pack_strength
+    """
+
+    def __new__(
+        cls,
+        rank: HandRank,
+        tiebreakers: List[int],
+        description: Optional[str] = None,
+    ) -> "HandEvaluation":
+        evaluation = super().__new__(cls, (rank, tiebreakers, description))
+        evaluation.rank = rank
+        evaluation.tiebreakers = tiebreakers
+        evaluation._description = description
+        evaluation._strength = None
+        return evaluation
+
+    @classmethod
+    def from_strength(cls, strength: int) -> "HandEvaluation":
+        """
+        Rebuild an evaluation from a packed strength key.
+
+        Args:
+            strength (int): A key produced by pack_strength or evaluate_hands_batch
+
+        Returns:
+            HandEvaluation: The evaluation with that rank and tiebreakers
+        """
+        tiebreakers = [(strength >> shift) & 15 for shift in (16, 12, 8, 4, 0)]
+        while tiebreakers and tiebreakers[-1] == 0:
+            tiebreakers.pop()
+        evaluation = cls(HandRank(strength >> 20), tiebreakers)
+        evaluation._strength = strength
+        return evaluation
+
+    @property
+    def description(self) -> str:
+        """Human readable description, formatted on first access."""
+        if self._description is None:
+            self._description = _describe(self.rank, self.tiebreakers)
+        return self._description
+
+    @property
+    def strength(self) -> int:
+        """Packed integer strength key; see pack_strength."""
+        if self._strength is None:
+            self._strength = pack_strength(self.rank, self.tiebreakers)
+        return self._strength
+
+    def __iter__(self) -> Iterator:
+        yield self.rank
+        yield self.tiebreakers
+        yield self.description
+
+    def __getitem__(self, index):
+        if index in (0, -3):
+            return self.rank
+        if index in (1, -2):
+            return self.tiebreakers
+        return tuple(self)[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, HandEvaluation):
+            return self.rank == other.rank and self.tiebreakers == other.tiebreakers
+        if isinstance(other, tuple):
+            return tuple(self) == other
+        return NotImplemented
+
+    def __ne__(self, other) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        return hash((self.rank, tuple(self.tiebreakers)))
+
+    def __getnewargs__(self) -> tuple:
+        return (self.rank, self.tiebreakers, self._description)
+
+    def __repr__(self) -> str:
+        return (
+            f"HandEvaluation(rank={self.rank!r}, tiebreakers={self.tiebreakers!r}, "
+            f"description={self.description!r})"
+        )
+
+
+def pack_strength(rank: HandRank, tiebreakers: Sequence[int]) -> int:
     """
+    Pack a hand rank and its tiebreakers into one monotonic integer.
 
-    rank: HandRank
-    tiebreakers: List[int]
-    description: str
+    The rank occupies the bits above 20 and each tiebreaker a 4-bit field below it
+    (missing tiebreakers are 0), so comparing two keys gives the same result as
+    comparing rank and then tiebreakers in order. Every valid hand has a key of at
+    least 1 << 20, leaving 0 free to mean "no valid hand".
+
+    Args:
+        rank (HandRank): The hand's rank category
+        tiebreakers (Sequence[int]): Up to five tiebreaker values (1-14)
+
+    Returns:
+        int: rank << 20 | t0 << 16 | t1 << 12 | t2 << 8 | t3 << 4 | t4
+    """
+    key = rank.value << 20
+    for shift, value in zip((16, 12, 8, 4, 0), tiebreakers):
+        key |= value << shift
+    return key
 
 
 def evaluate_hand(cards: List[Card]) -> HandEvaluation:
     """
     Evaluate a 5-card poker hand and return its ranking, tiebreakers, and description.
 
+    The evaluation is a table lookup: suited hands are looked up by the bitmask of
+    their ranks and all other hands by the product of their rank primes. Both tables
+    are built once at import time and together cover all 2,598,960 five-card hands.
+    The masks and primes are read straight from the precomputed fields of each Card.
+
     Args:
         cards (List[Card]): A list of exactly 5 Card objects representing a poker hand.
 
     Returns:
-        HandEvaluation: A named tuple containing:
+        HandEvaluation: A tuple-like evaluation containing:
             - HandRank: Hand rank from HIGH_CARD to ROYAL_FLUSH
             - List[int]: Tiebreaker values in descending order of importance
             - str: Human readable description of the hand
@@ -44,48 +156,73 @@ def evaluate_hand(cards: List[Card]) -> HandEvaluation:
         9. One Pair       - One pair of matching cards
         10. High Card     - Highest card when no other hand is made
 
-    Note: This implementation uses a reversed ranking system where lower numbers
-    indicate better hands (1 is best, 10 is worst).
+    Note: Evaluations are shared between hands of the same class, so the returned
+    tiebreakers list must be treated as read-only. The description is formatted
+    on first access.
 
     Raises:
-        ValueError: If the hand doesn't contain exactly 5 cards
+        ValueError: If the hand doesn't contain exactly 5 cards or has duplicates
 
     Example:
         >>> hand = [Card('A', '♠'), Card('K', '♠'), Card('Q', '♠'), Card('J', '♠'), Card('10', '♠')]
         >>> evaluate_hand(hand)
-        (1, [14, 13, 12, 11, 10], 'Royal Flush')
+        (HandRank.ROYAL_FLUSH, [14, 13, 12, 11, 10], 'Royal Flush')
+    """
+    return _lookup(cards, _FLUSH_LOOKUP, _PRODUCT_LOOKUP)
+
+
+def hand_strength(cards: List[Card]) -> int:
+    """
+    Return the packed strength key of a 5-card hand (see pack_strength).
+
+    Uses the same lookup as evaluate_hand, but against tables of precomputed
+    integers, so comparing or ranking hands needs no tuple or list handling.
+
+    Args:
+        cards (List[Card]): A list of exactly 5 Card objects
+
+    Returns:
+        int: Strength key; higher is better and equal keys tie
+
+    Raises:
+        ValueError: If the hand doesn't contain exactly 5 cards or has duplicates
     """
+    return _lookup(cards, _FLUSH_STRENGTH, _PRODUCT_STRENGTH)
+
+
+def _lookup(cards: List[Card], flush_table: dict, product_table: dict):
+    """Validate a 5-card hand and read its entry from the flush or product table."""
     if len(cards) != 5:
         raise ValueError("Hand must contain exactly 5 cards")
 
     # Check for duplicate cards
-    seen_cards = set()
+    seen_cards = 0
     for card in cards:
-        card_tuple = (card.rank, card.suit)
-        if card_tuple in seen_cards:
+        card_bit = 1 << card.id
+        if seen_cards & card_bit:
             raise ValueError(f"Duplicate card found: {card}")
-        seen_cards.add(card_tuple)
-
-    # Convert face cards to numeric values (J=11, Q=12, K=13, A=14)
-    values = {
-        "2": 2,
-        "3": 3,
-        "4": 4,
-        "5": 5,
-        "6": 6,
-        "7": 7,
-        "8": 8,
-        "9": 9,
-        "10": 10,
-        "J": 11,
-        "Q": 12,
-        "K": 13,
-        "A": 14,
-    }
+        seen_cards |= card_bit
 
-    # Convert all ranks to numeric values using the values dictionary
-    ranks = [values[str(card.rank).upper()] for card in cards]
-    suits = [card.suit for card in cards]
+    c0, c1, c2, c3, c4 = cards
+    if c0.suit_bit & c1.suit_bit & c2.suit_bit & c3.suit_bit & c4.suit_bit:
+        return flush_table[
+            c0.rank_bit | c1.rank_bit | c2.rank_bit | c3.rank_bit | c4.rank_bit
+        ]
+    return product_table[c0.prime * c1.prime * c2.prime * c3.prime * c4.prime]
+
+
+def _classify(ranks: Sequence[int], is_flush: bool) -> HandEvaluation:
+    """
+    Classify a hand from its rank values; used to build the lookup tables.
+
+    Args:
+        ranks: The five rank values of the hand, sorted in descending order
+        is_flush: Whether all five cards share a suit
+
+    Returns:
+        HandEvaluation: The evaluation shared by every hand with these ranks
+    """
+    ranks = list(ranks)
 
     # Count occurrences of each rank
     rank_counts = {}
@@ -98,12 +235,7 @@ def evaluate_hand(cards: List[Card]) -> HandEvaluation:
         key=lambda x: (-x[1], -x[0]),  # Sort by count desc, then rank desc
     )
 
-    # Sort ranks in descending order for high card comparisons
-    ranks = sorted(ranks, reverse=True)
-
-    # Check for straight and flush
-    is_flush = len(set(suits)) == 1
-    is_straight = len(rank_counts) == 5 and max(ranks) - min(ranks) == 4
+    is_straight = len(rank_counts) == 5 and ranks[0] - ranks[-1] == 4
 
     # Special case: Ace-low straight (A,2,3,4,5)
     if set(ranks) == {14, 2, 3, 4, 5}:
@@ -113,56 +245,237 @@ def evaluate_hand(cards: List[Card]) -> HandEvaluation:
     # Determine hand rank and tiebreakers
     if is_flush and is_straight:
         if ranks[0] == 14:  # Ace high
-            return HandEvaluation(HandRank.ROYAL_FLUSH, ranks, "Royal Flush")
-        return HandEvaluation(HandRank.STRAIGHT_FLUSH, ranks, f"Straight Flush, {ranks[0]} high")
+            return HandEvaluation(HandRank.ROYAL_FLUSH, ranks)
+        return HandEvaluation(HandRank.STRAIGHT_FLUSH, ranks)
 
     elif sorted_counts[0][1] == 4:  # Four of a kind
         quad_rank = sorted_counts[0][0]
         kicker = sorted_counts[1][0]
-        return HandEvaluation(HandRank.FOUR_OF_KIND, [quad_rank, kicker], f"Four of a Kind, {quad_rank}s")
+        return HandEvaluation(HandRank.FOUR_OF_KIND, [quad_rank, kicker])
 
     elif sorted_counts[0][1] == 3 and sorted_counts[1][1] == 2:  # Full house
         trips_rank = sorted_counts[0][0]
         pair_rank = sorted_counts[1][0]
-        return HandEvaluation(
-            HandRank.FULL_HOUSE,
-            [trips_rank, pair_rank],
-            f"Full House, {trips_rank}s over {pair_rank}s"
-        )
+        return HandEvaluation(HandRank.FULL_HOUSE, [trips_rank, pair_rank])
 
     elif is_flush:
-        return HandEvaluation(HandRank.FLUSH, ranks, f"Flush, {ranks[0]} high")
+        return HandEvaluation(HandRank.FLUSH, ranks)
 
     elif is_straight:
-        return HandEvaluation(HandRank.STRAIGHT, ranks, f"Straight, {ranks[0]} high")
+        return HandEvaluation(HandRank.STRAIGHT, ranks)
 
     elif sorted_counts[0][1] == 3:  # Three of a kind
         trips_rank = sorted_counts[0][0]
-        kickers = sorted([r for r in ranks if r != trips_rank], reverse=True)
-        return HandEvaluation(HandRank.THREE_OF_KIND, [trips_rank] + kickers, f"Three of a Kind, {trips_rank}s")
+        kickers = [r for r in ranks if r != trips_rank]
+        return HandEvaluation(HandRank.THREE_OF_KIND, [trips_rank] + kickers)
 
     elif sorted_counts[0][1] == 2 and sorted_counts[1][1] == 2:  # Two pair
         high_pair = sorted_counts[0][0]
         low_pair = sorted_counts[1][0]
         kicker = sorted_counts[2][0]
-        return HandEvaluation(
-            HandRank.TWO_PAIR,
-            [high_pair, low_pair, kicker],
-            f"Two Pair, {high_pair}s and {low_pair}s"
-        )
+        return HandEvaluation(HandRank.TWO_PAIR, [high_pair, low_pair, kicker])
 
     elif sorted_counts[0][1] == 2:  # One pair
         pair_rank = sorted_counts[0][0]
-        # Sort remaining cards by rank for kickers
-        kickers = sorted([r for r in ranks if r != pair_rank], reverse=True)[:3]
-        return HandEvaluation(
-            HandRank.ONE_PAIR,
-            [pair_rank] + kickers,
-            f"One Pair, {_rank_to_name(pair_rank)}s"
-        )
+        kickers = [r for r in ranks if r != pair_rank]
+        return HandEvaluation(HandRank.ONE_PAIR, [pair_rank] + kickers)
 
     else:  # High card
-        return HandEvaluation(HandRank.HIGH_CARD, ranks, f"High Card, {ranks[0]}")
+        return HandEvaluation(HandRank.HIGH_CARD, ranks)
+
+
+def _describe(rank: HandRank, tiebreakers: List[int]) -> str:
+    """
+    Format the human readable description of an evaluated hand.
+
+    Args:
+        rank: The hand's rank category
+        tiebreakers: The hand's tiebreakers, as produced by the evaluator
+
+    Returns:
+        str: Description such as "Full House, 10s over 4s"
+    """
+    if rank == HandRank.ROYAL_FLUSH:
+        return "Royal Flush"
+    elif rank == HandRank.STRAIGHT_FLUSH:
+        return f"Straight Flush, {tiebreakers[0]} high"
+    elif rank == HandRank.FOUR_OF_KIND:
+        return f"Four of a Kind, {tiebreakers[0]}s"
+    elif rank == HandRank.FULL_HOUSE:
+        return f"Full House, {tiebreakers[0]}s over {tiebreakers[1]}s"
+    elif rank == HandRank.FLUSH:
+        return f"Flush, {tiebreakers[0]} high"
+    elif rank == HandRank.STRAIGHT:
+        return f"Straight, {tiebreakers[0]} high"
+    elif rank == HandRank.THREE_OF_KIND:
+        return f"Three of a Kind, {tiebreakers[0]}s"
+    elif rank == HandRank.TWO_PAIR:
+        return f"Two Pair, {tiebreakers[0]}s and {tiebreakers[1]}s"
+    elif rank == HandRank.ONE_PAIR:
+        return f"One Pair, {_rank_to_name(tiebreakers[0])}s"
+    else:
+        return f"High Card, {tiebreakers[0]}"
+
+
+def _build_lookup_tables() -> tuple:
+    """
+    Enumerate every distinct 5-card hand class and classify it once.
+
+    Returns:
+        tuple: (flush_lookup, product_lookup) where flush_lookup maps the 1,287
+            suited rank bitmasks and product_lookup maps the 6,175 rank multisets
+            (by prime product) to their HandEvaluation
+    """
+    values = range(14, 1, -1)  # Descending so every combination is pre-sorted
+
+    flush_lookup: Dict[int, HandEvaluation] = {}
+    for ranks in combinations(values, 5):
+        rank_mask = 0
+        for value in ranks:
+            rank_mask |= 1 << (value - 2)
+        flush_lookup[rank_mask] = _classify(ranks, is_flush=True)
+
+    product_lookup: Dict[int, HandEvaluation] = {}
+    for ranks in combinations_with_replacement(values, 5):
+        if ranks[0] == ranks[4]:
+            continue  # Five of a kind is impossible with a single deck
+        product = 1
+        for value in ranks:
+            product *= RANK_PRIMES[value - 2]
+        product_lookup[product] = _classify(ranks, is_flush=False)
+
+    return flush_lookup, product_lookup
+
+
+def evaluate_hands_batch(cards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluate many 5-card hands in one vectorized call.
+
+    Each hand is scored from its rank histogram, a 13-bit rank mask (for straights)
+    and a suit check (for flushes) without a Python-level loop over hands.
+
+    Args:
+        cards (np.ndarray): Integer array of shape (N, 5) holding card ids (0-51,
+            see Card.id). A nested sequence of Card objects is also accepted.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]:
+            - ranks: int8 array of HandRank values (1=HIGH_CARD to 10=ROYAL_FLUSH)
+            - strength_keys: int64 array where a higher key is a stronger hand and
+              equal keys tie. Keys match hand_strength and pack_strength.
+
+    Raises:
+        ValueError: If the array is not (N, 5), holds ids outside 0-51, or a hand
+            contains the same card twice
+
+    Example:
+        >>> ids = np.array([[c.id for c in royal_flush]])
+        >>> evaluate_hands_batch(ids)
+        (array([10], dtype=int8), array([11459770]))
+    """
+    ids = _as_card_ids(cards)
+
+    ranks = np.empty(len(ids), dtype=np.int8)
+    keys = np.empty(len(ids), dtype=np.int64)
+    for start in range(0, len(ids), _BATCH_CHUNK):
+        stop = start + _BATCH_CHUNK
+        ranks[start:stop], keys[start:stop] = _evaluate_chunk(ids[start:stop])
+    return ranks, keys
+
+
+def _as_card_ids(cards) -> np.ndarray:
+    """Convert and validate batch input as an (N, 5) array of card ids."""
+    ids = np.asarray(cards)
+    if ids.dtype == object:
+        ids = np.array([[card.id for card in hand] for hand in cards], dtype=np.int64)
+    if ids.ndim != 2 or ids.shape[1] != 5:
+        raise ValueError("Hands must be an array of shape (N, 5)")
+    if not np.issubdtype(ids.dtype, np.integer):
+        raise ValueError("Hands must contain integer card ids")
+    if ids.size and (ids.min() < 0 or ids.max() > 51):
+        raise ValueError("Card ids must be between 0 and 51")
+
+    ordered = np.sort(ids, axis=1)
+    if (ordered[:, 1:] == ordered[:, :-1]).any():
+        raise ValueError("Duplicate card found in batch")
+    return ids
+
+
+def _evaluate_chunk(ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluate one bounded-size block of hands for evaluate_hands_batch."""
+    rank_index = ids % 13
+    suit_index = ids // 13
+
+    # Rank histogram per card: how many cards in the hand share its rank
+    counts = (rank_index[:, :, None] == rank_index[:, None, :]).sum(axis=2)
+
+    # Order cards by (count, value) descending; the distinct values in that order
+    # are exactly the tiebreakers of evaluate_hand
+    order = np.sort(counts * 16 + rank_index + 2, axis=1)[:, ::-1]
+    values = order & 15
+    is_new = np.ones_like(values, dtype=bool)
+    is_new[:, 1:] = values[:, 1:] != values[:, :-1]
+    shifts = 4 * (4 - (np.cumsum(is_new, axis=1) - 1))
+    tiebreakers = np.where(is_new, values << shifts, 0).sum(axis=1)
+
+    rank_mask = np.bitwise_or.reduce(np.left_shift(1, rank_index), axis=1)
+    distinct = _POPCOUNT[rank_mask]
+    top_count = order[:, 0] >> 4
+    is_flush = (suit_index == suit_index[:, :1]).all(axis=1)
+    straight_high = _STRAIGHT_HIGH[rank_mask]
+    is_straight = straight_high > 0
+
+    # Ace-low straights rank the ace as 1
+    tiebreakers = np.where(straight_high == 5, 0x54321, tiebreakers)
+
+    ranks = np.select(
+        [
+            is_flush & is_straight & (straight_high == 14),
+            is_flush & is_straight,
+            (distinct == 2) & (top_count == 4),
+            distinct == 2,
+            is_flush,
+            is_straight,
+            (distinct == 3) & (top_count == 3),
+            distinct == 3,
+            distinct == 4,
+        ],
+        [
+            HandRank.ROYAL_FLUSH.value,
+            HandRank.STRAIGHT_FLUSH.value,
+            HandRank.FOUR_OF_KIND.value,
+            HandRank.FULL_HOUSE.value,
+            HandRank.FLUSH.value,
+            HandRank.STRAIGHT.value,
+            HandRank.THREE_OF_KIND.value,
+            HandRank.TWO_PAIR.value,
+            HandRank.ONE_PAIR.value,
+        ],
+        default=HandRank.HIGH_CARD.value,
+    ).astype(np.int8)
+
+    keys = (ranks.astype(np.int64) << 20) | tiebreakers
+    return ranks, keys
+
+
+def _build_mask_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build per-rank-mask tables for the batch evaluator.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (popcount, straight_high) indexed by 13-bit
+            rank mask; straight_high is the top card of the straight or 0
+    """
+    masks = np.arange(1 << 13)
+    popcount = np.zeros(1 << 13, dtype=np.int8)
+    for bit in range(13):
+        popcount += (masks >> bit) & 1
+
+    straight_high = np.zeros(1 << 13, dtype=np.int8)
+    for low in range(9):
+        straight_high[0b11111 << low] = low + 6
+    straight_high[0b1000000001111] = 5  # A,2,3,4,5
+    return popcount, straight_high
 
 
 def _rank_to_name(rank: int) -> str:
@@ -175,3 +488,12 @@ def _rank_to_name(rank: int) -> str:
         10: "10"
     }
     return names.get(rank, str(rank))
+
+
+_FLUSH_LOOKUP, _PRODUCT_LOOKUP = _build_lookup_tables()
+_FLUSH_STRENGTH = {key: ev.strength for key, ev in _FLUSH_LOOKUP.items()}
+_PRODUCT_STRENGTH = {key: ev.strength for key, ev in _PRODUCT_LOOKUP.items()}
+_POPCOUNT, _STRAIGHT_HIGH = _build_mask_tables()
+
+# Hands evaluated per vectorized block; bounds temporary memory for huge batches
+_BATCH_CHUNK = 1 << 16
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from typing import Dict, List, Optional
 
 from data.db_client import DatabaseClient
@@ -5,14 +6,17 @@ from data.states.game_state import GameState
 from data.states.round_state import RoundState
 from game.config import GameConfig
 from game.table import Table
+from loggers.config import loggers_silenced, silenced_loggers
 from loggers.game_logger import GameLogger
 from loggers.table_logger import TableLogger
 
 from . import betting, draw, showdown
-from .deck import Deck
+from .audit import ChipAuditor
+from .deck import Deck, DeckFactory
 from .hand import Hand
 from .player import Player
 from .pot import Pot
+from .rng import GameRNG
 
 #! create pre and post helper methods for standard setup and teardown (might already have this)
 #! db game state at the start of the game
@@ -50,6 +54,9 @@ class AgenticPoker:
         config (GameConfig): Configuration parameters for the game
         current_bet (int): Current bet amount that players must match
         pot (Pot): Manages pot calculations and side pot creation
+        rng (GameRNG): Root random stream for shuffles and bot decisions
+        deck_provider (Optional[DeckFactory]): Source of pre-shuffled deck orders
+        auditor (ChipAuditor): Checks chip conservation on a sample of hands
         logger (Logger): Logger instance for game events and state changes
 
     Example:
@@ -71,8 +78,11 @@ class AgenticPoker:
     config: GameConfig
     current_bet: int
     pot: Pot
+    rng: GameRNG
+    deck_provider: Optional[DeckFactory]
+    auditor: ChipAuditor
     last_raiser: Optional[Player]
-    db_client: DatabaseClient
+    db_client: Optional[DatabaseClient]
 
     def __init__(
         self,
@@ -82,8 +92,30 @@ class AgenticPoker:
         ante: int = 0,
         session_id: Optional[str] = None,
         config: Optional[GameConfig] = None,
+        rng: Optional[GameRNG] = None,
+        deck_provider: Optional[DeckFactory] = None,
+        auditor: Optional[ChipAuditor] = None,
     ) -> None:
-        """Initialize a new poker game with specified players and configuration."""
+        """
+        Initialize a new poker game with specified players and configuration.
+
+        Randomness comes from `rng`, or from a GameRNG seeded with config.seed.
+        Every round draws from its own child stream, so any hand can be replayed
+        from the root seed and the round number.
+
+        A deck_provider supplies pre-shuffled deck orders in bulk; when given,
+        each round loads its next order instead of shuffling, and the provider's
+        own generator determines the cards dealt. Reshuffles during the draw
+        still use the round's deck stream.
+
+        Chip conservation is checked at round boundaries by `auditor`, or by a
+        ChipAuditor sampling every config.audit_every hands. Unless set, that is
+        every hand, or none in headless games.
+
+        With config.headless set, the game runs with no-op logger sinks, writes
+        no database snapshots and checks chip conservation only by assertion.
+        The rules engine is unchanged.
+        """
 
         if not players:
             raise ValueError("Must provide at least 2 players")
@@ -100,7 +132,15 @@ class AgenticPoker:
             )
 
         self.session_id = self.config.session_id
+        self.rng = rng if rng is not None else GameRNG(self.config.seed)
         self.deck = Deck()
+        self.deck_provider = deck_provider
+        if auditor is None:
+            audit_every = self.config.audit_every
+            if audit_every is None:
+                audit_every = 0 if self.config.headless else 1
+            auditor = ChipAuditor(every=audit_every)
+        self.auditor = auditor
 
         # Convert names to players if needed
         self.table = Table(players)
@@ -110,7 +150,7 @@ class AgenticPoker:
 
         #! make into betting class
         self.current_bet = 0
-        self.pot = Pot()
+        self.pot = Pot(validate_chips=not self.config.headless)
 
         self.small_blind = self.config.small_blind
         self.big_blind = self.config.big_blind
@@ -122,18 +162,27 @@ class AgenticPoker:
         self.initial_chips = {}
 
         # Replace logging with GameLogger
-        GameLogger.log_game_config(
-            players=[p.name for p in self.table],
-            starting_chips=self.config.starting_chips,
-            small_blind=self.config.small_blind,
-            big_blind=self.config.big_blind,
-            ante=self.config.ante,
-            max_rounds=self.config.max_rounds,
-            session_id=self.config.session_id,
+        if not self.config.headless:
+            GameLogger.log_game_config(
+                players=[p.name for p in self.table],
+                starting_chips=self.config.starting_chips,
+                small_blind=self.config.small_blind,
+                big_blind=self.config.big_blind,
+                ante=self.config.ante,
+                max_rounds=self.config.max_rounds,
+                session_id=self.config.session_id,
+            )
+
+        # Initialize database client; headless games persist no snapshots
+        self.db_client = (
+            DatabaseClient()
+            if self.config.save_snapshots and not self.config.headless
+            else None
         )
 
-        # Initialize database client
-        self.db_client = DatabaseClient()
+        # Last GameState snapshot and the change key it was built for
+        self._state: Optional[GameState] = None
+        self._state_key: Optional[tuple] = None
 
     def play_game(self, max_rounds: Optional[int] = None) -> None:
         """
@@ -164,52 +213,172 @@ class AgenticPoker:
             3. Execute betting/drawing phases
             4. Distribute pot to winner(s)
             5. Reset for next round
+
+        In headless mode every game logger is replaced by a no-op sink for the
+        duration of the game, and no snapshots are written.
+        """
+        with silenced_loggers() if self.config.headless else nullcontext():
+            self._play_rounds(max_rounds)
+
+    async def play_game_async(self, max_rounds: Optional[int] = None) -> None:
+        """
+        Execute the game loop with awaitable player decisions.
+
+        Plays exactly the same game as play_game(), but awaits each player's
+        decide_action_async() and decide_discard_async(). While one table waits
+        on an LLM, the event loop runs others, so one process can host many
+        concurrent games:
+
+            await asyncio.gather(*(game.play_game_async() for game in games))
+
+        The logger swap of headless games is process-wide and ends with the
+        first game to finish, so when running many headless games on one loop,
+        enter silenced_loggers() once around the whole gather.
+        """
+        with silenced_loggers() if self.config.headless else nullcontext():
+            await self._play_rounds_async(max_rounds)
+
+    def play_hand(self) -> bool:
+        """
+        Play a single hand, for callers that manage the table between hands.
+
+        A tournament uses this to move players between tables at hand
+        boundaries (see seat_player and unseat_player). Busted players stay
+        seated until the next hand starts, so the caller can record them first.
+        Unlike play_game(), no game snapshot or summary is written.
+
+        Returns:
+            bool: False, without dealing, if fewer than two players remain or
+                max_rounds is reached
         """
-        eliminated_players = []
+        with silenced_loggers() if self.config.headless else nullcontext():
+            if not self._begin_next_round([]):
+                return False
+            self._play_dealt_hand()
+            return True
+
+    async def play_hand_async(self) -> bool:
+        """Play a single hand with awaited player decisions; see play_hand()."""
+        with silenced_loggers() if self.config.headless else nullcontext():
+            if not self._begin_next_round([]):
+                return False
+            await self._play_dealt_hand_async()
+            return True
+
+    def seat_player(self, player: Player) -> None:
+        """Seat a player in the last seat between hands."""
+        self.table.add_player(player)
+
+    def unseat_player(self, player: Player) -> None:
+        """Remove a player between hands, keeping the dealer button on its seat."""
+        seat = self.table.players.index(player)
+        self.table.remove_player(player)
+        if seat < self.dealer_index:
+            self.dealer_index -= 1
+        if len(self.table):
+            self.dealer_index %= len(self.table)
+
+    def _play_rounds(self, max_rounds: Optional[int]) -> None:
+        """Run rounds until the game ends, then log the summary."""
+        eliminated_players = self._begin_game(max_rounds)
+
+        while self._begin_next_round(eliminated_players):
+            self._play_dealt_hand()
+
+        self._end_game(eliminated_players)
+
+    async def _play_rounds_async(self, max_rounds: Optional[int]) -> None:
+        """Run rounds with awaited decisions until the game ends."""
+        eliminated_players = self._begin_game(max_rounds)
+
+        while self._begin_next_round(eliminated_players):
+            await self._play_dealt_hand_async()
 
+        self._end_game(eliminated_players)
+
+    def _play_dealt_hand(self) -> None:
+        """Run the betting, draw and showdown phases of a dealt hand."""
+        should_continue = self._handle_pre_draw_phase()
+
+        if should_continue:
+            self._handle_draw_phase()
+
+        if should_continue:
+            should_continue = self._handle_post_draw_phase()
+
+        self._finish_round()
+
+    async def _play_dealt_hand_async(self) -> None:
+        """Run the phases of a dealt hand with awaited player decisions."""
+        should_continue = await self._handle_pre_draw_phase_async()
+
+        if should_continue:
+            await self._handle_draw_phase_async()
+
+        if should_continue:
+            should_continue = await self._handle_post_draw_phase_async()
+
+        self._finish_round()
+
+    def _begin_game(self, max_rounds: Optional[int]) -> List[Player]:
+        """Save the opening snapshot and apply max_rounds; returns the elimination list."""
         # Get game state and convert to dict before saving
-        game_state = self.get_state()
-        self.db_client.save_game_snapshot(
-            self.session_id, self.round_number, game_state
-        )
+        if self.db_client:
+            game_state = self.get_state()
+            self.db_client.save_game_snapshot(
+                self.session_id, self.round_number, game_state
+            )
 
         if max_rounds:
             self.max_rounds = max_rounds
 
-        while len(self.table) > 1:
-            self.round_number += 1
+        return []
 
-            # Check max rounds before starting new round
-            if self.max_rounds and self.round_number > self.max_rounds:
-                GameLogger.log_game_ended_after_rounds(self.max_rounds)
-                break
+    def _begin_next_round(self, eliminated_players: List[Player]) -> bool:
+        """
+        Start the next round unless the game is over.
 
-            # Handle eliminations and check if game should end
-            if not self._handle_player_eliminations(eliminated_players):
-                break
+        Returns:
+            bool: True if a round was dealt and its betting phases should run
+        """
+        if len(self.table) <= 1:
+            return False
 
-            self._start_new_round()
+        self.round_number += 1
 
-            should_continue = self._handle_pre_draw_phase()
+        # Check max rounds before starting new round
+        if self.max_rounds and self.round_number > self.max_rounds:
+            GameLogger.log_game_ended_after_rounds(self.max_rounds)
+            return False
 
-            if should_continue:
-                self._handle_draw_phase()
+        # Handle eliminations and check if game should end
+        if not self._handle_player_eliminations(eliminated_players):
+            return False
 
-            if should_continue:
-                should_continue = self._handle_post_draw_phase()
+        self._start_new_round()
+        self.auditor.begin_hand(self)
+        return True
 
-            self._handle_showdown()
+    def _finish_round(self) -> None:
+        """Settle the showdown, reset for the next round and save the round."""
+        self.auditor.before_showdown(self)
+        self._handle_showdown()
 
-            self._reset_round()
-            # Save round state after converting to dict
+        self._reset_round()
+        self.auditor.end_hand(self)
+        # Save round state after converting to dict
+        if self.db_client:
             self.db_client.save_round_snapshot(
                 self.session_id, self.round_number, self.round_state
             )
 
+    def _end_game(self, eliminated_players: List[Player]) -> None:
+        """Log the game summary and close the database session."""
         self._log_game_summary(eliminated_players)
 
         # Ensure database session is cleaned up
-        self.db_client.close()
+        if self.db_client:
+            self.db_client.close()
 
     def _handle_pre_draw_phase(self) -> bool:
         GameLogger.log_phase_header("Pre-draw betting")
@@ -217,10 +386,6 @@ class AgenticPoker:
         # Handle betting round first
         should_continue = betting.handle_betting_round(self)
 
-        # Calculate side pots if any player is all-in
-        if any(p.is_all_in for p in self.table.players):
-            self.pot.calculate_side_pots(self.table.players)
-
         # Move bets to pot and reset them
         self.pot.end_betting_round(self.table.players)
 
@@ -238,8 +403,10 @@ class AgenticPoker:
 
         The order of operations is important:
         1. Run the betting round
-        2. Calculate side pots while bets are still set
-        3. End betting round which moves bets to pot
+        2. End betting round which moves bets to pot
+
+        Side pots need no step here; the pot derives them from its contribution
+        ledger when they are read.
         """
         GameLogger.log_phase_header("Post-draw betting")
 
@@ -251,16 +418,40 @@ class AgenticPoker:
         # First handle the betting
         should_continue = betting.handle_betting_round(self)
 
-        # Calculate side pots if any player is all-in
-        if any(p.is_all_in for p in self.table.players):
-            self.pot.calculate_side_pots(self.table.players)
-
         # Move bets to pot and reset them
         self.pot.end_betting_round(self.table.players)
 
         GameLogger.log_phase_complete("Post-draw betting")
         return should_continue
 
+    async def _handle_pre_draw_phase_async(self) -> bool:
+        """Pre-draw betting with awaited player decisions."""
+        GameLogger.log_phase_header("Pre-draw betting")
+        should_continue = await betting.handle_betting_round_async(self)
+        self.pot.end_betting_round(self.table.players)
+        GameLogger.log_phase_complete("Pre-draw betting")
+        return should_continue
+
+    async def _handle_draw_phase_async(self) -> None:
+        """Draw phase with awaited discard decisions."""
+        GameLogger.log_phase_header("Draw Phase")
+        await draw.handle_draw_phase_async(self)
+        GameLogger.log_phase_complete("Draw Phase")
+
+    async def _handle_post_draw_phase_async(self) -> bool:
+        """Post-draw betting with awaited player decisions."""
+        GameLogger.log_phase_header("Post-draw betting")
+
+        # Skip post-draw betting if everyone is all-in
+        if all(p.is_all_in or p.folded for p in self.table.players):
+            GameLogger.log_skip_betting("All remaining players are all-in")
+            return True
+
+        should_continue = await betting.handle_betting_round_async(self)
+        self.pot.end_betting_round(self.table.players)
+        GameLogger.log_phase_complete("Post-draw betting")
+        return should_continue
+
     def _handle_showdown(self) -> None:
         GameLogger.log_phase_header("Showdown")
         showdown.handle_showdown(
@@ -278,13 +469,15 @@ class AgenticPoker:
         1. Initializes the round state (new deck, deal cards, reset bets)
         2. Logs the round information and current game state
         3. Collects blinds and antes from players
-        4. Processes any pre-round AI player messages
+        4. Lets every player start background planning for the hand
+        5. Processes any pre-round AI player messages
 
         Side Effects:
             - Deals new cards to players
             - Collects blinds and antes
             - Updates pot and player chip counts
             - Logs round information
+            - Starts agents' plan generation (see Player.start_planning)
             - Processes AI player messages
         """
         # Start new round with remaining players
@@ -301,7 +494,8 @@ class AgenticPoker:
 
         self._initialize_round()
 
-        self._log_round_info()
+        if not loggers_silenced():
+            self._log_round_info()
 
         # Collect blinds and antes AFTER logging initial state
         self._collect_blinds_and_antes()
@@ -312,6 +506,10 @@ class AgenticPoker:
         if len(active_not_allin) <= 1:
             return
 
+        # Let agents plan the hand while earlier seats act
+        for player in self.table:
+            player.start_planning(self)
+
         # Handle AI player pre-round messages
         #! need to fix this
         # for player in self.table.players:
@@ -453,9 +651,20 @@ class AgenticPoker:
             player.bet = 0
             player.folded = False
 
-        # Create and shuffle a fresh deck for the new round
-        self.deck = Deck()
-        self.deck.shuffle()
+        # Give the deck and every player this round's random streams. Players
+        # constructed with their own rng keep it (see Player.use_round_rng).
+        round_rng = self.rng.child("hand", self.round_number)
+        for player in self.table:
+            player.use_round_rng(round_rng.child("agent", player.name).random)
+
+        # Collect every card back into the deck and shuffle for the new round.
+        # The deck keeps the round's stream even when a provider stages the
+        # order, since mid-hand reshuffles still draw from it.
+        self.deck.reset(rng=round_rng.child("deck").generator)
+        if self.deck_provider is not None:
+            self.deck_provider.deal_into(self.deck)
+        else:
+            self.deck.shuffle()
         GameLogger.log_new_deck_shuffled(self.round_number)
 
         # Deal initial hands
@@ -480,7 +689,43 @@ class AgenticPoker:
         self.dealer_index = (self.dealer_index + 1) % len(self.table)
 
     def get_state(self) -> GameState:
-        return GameState.from_game(self)
+        """
+        Get a snapshot of the game, rebuilt only when the game has changed.
+
+        The last snapshot is returned again while its change key still matches:
+        the pot and deck states (themselves cached until the pot or deck
+        changes), the round's current bet, positions, blinds, and each seat's
+        chips, bet and action flags. A rebuilt snapshot shares the states of
+        unchanged players with the previous one. Snapshots are shared, so treat
+        them as read-only and use GameState.copy() for a private copy.
+
+        Returns:
+            GameState: Current state of the game
+        """
+        if self._state is None or self._state_key != self._get_state_key():
+            self._state = GameState.from_game(self, previous=self._state)
+            self._state_key = self._get_state_key()
+        return self._state
+
+    def _get_state_key(self) -> tuple:
+        """Everything a GameState snapshot is built from that can change."""
+        round_state = getattr(self, "round_state", None)
+        return (
+            self.pot.get_state(),
+            self.deck.get_state(),
+            id(round_state),
+            getattr(round_state, "current_bet", None),
+            self.dealer_index,
+            getattr(self, "active_player_position", None),
+            self.small_blind,
+            self.big_blind,
+            self.ante,
+            self.config.min_bet,
+            tuple(
+                (p.name, p.chips, p.bet, p.folded, p.is_all_in, p.checked, p.called)
+                for p in self.table
+            ),
+        )
 
     def _deal_cards(self) -> None:
         """Deal new hands to all players."""
@@ -1,10 +1,11 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 from data.types.hand_rank import HandRank
 from data.types.hand_types import HandState
 
 from .card import Card
-from .evaluator import evaluate_hand
+from .evaluator import HandEvaluation, evaluate_hand
+from .percentile import hand_percentile
 
 
 class Hand:
@@ -15,9 +16,14 @@ class Hand:
     for performance. Hands are compared using standard poker rankings where lower
     rank numbers indicate better hands (1 is best).
 
+    A hand is evaluated at most once per card configuration: the cached evaluation
+    is keyed on the ids of the cards it was computed from, so it is also refreshed
+    when `cards` is mutated directly (as the draw phase does).
+
     Attributes:
         cards (List[Card]): List of cards currently in the hand
-        _rank (Optional[tuple]): Cached evaluation result (rank, tiebreakers, description)
+        _rank (Optional[HandEvaluation]): Cached evaluation result
+        _rank_key (Optional[tuple]): Card ids the cached evaluation belongs to
     """
 
     def __init__(self, cards: Optional[List[Card]] = None) -> None:
@@ -28,36 +34,59 @@ class Hand:
             cards: Optional list of cards to initialize the hand with. Defaults to empty list.
         """
         self.cards = cards if cards is not None else []
-        self._rank: Optional[tuple] = None
+        self._rank: Optional[HandEvaluation] = None
+        self._rank_key: Optional[tuple] = None
 
     def __lt__(self, other: "Hand") -> bool:
         """Compare if this hand ranks lower than another hand."""
-        return self.compare_to(other) < 0
+        return self.strength < other.strength
 
     def __gt__(self, other: "Hand") -> bool:
         """Compare if this hand ranks higher than another hand."""
-        return self.compare_to(other) > 0
+        return self.strength > other.strength
 
     def __eq__(self, other: "Hand") -> bool:
         """Check if hands are exactly equal in rank and tiebreakers."""
-        return self.compare_to(other) == 0
+        return self.strength == other.strength
+
+    @property
+    def strength(self) -> int:
+        """
+        Packed integer strength of the hand (see evaluator.pack_strength).
+
+        Higher is better and equal values tie. Empty or invalid hands have
+        strength 0, below every valid hand.
+        """
+        evaluation = self._get_rank()
+        return evaluation.strength if isinstance(evaluation, HandEvaluation) else 0
+
+    def percentile(self, after_draw: bool = False) -> float:
+        """
+        Share of five-card hands this hand beats (ties count half).
+
+        Args:
+            after_draw: Compare against final hands after an optimal draw rather
+                than against freshly dealt hands
+
+        Returns:
+            float: Percentile between 0 and 1; 0.0 for empty or invalid hands
+        """
+        return hand_percentile(self.strength, after_draw)
 
     def _get_rank(self) -> tuple:
         """Get the cached rank or calculate and cache it if needed."""
-        if self._rank is None:
-            if not self.cards:
-                return (
-                    float("inf"),
-                    [],
-                    "Empty hand",
-                )  # Use consistent "Empty hand" message
-            if len(self.cards) != 5:
-                return (float("inf"), [], "Invalid number of cards")
-            try:
-                self._rank = self.evaluate()
-            except (ValueError, KeyError) as e:
-                return (float("inf"), [], f"Invalid hand: {str(e)}")
-        return self._rank or (float("inf"), [], "Empty hand")
+        if not self.cards:
+            return (
+                float("inf"),
+                [],
+                "Empty hand",
+            )  # Use consistent "Empty hand" message
+        if len(self.cards) != 5:
+            return (float("inf"), [], "Invalid number of cards")
+        try:
+            return self.evaluate()
+        except (ValueError, KeyError) as e:
+            return (float("inf"), [], f"Invalid hand: {str(e)}")
 
     def add_cards(self, cards: List[Card]) -> None:
         """Add cards to the hand and invalidate the cached rank."""
@@ -94,7 +123,6 @@ class Hand:
 
         cards_str = ", ".join(str(card) for card in self.cards)
 
-        # Always use evaluate() for valid hands to ensure consistent evaluation
         if len(self.cards) == 5:
             try:
                 rank, tiebreakers, description = self.evaluate()
@@ -108,28 +136,39 @@ class Hand:
 
         return f"{cards_str}\n    - {description} {eval_details}"
 
-    def evaluate(self) -> Tuple[int, List[int], str]:
-        """Evaluate the current hand and return its ranking information."""
+    def evaluate(self) -> HandEvaluation:
+        """
+        Evaluate the current hand and return its ranking information.
+
+        The result is cached until the cards change.
+
+        Raises:
+            ValueError: If the hand does not hold exactly 5 valid, distinct cards
+        """
         if not self.cards or len(self.cards) != 5:
             raise ValueError("Cannot evaluate hand: incorrect number of cards")
 
-        return evaluate_hand(self.cards)
+        key = tuple([card.id for card in self.cards])
+        if self._rank is None or self._rank_key != key:
+            self._rank = evaluate_hand(self.cards)
+            self._rank_key = key
+        return self._rank
 
     def get_state(self) -> HandState:
         """Get the current state of the hand."""
         if not self.cards:
             return HandState(cards=[])
 
-        # Get evaluation if needed
-        if self._rank is None and len(self.cards) == 5:
-            self._rank = self.evaluate()
+        evaluation = self.evaluate() if len(self.cards) == 5 else None
 
         return HandState(
             cards=[str(card) for card in self.cards],
-            rank=self._rank[2] if self._rank else None,  # Description
-            rank_value=self._rank[0] if self._rank else None,  # Numerical rank
-            tiebreakers=list(self._rank[1]) if self._rank else [],  # Tiebreakers
-            is_evaluated=self._rank is not None,
+            rank=evaluation.description if evaluation else None,
+            rank_value=evaluation.rank if evaluation else None,  # Numerical rank
+            tiebreakers=list(evaluation.tiebreakers) if evaluation else [],
+            is_evaluated=evaluation is not None,
+            # Percentiles are looked up from the strength only when read
+            strength=evaluation.strength if evaluation else 0,
         )
 
     def compare_to(self, other: "Hand") -> int:
@@ -138,31 +177,9 @@ class Hand:
         Returns:
             int: Positive if this hand is better, negative if worse, 0 if equal
         """
-        # Get ranks for both hands using _get_rank to handle invalid cases
-        self_rank, self_tiebreakers, _ = self._get_rank()
-        other_rank, other_tiebreakers, _ = other._get_rank()
-
-        # If both hands are invalid (infinite rank), they're equal
-        if self_rank == float("inf") and other_rank == float("inf"):
-            return 0
-
-        # If one hand is invalid, it loses
-        if self_rank == float("inf"):
-            return -1
-        if other_rank == float("inf"):
-            return 1
-
-        # Compare ranks using enum values
-        if self_rank != other_rank:
-            # Convert to values for comparison, higher value is better
-            return self_rank.value - other_rank.value
-
-        # If ranks are equal, compare tiebreakers (higher is better)
-        for self_value, other_value in zip(self_tiebreakers, other_tiebreakers):
-            if self_value != other_value:
-                return self_value - other_value
-
-        return 0  # Hands are equal
+        # Invalid hands have strength 0, so they lose to any valid hand and tie
+        # with each other
+        return self.strength - other.strength
 
     def get_rank(self) -> HandRank:
         """
@@ -170,24 +187,8 @@ class Hand:
 
         Returns:
             HandRank: The rank of this hand from HIGH_CARD to ROYAL_FLUSH
+
+        Raises:
+            ValueError: If the hand does not hold exactly 5 valid, distinct cards
         """
-        if self._is_royal_flush():
-            return HandRank.ROYAL_FLUSH
-        elif self._is_straight_flush():
-            return HandRank.STRAIGHT_FLUSH
-        elif self._is_four_of_kind():
-            return HandRank.FOUR_OF_KIND
-        elif self._is_full_house():
-            return HandRank.FULL_HOUSE
-        elif self._is_flush():
-            return HandRank.FLUSH
-        elif self._is_straight():
-            return HandRank.STRAIGHT
-        elif self._is_three_of_kind():
-            return HandRank.THREE_OF_KIND
-        elif self._is_two_pair():
-            return HandRank.TWO_PAIR
-        elif self._is_one_pair():
-            return HandRank.ONE_PAIR
-        else:
-            return HandRank.HIGH_CARD
+        return self.evaluate().rank
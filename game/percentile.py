@@ -0,0 +1,213 @@
+from functools import lru_cache
+from itertools import combinations_with_replacement
+from math import comb
+from pathlib import Path
+from typing import Dict, Tuple
+
+import numpy as np
+
+from data.types.hand_rank import HandRank
+
+from .card import RANK_PRIMES
+from .evaluator import _FLUSH_LOOKUP, _PRODUCT_LOOKUP, evaluate_hands_batch
+
+# Sampled deals used to build the post-draw percentile table
+DRAW_SAMPLES = 1 << 18
+DRAW_SEED = 0
+# Deals sampled per block while building it; bounds temporary memory
+DRAW_CHUNK = 1 << 15
+# The built table, shipped with the package; regenerate it with
+# save_draw_percentiles() after changing the sampling or the draw rule
+DRAW_TABLE_PATH = Path(__file__).with_name("draw_percentiles.npy")
+
+
+def hand_percentile(strength: int, after_draw: bool = False) -> float:
+    """
+    Return the percentile of a hand strength among all five-card hands.
+
+    A hand's percentile is the share of hands it beats plus half the share it
+    ties with, so the weakest hand scores near 0 and a royal flush near 1.
+
+    Args:
+        strength: Packed strength key (HandEvaluation.strength); 0 for an
+            invalid hand, which scores 0.0
+        after_draw: Compare against final hands after an optimal draw (see
+            draw_percentiles) instead of against freshly dealt hands
+
+    Returns:
+        float: Percentile between 0 and 1
+
+    Raises:
+        ValueError: If strength is not the key of any five-card hand
+    """
+    if strength == 0:
+        return 0.0
+    table = _draw_table()[1] if after_draw else _PERCENTILE_BY_KEY
+    try:
+        return table[strength]
+    except KeyError:
+        raise ValueError(f"Unknown hand strength: {strength}") from None
+
+
+def percentiles_of(keys: np.ndarray, after_draw: bool = False) -> np.ndarray:
+    """
+    Vectorized hand_percentile over an array of valid strength keys.
+
+    Returns:
+        np.ndarray: float64 percentile of each key
+    """
+    percentiles = _draw_table()[0] if after_draw else _PERCENTILES
+    return percentiles[np.searchsorted(_SORTED_KEYS, keys)]
+
+
+def draw_percentiles() -> np.ndarray:
+    """
+    Percentile of every strength key among final hands after an optimal draw.
+
+    Final hands come from DRAW_SAMPLES seeded deals, each drawing as the
+    discard solver would (see _draw_keep). The table is loaded from
+    DRAW_TABLE_PATH on first use and is aligned with the sorted strength keys.
+    """
+    return _draw_table()[0]
+
+
+def _strength_percentiles() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the percentile of every hand class among all 2,598,960 hands.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (sorted strength keys, percentile per key)
+    """
+    weights = {}
+    for evaluation in _FLUSH_LOOKUP.values():
+        weights[evaluation.strength] = 4  # One per suit
+
+    values = range(14, 1, -1)
+    for ranks in combinations_with_replacement(values, 5):
+        if ranks[0] == ranks[4]:
+            continue  # Five of a kind is impossible with a single deck
+        product = 1
+        suit_assignments = 1
+        for value in set(ranks):
+            suit_assignments *= comb(4, ranks.count(value))
+        for value in ranks:
+            product *= RANK_PRIMES[value - 2]
+        if len(set(ranks)) == 5:
+            suit_assignments -= 4  # Suited versions live in the flush table
+        weights[_PRODUCT_LOOKUP[product].strength] = suit_assignments
+
+    keys = np.array(sorted(weights), dtype=np.int64)
+    counts = np.array([weights[key] for key in keys], dtype=np.float64)
+    below = np.cumsum(counts) - counts
+    return keys, (below + counts / 2) / counts.sum()
+
+
+@lru_cache(maxsize=None)
+def _draw_table() -> Tuple[np.ndarray, Dict[int, float]]:
+    """Load the post-draw percentiles as an array and a key lookup."""
+    try:
+        percentiles = np.load(DRAW_TABLE_PATH)
+    except OSError:
+        percentiles = None
+    if percentiles is None or percentiles.shape != _SORTED_KEYS.shape:
+        percentiles = build_draw_percentiles()
+    return percentiles, dict(zip(_SORTED_KEYS.tolist(), percentiles.tolist()))
+
+
+def build_draw_percentiles() -> np.ndarray:
+    """
+    Sample the post-draw percentile table from scratch.
+
+    This takes about a second, so the result is shipped as DRAW_TABLE_PATH
+    and only rebuilt if that file is missing.
+
+    Returns:
+        np.ndarray: Percentile of every strength key, aligned with the sorted keys
+    """
+    rng = np.random.default_rng(DRAW_SEED)
+    final_keys = np.concatenate(
+        [
+            _final_keys(_deal(rng, min(DRAW_CHUNK, DRAW_SAMPLES - start)))
+            for start in range(0, DRAW_SAMPLES, DRAW_CHUNK)
+        ]
+    )
+
+    final_keys.sort()
+    below = np.searchsorted(final_keys, _SORTED_KEYS, side="left")
+    equal = np.searchsorted(final_keys, _SORTED_KEYS, side="right") - below
+    return (below + equal / 2) / len(final_keys)
+
+
+def save_draw_percentiles() -> Path:
+    """
+    Rebuild the post-draw table and write it to DRAW_TABLE_PATH.
+
+    Returns:
+        Path: The file written
+    """
+    np.save(DRAW_TABLE_PATH, build_draw_percentiles())
+    _draw_table.cache_clear()
+    return DRAW_TABLE_PATH
+
+
+def _deal(rng: np.random.Generator, count: int) -> np.ndarray:
+    """
+    Deal the top ten cards of `count` shuffled decks.
+
+    Only the ten lowest of each deck's 52 random sort keys are put in order,
+    which avoids sorting the other 42.
+
+    Returns:
+        np.ndarray: Card ids of shape (count, 10): five dealt, five replacements
+    """
+    sort_keys = rng.random((count, 52))
+    top = np.argpartition(sort_keys, 9, axis=1)[:, :10]
+    order = np.argsort(np.take_along_axis(sort_keys, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def _final_keys(deals: np.ndarray) -> np.ndarray:
+    """Strength keys of the final hands after each deal draws per _draw_keep."""
+    hands, replacements = deals[:, :5], deals[:, 5:]
+
+    keep = _draw_keep(hands)
+    # The n-th discarded position takes the n-th replacement card
+    slot = np.clip(np.cumsum(~keep, axis=1) - 1, 0, 4)
+    final = np.where(keep, hands, np.take_along_axis(replacements, slot, axis=1))
+    _, final_keys = evaluate_hands_batch(final)
+    return final_keys
+
+
+def _draw_keep(hands: np.ndarray) -> np.ndarray:
+    """
+    Choose the cards each hand keeps, approximating the optimal discard.
+
+    Straights and better stand pat, pairs, two pair and trips keep their
+    groups, and anything else keeps its two highest cards. Measured against
+    solve_discard, which maximizes the same percentile, this matches the exact
+    choice on most hands and gives up well under 0.001 expected percentile on
+    average.
+
+    Returns:
+        np.ndarray: Boolean mask of shape (N, 5), True for kept cards
+    """
+    ranks, _ = evaluate_hands_batch(hands)
+    values = hands % 13
+    rank_counts = (values[:, :, None] == values[:, None, :]).sum(axis=2)
+
+    keep = np.zeros(hands.shape, dtype=bool)
+    keep[ranks >= HandRank.STRAIGHT.value] = True
+    grouped = (ranks >= HandRank.ONE_PAIR.value) & (ranks < HandRank.STRAIGHT.value)
+    keep[grouped] = rank_counts[grouped] > 1
+
+    high_card = ranks == HandRank.HIGH_CARD.value
+    top_two = np.argsort(-values[high_card], axis=1)[:, :2]
+    high_card_keep = np.zeros((high_card.sum(), 5), dtype=bool)
+    np.put_along_axis(high_card_keep, top_two, True, axis=1)
+    keep[high_card] = high_card_keep
+    return keep
+
+
+_SORTED_KEYS, _PERCENTILES = _strength_percentiles()
+_PERCENTILE_BY_KEY = dict(zip(_SORTED_KEYS.tolist(), _PERCENTILES.tolist()))
+
@@ -1,4 +1,7 @@
 import logging
+import random
+from types import ModuleType
+from typing import Optional, Union
 
 from data.states.player_state import PlayerState
 from data.types.action_decision import ActionDecision, ActionType
@@ -23,6 +26,10 @@ class Player:
         folded (bool): Whether the player has folded in the current hand
         hand (Hand): The player's current hand of cards
         position (PlayerPosition): The player's current position in the game
+        rng (Union[random.Random, ModuleType]): Random source for decisions; the
+            global random module unless a seeded stream is given or assigned
+        blocking_decisions (bool): Whether decisions wait on I/O, such as an LLM
+            round-trip; the draw phase asks such players concurrently
     """
 
     name: str
@@ -35,14 +42,22 @@ class Player:
     checked: bool
     called: bool
     _logged_all_in: bool  # New flag to track if all-in was logged
+    rng: Union[random.Random, ModuleType]
+    _owns_rng: bool  # Constructed with its own rng, which games leave in place
+    blocking_decisions: bool = False
 
-    def __init__(self, name: str, chips: int = 1000) -> None:
+    def __init__(
+        self, name: str, chips: int = 1000, rng: Optional[random.Random] = None
+    ) -> None:
         """
         Initialize a new player with a name and starting chips.
 
         Args:
             name (str): The player's display name
             chips (int, optional): Starting amount of chips. Defaults to 1000.
+            rng (Optional[random.Random]): Seeded random source for decisions.
+                Defaults to the global random module. A stream given here is kept
+                for the player's lifetime; games do not replace it per round.
 
         Raises:
             ValueError: If name is empty or chips is negative
@@ -64,6 +79,8 @@ class Player:
         self.checked = False
         self.called = False
         self._logged_all_in = False  # Initialize flag
+        self.rng = rng if rng is not None else random
+        self._owns_rng = rng is not None
 
         PlayerLogger.log_player_creation(name, chips)
 
@@ -84,7 +101,7 @@ class Player:
 
         self.chips -= amount
         self.bet += amount
-        game.pot.add_to_pot(amount)
+        game.pot.add_contribution(self, amount)
 
         PlayerLogger.log_bet_placement(
             self.name, amount, self.bet, self.chips, game.pot.pot
@@ -110,6 +127,37 @@ class Player:
             )
             raise
 
+    def use_round_rng(self, rng: random.Random) -> None:
+        """
+        Draw decisions from a game's per-round stream.
+
+        Ignored when the player was constructed with its own rng, which always
+        takes precedence over the game's streams.
+        """
+        if not self._owns_rng:
+            self.rng = rng
+
+    def start_planning(self, game) -> None:
+        """
+        Start background work for a hand once its cards are dealt.
+
+        The default does nothing; LLM agents start generating their plan so it is
+        ready, or nearly so, by their turn.
+        """
+
+    async def decide_action_async(self, game) -> ActionDecision:
+        """
+        Awaitable form of decide_action(), used by the asyncio game loop.
+
+        The default runs decide_action() inline; players that wait on I/O, such
+        as LLM agents, override it so other tables run while they wait.
+        """
+        return self.decide_action(game)
+
+    async def decide_discard_async(self):
+        """Awaitable form of decide_discard(); the default runs it inline."""
+        return self.decide_discard()
+
     def _raise(self, amount: int, game) -> None:
         """Handle raise action with proper all-in logic."""
         # Get current raise count and minimum bet
@@ -226,9 +274,14 @@ class Player:
             self.name, value.name, old_position.name if old_position else None
         )
 
-    def get_state(self) -> PlayerState:
-        """Get the current state of this player."""
-        return PlayerState.from_player(self)
+    def get_state(self, position: Optional[PlayerPosition] = None) -> PlayerState:
+        """Get the current state of this player.
+
+        Args:
+            position: Position to report instead of the player's own, e.g. one
+                derived from the dealer button
+        """
+        return PlayerState.from_player(self, position=position)
 
     def __str__(self) -> str:
         """
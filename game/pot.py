@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from data.types.pot_types import PotState, SidePot
 from exceptions import InvalidGameStateError
@@ -20,10 +20,19 @@ class Pot:
     - Pot state can be validated at any time
     - Chip movements are properly logged for debugging
 
+    Chips placed through Player.place_bet are recorded in a per-player
+    contribution ledger in O(1). Side pots are derived from the ledger's sorted
+    contribution levels only when side_pots is read, and the result is cached
+    until the ledger or a contributor's fold status changes. Derived side pots
+    split the main pot rather than adding to it.
+
     Attributes:
         pot (int): Current amount in the main pot
         side_pots (List[SidePot]): List of active side pots, if any.
             Empty list indicates calculation returned no side pots.
+        contributions (Dict[Player, int]): Chips each player has put in this hand
+        validate_chips (bool): Whether side pot calculations raise on chip
+            mismatches, rather than only asserting
 
     Usage:
         pot = Pot()
@@ -31,8 +40,9 @@ class Pot:
         # Add chips to main pot
         pot.add_to_pot(100)
 
-        # Calculate side pots when players go all-in
-        side_pots = pot.calculate_side_pots(active_players)
+        # Record a player's chips; side pots follow from the ledger
+        pot.add_contribution(player, 100)
+        side_pots = pot.side_pots
 
         # Get formatted view of side pots
         pot_view = pot.get_side_pots_view()
@@ -47,10 +57,67 @@ class Pot:
         - Pot state can be restored from saved game state using set_pots()
     """
 
-    def __init__(self) -> None:
-        """Initialize a new pot instance with empty pot and no side pots."""
+    def __init__(self, validate_chips: bool = True) -> None:
+        """Initialize a new pot instance with empty pot and no side pots.
+
+        Args:
+            validate_chips: Check chip conservation after every side pot
+                calculation. When False, the check is only an assertion, which
+                is compiled out under python -O.
+        """
         self.pot: int = 0
+        self._contributions: Dict[Player, int] = {}
+        # (fold status of each contributor, side pots) from the last derivation
+        self._derived: Optional[Tuple[Tuple[bool, ...], List[SidePot]]] = None
         self.side_pots: List[SidePot] = []
+        self.validate_chips = validate_chips
+        # (main pot, side pots list, state) from the last get_state
+        self._state: Optional[Tuple[int, List[SidePot], PotState]] = None
+
+    @property
+    def side_pots(self) -> List[SidePot]:
+        """Side pots derived from the contribution ledger, or as last assigned.
+
+        While the ledger has entries, the pots split the chips it records by
+        contribution level. Consecutive levels with the same eligible players
+        share a pot, and chips above every live player's contribution join the
+        pot below them.
+        """
+        if not self._contributions:
+            return self._side_pots
+
+        folded = tuple(p.folded for p in self._contributions)
+        if self._derived is None or self._derived[0] != folded:
+            self._derived = (folded, _build_side_pots(self._contributions))
+        return self._derived[1]
+
+    @side_pots.setter
+    def side_pots(self, side_pots: List[SidePot]) -> None:
+        # Explicit side pots replace the ledger until the next contribution
+        self._side_pots = side_pots
+        self._contributions = {}
+        self._derived = None
+
+    @property
+    def contributions(self) -> Dict[Player, int]:
+        """Chips each player has put into the pot this hand."""
+        return self._contributions
+
+    def add_contribution(self, player: Player, amount: int) -> None:
+        """
+        Add a player's chips to the pot and record them in the ledger.
+
+        Args:
+            player (Player): Player putting the chips in
+            amount (int): Amount of chips. Must be non-negative.
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        self.add_to_pot(amount)
+        if amount:
+            self._contributions[player] = self._contributions.get(player, 0) + amount
+            self._derived = None
 
     def add_to_pot(self, amount: int) -> None:
         """
@@ -95,7 +162,11 @@ class Pot:
 
     def calculate_side_pots(self, active_players: List[Player]) -> List[SidePot]:
         """
-        Calculate side pots when one or more players is all-in.
+        Calculate side pots from players' current bets.
+
+        Games do not need this, as side pots follow from the contribution ledger.
+        It serves callers that track bets outside the ledger, and replaces the
+        ledger with the explicit side pots it returns.
 
         This method should be called BEFORE end_betting_round, while player.bet values
         are still set. The method calculates pot distributions but does not modify
@@ -130,21 +201,6 @@ class Pot:
             self.side_pots = []
             return []
 
-        # Track total chips in play before calculation
-        total_chips_before = (
-            sum(p.chips + p.bet for p in active_players)  # Current chips + bets
-            + self.pot  # Main pot
-            + sum(pot.amount for pot in self.side_pots)  # Side pots
-        )
-
-        # Add validation before processing
-        total_bets = sum(p.bet for p in active_players)
-        if total_bets == 0:
-            PotLogger.log_pot_validation_info(
-                "No bets to process, returning existing side pots"
-            )
-            return self.side_pots
-
         # Create dictionary of all bets from players who contributed
         posted_amounts = {
             p: p.bet
@@ -153,70 +209,21 @@ class Pot:
         }
         if not posted_amounts:
             PotLogger.log_pot_validation_info(
-                "No posted amounts, returning existing side pots"
+                "No bets to process, returning existing side pots"
             )
             return self.side_pots
 
         # Keep track of existing side pots
         existing_pots = self.side_pots
+        total_bets = sum(posted_amounts.values())
 
-        # Calculate new side pots from current bets
-        new_side_pots = []
-        current_amount = 0
-
-        # Sort players by their bet amounts
-        sorted_players = sorted(posted_amounts.items(), key=lambda x: x[1])
-
-        # Track processed amounts to avoid double counting
-        processed_amounts = {}
-
-        for player, amount in sorted_players:
-            if amount > current_amount:
-                # Players are eligible if they:
-                # 1. Bet at least this amount
-                # 2. Haven't folded
-                eligible = [
-                    p
-                    for p, bet in posted_amounts.items()
-                    if bet >= amount and not p.folded
-                ]
-
-                # Calculate pot size for this level
-                contribution = amount - current_amount
-                contributors = sum(
-                    1 for bet in posted_amounts.values() if bet >= amount
-                )
-                pot_size = contribution * contributors
-
-                # Only create a new side pot if it would have a positive amount
-                # and hasn't been processed at this level
-                if pot_size > 0 and amount not in processed_amounts:
-                    # Always create new pots for current betting round
-                    new_side_pots.append(
-                        SidePot(
-                            amount=pot_size, eligible_players=[p.name for p in eligible]
-                        )
-                    )
-                    PotLogger.log_new_side_pot(pot_size, [p.name for p in eligible])
-                    processed_amounts[amount] = pot_size
-
-                current_amount = amount
-
-        # Merge pots with identical eligible players
-        merged_pots = {}
-        # First add existing pots to merged_pots
-        if existing_pots:
-            for existing_pot in existing_pots:
-                key = frozenset(existing_pot.eligible_players)
-                if key not in merged_pots:
-                    merged_pots[key] = existing_pot.amount
-                else:
-                    merged_pots[key] += existing_pot.amount
-                    PotLogger.log_pot_merge(existing_pot.amount, list(key))
-
-        # Then merge new pots, combining with existing ones if they have same eligible players
+        new_side_pots = _build_side_pots(posted_amounts)
         for side_pot in new_side_pots:
-            # Use frozenset of eligible players as key for merging
+            PotLogger.log_new_side_pot(side_pot.amount, side_pot.eligible_players)
+
+        # Merge pots with identical eligible players, existing pots first
+        merged_pots = {}
+        for side_pot in existing_pots + new_side_pots:
             key = frozenset(side_pot.eligible_players)
             if key not in merged_pots:
                 merged_pots[key] = side_pot.amount
@@ -226,13 +233,17 @@ class Pot:
 
         # Convert merged pots to final format
         final_pots = [
-            SidePot(amount=amount, eligible_players=sorted(list(players)))
+            SidePot(amount=amount, eligible_players=sorted(players))
             for players, amount in merged_pots.items()
         ]
 
         # Verify all current bets were processed before combining with existing pots
         total_in_new_pots = sum(pot.amount for pot in final_pots)
-        if total_in_new_pots != total_bets + sum(p.amount for p in existing_pots):
+        if not self.validate_chips:
+            assert total_in_new_pots == total_bets + sum(
+                p.amount for p in existing_pots
+            ), f"Not all bets processed: bets={total_bets}, pots={total_in_new_pots}"
+        elif total_in_new_pots != total_bets + sum(p.amount for p in existing_pots):
             PotLogger.log_pot_validation_error(
                 total_bets=total_bets,
                 total_in_pots=total_in_new_pots,
@@ -245,7 +256,8 @@ class Pot:
             )
 
         # Validate chip consistency
-        self.validate_chip_consistency(active_players, final_pots)
+        if self.validate_chips:
+            self.validate_chip_consistency(active_players, final_pots)
 
         self.side_pots = final_pots
         return final_pots
@@ -345,9 +357,7 @@ class Pot:
         total_chips = sum(p.chips for p in active_players)
 
         # Calculate total in pots
-        total_in_pots = self.pot
-        if self.side_pots:
-            total_in_pots += sum(pot.amount for pot in self.side_pots)
+        total_in_pots = self.pot + self._chips_outside_main_pot()
 
         # Calculate total bets in current round
         total_bets = sum(p.bet for p in active_players)
@@ -411,12 +421,32 @@ class Pot:
         PotLogger.log_betting_round_end(self.pot)
 
     def get_state(self) -> PotState:
-        """Get the current state of all pots."""
-        return PotState(
+        """Get the current state of all pots.
+
+        The state is cached and the same instance returned until the main pot
+        or the side pots change, so treat it as read-only.
+        """
+        side_pots = self.side_pots
+        cached = self._state
+        if cached is not None and cached[0] == self.pot and cached[1] is side_pots:
+            return cached[2]
+
+        state = PotState(
             main_pot=self.pot,
-            side_pots=self.side_pots,
-            total_pot=self.pot + sum(pot.amount for pot in self.side_pots),
+            side_pots=side_pots,
+            total_pot=self.pot + self._chips_outside_main_pot(),
         )
+        self._state = (self.pot, side_pots, state)
+        return state
+
+    def _chips_outside_main_pot(self) -> int:
+        """Chips held in side pots on top of the main pot.
+
+        Ledger-derived side pots split the main pot itself, so they add nothing.
+        """
+        if self._contributions or not self.side_pots:
+            return 0
+        return sum(pot.amount for pot in self.side_pots)
 
     def validate_chip_consistency(
         self, active_players: List[Player], final_pots: List[SidePot]
@@ -465,3 +495,34 @@ class Pot:
             raise InvalidGameStateError(
                 f"Chip total mismatch: before={total_chips_before}, after={total_chips_after}"
             )
+
+
+def _build_side_pots(contributions: Dict[Player, int]) -> List[SidePot]:
+    """
+    Split contributions into pots by contribution level, smallest level first.
+
+    Each level's pot takes the step up from the previous level from every player
+    who reached it, and is open to the players at that level who have not folded.
+    Consecutive levels with the same eligible players share a pot. Chips above
+    every live player's contribution go to the pot below them.
+
+    Args:
+        contributions: Chips put in by each player, zero amounts excluded
+
+    Returns:
+        List[SidePot]: Pots with eligible player names in sorted order
+    """
+    ordered = sorted(contributions.items(), key=lambda item: item[1])
+    pots: List[SidePot] = []
+    previous = 0
+    for i, (_, level) in enumerate(ordered):
+        if level == previous:
+            continue
+        amount = (level - previous) * (len(ordered) - i)
+        eligible = sorted(p.name for p, _ in ordered[i:] if not p.folded)
+        previous = level
+        if pots and (not eligible or pots[-1].eligible_players == eligible):
+            pots[-1].amount += amount
+        else:
+            pots.append(SidePot(amount=amount, eligible_players=eligible))
+    return pots
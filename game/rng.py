@@ -0,0 +1,90 @@
+import random
+import zlib
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+StreamKey = Union[int, str]
+
+
+class GameRNG:
+    """
+    A seeded random stream that splits deterministically into child streams.
+
+    Built on NumPy's SeedSequence: every stream is identified by the root seed
+    and a path of keys, e.g. ("table", 2, "hand", 17, "deck"). The same path
+    always yields the same numbers. Streams with different paths are
+    statistically independent, so parallel workers can share a root seed and
+    still draw from separate streams.
+
+    Each stream offers a NumPy Generator (for the deck and vectorized sampling)
+    and a random.Random (for agents written against the random module API).
+
+    Attributes:
+        seed (int): Root entropy; pass it back in to replay a game exactly
+        path (Tuple[int, ...]): Spawn key of this stream below the root
+
+    Example:
+        >>> rng = GameRNG(42)
+        >>> deck_rng = rng.child("hand", 3, "deck")
+        >>> deck_rng.generator.integers(52) == GameRNG(42).child("hand", 3, "deck").generator.integers(52)
+        True
+    """
+
+    def __init__(
+        self, seed: Optional[int] = None, path: Tuple[StreamKey, ...] = ()
+    ) -> None:
+        """
+        Create a stream from a root seed.
+
+        Args:
+            seed: Root seed; None draws fresh entropy from the OS (available
+                afterwards as `seed`, so the run can still be replayed)
+            path: Keys identifying this stream below the root
+        """
+        self._sequence = np.random.SeedSequence(
+            seed, spawn_key=tuple(_stream_key(key) for key in path)
+        )
+        self.seed: int = self._sequence.entropy
+        self.path: Tuple[int, ...] = self._sequence.spawn_key
+        self._generator: Optional[np.random.Generator] = None
+        self._random: Optional[random.Random] = None
+
+    def child(self, *keys: StreamKey) -> "GameRNG":
+        """
+        Derive the stream at a path below this one.
+
+        Args:
+            *keys: Integers or strings, e.g. child("agent", "Alice")
+
+        Returns:
+            GameRNG: Independent stream, identical for identical paths
+        """
+        return GameRNG(self.seed, self.path + tuple(_stream_key(key) for key in keys))
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """NumPy Generator for this stream, created on first use."""
+        if self._generator is None:
+            self._generator = np.random.default_rng(self._sequence)
+        return self._generator
+
+    @property
+    def random(self) -> random.Random:
+        """random.Random for this stream, created on first use."""
+        if self._random is None:
+            state = self._sequence.generate_state(4, dtype=np.uint64)
+            self._random = random.Random(int.from_bytes(state.tobytes(), "little"))
+        return self._random
+
+    def __repr__(self) -> str:
+        return f"GameRNG(seed={self.seed}, path={self.path})"
+
+
+def _stream_key(key: StreamKey) -> int:
+    """Map a stream key to a stable non-negative integer (str hashes vary per run)."""
+    if isinstance(key, str):
+        return zlib.crc32(key.encode("utf-8"))
+    if key < 0:
+        raise ValueError("Stream keys must be non-negative")
+    return int(key)
@@ -1,7 +1,8 @@
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
 
 from data.types.hand_rank import HandRank
 from data.types.pot_types import SidePot
+from loggers.config import loggers_silenced
 from loggers.showdown_logger import ShowdownLogger
 
 from .player import Player
@@ -42,6 +43,10 @@ def handle_showdown(
     """
     Handle the showdown phase where winners are determined and pots are distributed.
 
+    Live hands are ranked once by strength key. The pots are then paid from the
+    smallest contribution level up, each to the best hand(s) eligible for it.
+    Split pots give their odd chips to the winners earliest in seat order.
+
     Args:
         players: List of active players
         initial_chips: Dictionary of starting chip counts for each player
@@ -55,8 +60,9 @@ def handle_showdown(
 
     # Log showdown hands
     ShowdownLogger.log_showdown_start()
-    for player in active_players:
-        ShowdownLogger.log_player_hand(player.name, player.hand.show())
+    if not loggers_silenced():
+        for player in active_players:
+            ShowdownLogger.log_player_hand(player.name, player.hand.show())
 
     # Get total pot - just use pot.pot since it already includes all bets
     total_pot = pot.pot
@@ -66,22 +72,17 @@ def handle_showdown(
         winner = active_players[0]
         winner.chips += total_pot
         ShowdownLogger.log_single_winner(winner.name, total_pot)
-    else:
-        # Multiple players - determine winner(s)
-        winners = _evaluate_hands(active_players)
-        if winners:
-            split_amount = total_pot // len(winners)
-            remainder = total_pot % len(winners)
-
-            # Distribute split amount and remainder
-            for i, winner in enumerate(winners):
-                amount = split_amount
-                if i < remainder:  # Add extra chip for remainder
-                    amount += 1
-                winner.chips += amount
-                ShowdownLogger.log_pot_win(
-                    winner.name, amount, is_split=(len(winners) > 1)
+    elif active_players:
+        # Multiple players - rank once, then award each pot
+        ranked = _evaluate_hands(active_players)
+        seats = {player: seat for seat, player in enumerate(players)}
+        pots = _showdown_pots(pot, active_players)
+        for number, (amount, eligible) in enumerate(pots, 1):
+            if len(pots) > 1:
+                ShowdownLogger.log_side_pot_distribution(
+                    number, amount, sorted(eligible)
                 )
+            _award_pot(amount, _pot_winners(ranked, eligible), seats)
 
     # Clear any remaining bets
     for player in players:
@@ -95,22 +96,89 @@ def handle_showdown(
         ShowdownLogger.log_chip_movements(player.name, initial, player.chips)
 
 
-def _evaluate_hands(players: List[Player]) -> List[Player]:
+def _showdown_pots(pot: Pot, active_players: List[Player]) -> List[Tuple[int, Set[str]]]:
     """
-    Evaluate player hands to determine winner(s).
+    List the pots to award, smallest contribution level first.
+
+    Side pots come from the pot's contribution ledger. Chips in the main pot that
+    the ledger does not account for, such as ones added with add_to_pot, join the
+    first pot, which every live player is eligible for.
+
+    Returns:
+        List[Tuple[int, Set[str]]]: (amount, eligible player names) for each pot
+    """
+    live = {player.name for player in active_players}
+    pots = []
+    if pot.contributions:
+        pots = [
+            (side_pot.amount, set(side_pot.eligible_players) & live)
+            for side_pot in pot.side_pots
+        ]
+
+    unaccounted = max(pot.pot - sum(amount for amount, _ in pots), 0)
+    if pots and pots[0][1] == live:
+        pots[0] = (pots[0][0] + unaccounted, live)
+    elif unaccounted:
+        pots.insert(0, (unaccounted, live))
+    return [(amount, eligible) for amount, eligible in pots if amount > 0]
+
+
+def _pot_winners(ranked: List[Tuple[int, Player]], eligible: Set[str]) -> List[Player]:
+    """
+    Return the best-ranked players eligible for a pot, all of them on a tie.
+
+    A pot none of whose contributors is still live goes to the best live hand.
+    """
+    if not any(player.name in eligible for _, player in ranked):
+        eligible = {player.name for _, player in ranked}
+    winners = []
+    for strength, player in ranked:
+        if player.name not in eligible:
+            continue
+        if winners and strength != winners[0][0]:
+            break
+        winners.append((strength, player))
+    return [player for _, player in winners]
+
+
+def _award_pot(amount: int, winners: List[Player], seats: Dict[Player, int]) -> None:
+    """Split a pot between its winners, odd chips going first in seat order."""
+    winners = sorted(winners, key=lambda player: seats.get(player, 0))
+    split_amount, remainder = divmod(amount, len(winners))
+
+    # Distribute split amount and remainder
+    for i, winner in enumerate(winners):
+        share = split_amount + (1 if i < remainder else 0)
+        winner.chips += share
+        ShowdownLogger.log_pot_win(winner.name, share, is_split=(len(winners) > 1))
+
+
+def _evaluate_hands(players: List[Player]) -> List[Tuple[int, Player]]:
+    """
+    Rank player hands from best to worst in a single pass over strength keys.
 
     Args:
         players: List of players to evaluate
 
     Returns:
-        List[Player]: List of winning players (multiple in case of tie)
+        List[Tuple[int, Player]]: (strength, player) pairs, strongest first. Tied
+            hands keep their seat order.
     """
-    if not players:
-        return []
+    ranked = sorted(
+        ((player.hand.strength, player) for player in players),
+        key=lambda entry: entry[0],
+        reverse=True,
+    )
+    if ranked and not loggers_silenced():
+        _log_hand_evaluations(ranked)
+    return ranked
 
-    # Log detailed hand evaluations for debugging
-    for player in players:
-        rank, tiebreakers, description = player.hand.evaluate()
+
+def _log_hand_evaluations(ranked: List[Tuple[int, Player]]) -> None:
+    """Log each hand's evaluation, and each other hand against the best one."""
+    evaluations = {player: player.hand.evaluate() for _, player in ranked}
+    for _, player in ranked:
+        rank, tiebreakers, description = evaluations[player]
         ShowdownLogger.log_hand_evaluation(
             player.name,
             [str(card) for card in player.hand.cards],
@@ -119,31 +187,12 @@ def _evaluate_hands(players: List[Player]) -> List[Player]:
             tiebreakers,
         )
 
-    # Find best hand(s)
-    best_players = [players[0]]
-    best_hand = players[0].hand
-
-    for player in players[1:]:
-        comparison = player.hand.compare_to(best_hand)
-        if comparison > 0:  # Current player has better hand
-            best_players = [player]
-            best_hand = player.hand
-        elif comparison == 0:  # Tie
-            best_players.append(player)
-
-        # Log comparison with all required parameters
-        _, _, player_desc = player.hand.evaluate()
-        _, _, best_desc = best_hand.evaluate()
-
-        # If comparison > 0, current player's hand is better
-        # If comparison == 0, it's a tie
-        # If comparison < 0, best_hand is better
+    best_strength, best_player = ranked[0]
+    for strength, player in ranked[1:]:
         ShowdownLogger.log_hand_comparison(
-            winner_name=best_players[0].name,  # Current best hand owner
-            loser_name=player.name,  # Current player being compared
-            comparison=comparison,
-            winner_hand=best_desc,
-            loser_hand=player_desc,
+            winner_name=best_player.name,
+            loser_name=player.name,
+            comparison=strength - best_strength,
+            winner_hand=evaluations[best_player].description,
+            loser_hand=evaluations[player].description,
         )
-
-    return best_players
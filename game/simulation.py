@@ -0,0 +1,407 @@
+import logging
+import queue
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from multiprocessing import Manager
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from loggers.config import silenced_loggers
+
+from .audit import ChipAuditor
+from .config import GameConfig
+from .deck import DeckFactory
+from .game import AgenticPoker
+from .player import Player
+from .rng import GameRNG
+
+# Most deck orders a game's DeckFactory stages at once
+DECK_BATCH = 256
+
+# Seconds iter_hands waits on the hand queue before checking its workers
+HAND_POLL_INTERVAL = 0.1
+
+
+@dataclass(frozen=True)
+class PlayerSpec:
+    """
+    Recipe for a simulated player, rebuilt inside each worker process.
+
+    Attributes:
+        name (str): Player name, also the key into the agent configurations
+        chips (int): Starting chips
+        agent (str): "random" for a RandomAgent, "agent" for an LLM Agent
+        options (Dict[str, Any]): Extra keyword arguments for the agent class
+    """
+
+    name: str
+    chips: int = 1000
+    agent: str = "random"
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+class HandResult(NamedTuple):
+    """Chip change of every roster player in one hand, in roster order."""
+
+    game_index: int
+    round_number: int
+    deltas: Tuple[int, ...]
+
+
+@dataclass
+class GameResult:
+    """
+    Outcome of one simulated game.
+
+    Attributes:
+        game_index (int): Index of the game in the simulation
+        rounds (int): Rounds started before the game ended
+        final_chips (Tuple[int, ...]): Chips of every roster player, in roster order
+        hands (List[HandResult]): Per-hand chip changes; empty when the hands
+            were streamed to a queue instead
+    """
+
+    game_index: int
+    rounds: int
+    final_chips: Tuple[int, ...]
+    hands: List[HandResult] = field(default_factory=list)
+
+
+@dataclass
+class SimulationSummary:
+    """
+    Aggregate of many simulated games.
+
+    Attributes:
+        names (List[str]): Roster player names; per-player fields follow this order
+        games (int): Games played
+        hands (int): Hands played across all games
+        chip_deltas (List[int]): Net chips won or lost by each player
+        wins (List[int]): Games each player finished as chip leader, ties excluded
+    """
+
+    names: List[str]
+    games: int = 0
+    hands: int = 0
+    chip_deltas: List[int] = field(default_factory=list)
+    wins: List[int] = field(default_factory=list)
+
+    def add(self, result: GameResult, starting_chips: Sequence[int]) -> None:
+        """Fold one game's result into the totals."""
+        if not self.chip_deltas:
+            self.chip_deltas = [0] * len(self.names)
+            self.wins = [0] * len(self.names)
+        self.games += 1
+        self.hands += len(result.hands)
+        for i, (final, start) in enumerate(zip(result.final_chips, starting_chips)):
+            self.chip_deltas[i] += final - start
+        best = max(result.final_chips)
+        if result.final_chips.count(best) == 1:
+            self.wins[result.final_chips.index(best)] += 1
+
+    def chips_per_hand(self) -> Dict[str, float]:
+        """Average chips won per hand played, by player name."""
+        hands = max(self.hands, 1)
+        return {name: delta / hands for name, delta in zip(self.names, self.chip_deltas)}
+
+
+class HandRecorder(ChipAuditor):
+    """
+    Chip auditor that also records each hand's chip changes.
+
+    It plugs into the same round boundaries as ChipAuditor: the stacks before
+    blinds and antes are taken when a hand begins, and the deltas when it ends.
+    Sampled hands are still audited.
+
+    Attributes:
+        players (List[Player]): Roster players, in the order deltas are recorded
+        game_index (int): Index stamped on every HandResult
+        hands (List[HandResult]): Results of the hands played so far, unless
+            they are sent to a sink
+    """
+
+    def __init__(
+        self,
+        players: List[Player],
+        game_index: int,
+        every: int = 0,
+        sink: Optional[Any] = None,
+    ) -> None:
+        """
+        Create a recorder for a roster.
+
+        Args:
+            players: Roster players, in the order deltas are recorded
+            game_index: Index stamped on every HandResult
+            every: Audit every Nth hand, as for ChipAuditor; 0 disables auditing
+            sink: Queue that receives each HandResult as its hand ends, in place
+                of the hands list
+        """
+        super().__init__(every)
+        self.players = list(players)
+        self.game_index = game_index
+        self.hands: List[HandResult] = []
+        self._sink = sink
+        self._stacks: Tuple[int, ...] = ()
+
+    def begin_hand(self, game: AgenticPoker) -> None:
+        """Record the stacks every player started the hand with."""
+        super().begin_hand(game)
+        starting = game.round_starting_stacks
+        self._stacks = tuple(starting.get(p, p.chips) for p in self.players)
+
+    def end_hand(self, game: AgenticPoker) -> None:
+        """Record each player's chip change over the hand."""
+        super().end_hand(game)
+        deltas = tuple(p.chips - s for p, s in zip(self.players, self._stacks))
+        hand = HandResult(self.game_index, game.round_number, deltas)
+        if self._sink is not None:
+            self._sink.put(hand)
+        else:
+            self.hands.append(hand)
+
+
+def build_player(spec: PlayerSpec, agent_configs: Dict[str, Any]) -> Player:
+    """
+    Create the player a spec describes.
+
+    Args:
+        spec: Player recipe
+        agent_configs: Agent configurations by name, as in agent_configs.json
+
+    Returns:
+        Player: RandomAgent or Agent with the spec's name and chips
+
+    Raises:
+        ValueError: If the agent type is unknown
+    """
+    if spec.agent == "random":
+        from agents.random_agent import RandomAgent
+
+        return RandomAgent(spec.name, chips=spec.chips, **spec.options)
+    if spec.agent == "agent":
+        from agents.agent import Agent
+
+        return Agent(
+            spec.name,
+            chips=spec.chips,
+            config=agent_configs.get(spec.name),
+            **spec.options,
+        )
+    raise ValueError(f"Unknown agent type: {spec.agent}")
+
+
+def roster_from_configs(
+    agent_configs: Dict[str, Any], agent: str = "random", chips: int = 1000
+) -> List[PlayerSpec]:
+    """
+    Build a roster with one player per entry in the agent configurations.
+
+    Args:
+        agent_configs: Agent configurations by name, as in agent_configs.json
+        agent: Agent type for every player, "random" or "agent"
+        chips: Starting chips for every player
+
+    Returns:
+        List[PlayerSpec]: Player specs in configuration order
+    """
+    roster = []
+    for name, entry in agent_configs.items():
+        options = {}
+        if agent == "agent" and isinstance(entry, dict) and "strategy_style" in entry:
+            options["strategy_style"] = entry["strategy_style"]
+        roster.append(PlayerSpec(name=name, chips=chips, agent=agent, options=options))
+    return roster
+
+
+def play_simulated_game(
+    game_index: int,
+    seed: int,
+    roster: Sequence[PlayerSpec],
+    config: GameConfig,
+    agent_configs: Optional[Dict[str, Any]] = None,
+    hand_sink: Optional[Any] = None,
+) -> GameResult:
+    """
+    Play one headless game and collect its per-hand results.
+
+    The game draws from GameRNG(seed).child("game", game_index), so its result
+    depends only on the seed and index, not on which worker plays it. Its deck
+    orders are staged in batches by a DeckFactory on the game's "decks" stream.
+
+    Args:
+        game_index: Index of the game in the simulation
+        seed: Root seed of the simulation
+        roster: Players to seat, in seat order
+        config: Game configuration; played headless whatever its setting
+        agent_configs: Agent configurations by name for "agent" specs
+        hand_sink: Queue to put each HandResult on as its hand ends; the
+            returned GameResult then carries no hands
+
+    Returns:
+        GameResult: Final chips and per-hand chip changes
+    """
+    config = replace(config, headless=True, seed=None)
+    rng = GameRNG(seed).child("game", game_index)
+    with silenced_loggers():
+        players = [build_player(spec, agent_configs or {}) for spec in roster]
+        recorder = HandRecorder(
+            players, game_index, every=config.audit_every or 0, sink=hand_sink
+        )
+        game = AgenticPoker(
+            list(players),  # The table drops eliminated players from its list
+            config=config,
+            rng=rng,
+            auditor=recorder,
+            deck_provider=DeckFactory(
+                rng.child("decks").generator,
+                batch_size=min(config.max_rounds or DECK_BATCH, DECK_BATCH),
+            ),
+        )
+        game.play_game()
+    return GameResult(
+        game_index=game_index,
+        rounds=game.round_number,
+        final_chips=tuple(p.chips for p in players),
+        hands=recorder.hands,
+    )
+
+
+def iter_simulations(
+    num_games: int,
+    roster: Sequence[PlayerSpec],
+    config: Optional[GameConfig] = None,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    agent_configs: Optional[Dict[str, Any]] = None,
+) -> Iterator[GameResult]:
+    """
+    Play independent games across a process pool, yielding results as they finish.
+
+    Results are per game: each GameResult arrives once its whole game is over,
+    carrying that game's hands. Use iter_hands() to receive hands as they are
+    played.
+
+    Every worker builds its own players from the roster and plays headless: no
+    database client, no logging and a separate random stream per game. Results
+    therefore arrive in completion order, but each one is identical to what a
+    single process would produce for the same seed and game index.
+
+    Args:
+        num_games: Number of games to play
+        roster: Players to seat in every game, in seat order
+        config: Game configuration shared by every game
+        seed: Root seed of the simulation
+        max_workers: Worker processes; None uses one per CPU
+        agent_configs: Agent configurations by name for "agent" specs
+
+    Yields:
+        GameResult: Result of each game as its worker finishes it
+    """
+    config = config or GameConfig()
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        futures = [
+            executor.submit(
+                play_simulated_game, index, seed, roster, config, agent_configs
+            )
+            for index in range(num_games)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def iter_hands(
+    num_games: int,
+    roster: Sequence[PlayerSpec],
+    config: Optional[GameConfig] = None,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    agent_configs: Optional[Dict[str, Any]] = None,
+) -> Iterator[HandResult]:
+    """
+    Play independent games across a process pool, yielding each hand as it ends.
+
+    The games are the ones iter_simulations() plays, but workers put every
+    HandResult on a shared queue as soon as the hand is over, so results
+    stream back while games are still running. Hands of different games
+    interleave; each carries its game index and round number.
+
+    Args:
+        num_games: Number of games to play
+        roster: Players to seat in every game, in seat order
+        config: Game configuration shared by every game
+        seed: Root seed of the simulation
+        max_workers: Worker processes; None uses one per CPU
+        agent_configs: Agent configurations by name for "agent" specs
+
+    Yields:
+        HandResult: Chip changes of each hand as its worker finishes it
+
+    Raises:
+        Exception: Whatever a worker raised while playing its game
+    """
+    config = config or GameConfig()
+    with Manager() as manager, ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker
+    ) as executor:
+        hands = manager.Queue()
+        running = {
+            executor.submit(
+                play_simulated_game, index, seed, roster, config, agent_configs, hands
+            )
+            for index in range(num_games)
+        }
+        while running:
+            try:
+                yield hands.get(timeout=HAND_POLL_INTERVAL)
+                continue
+            except queue.Empty:
+                pass
+            finished = {future for future in running if future.done()}
+            for future in finished:
+                future.result()  # Surface a worker's exception
+            running -= finished
+
+        # Every game has returned, so whatever is left is already queued
+        while True:
+            try:
+                yield hands.get_nowait()
+            except queue.Empty:
+                return
+
+
+def simulate(
+    num_games: int,
+    roster: Sequence[PlayerSpec],
+    config: Optional[GameConfig] = None,
+    seed: int = 0,
+    max_workers: Optional[int] = None,
+    agent_configs: Optional[Dict[str, Any]] = None,
+) -> SimulationSummary:
+    """
+    Play independent games across a process pool and aggregate the results.
+
+    Args:
+        num_games: Number of games to play
+        roster: Players to seat in every game, in seat order
+        config: Game configuration shared by every game
+        seed: Root seed of the simulation
+        max_workers: Worker processes; None uses one per CPU
+        agent_configs: Agent configurations by name for "agent" specs
+
+    Returns:
+        SimulationSummary: Chip and win totals per player
+    """
+    summary = SimulationSummary(names=[spec.name for spec in roster])
+    starting_chips = [spec.chips for spec in roster]
+    for result in iter_simulations(
+        num_games, roster, config, seed, max_workers, agent_configs
+    ):
+        summary.add(result, starting_chips)
+    return summary
+
+
+def _init_worker() -> None:
+    """Detach a worker from handlers inherited from the parent, e.g. poker_game.log."""
+    logging.disable(logging.CRITICAL)
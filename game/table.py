@@ -8,11 +8,12 @@ The Table class handles:
 - Turn progression during betting rounds
 """
 
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
 
 from data.enums import ActionType
 from data.types.action_decision import ActionDecision
 from game.player import Player
+from loggers.config import loggers_silenced
 from loggers.table_logger import TableLogger
 
 if TYPE_CHECKING:
@@ -40,6 +41,18 @@ class Table:
         last_raiser (Optional[Player]): The last player who raised in the current round
         current_bet (int): The current bet amount that players need to call
         action_tracking (List[ActionDecision]): List tracking all actions in the current round
+
+    Turn order runs over a ring of active seats. Each seat links to the next seat
+    that may still be active, with path compression, and the ring keeps a count of
+    its seats. A seat leaves the ring when its player folds or runs out of chips,
+    either when the table sees the action or when rotation reaches the seat. The
+    ring is rebuilt at the start of each betting round and whenever the players
+    change. Alongside it the table keeps the set of ring players who had not
+    matched the current bet when last seen; it is refilled only when the bet
+    changes and shrinks as players act, so next-player lookup and
+    round-completion checks are O(1) amortized. The active and all-in counts come
+    from the ring count and a set of all-in players updated on the same
+    transitions, so they reflect state changes once the table has seen them.
     """
 
     def __init__(self, players: List[Player]):
@@ -61,6 +74,30 @@ class Table:
         self.action_tracking = []
         TableLogger.log_table_creation(len(players))
 
+    @property
+    def players(self) -> List[Player]:
+        """Players at the table, in seating order."""
+        return self._players
+
+    @players.setter
+    def players(self, players: List[Player]) -> None:
+        self._players = players
+        self._link: List[int] = []
+        self._unmatched: Set[Player] = set()
+        self._all_in: Set[Player] = set()
+        self._ring_stale = True  # Built on first use, as player states may change
+
+    @property
+    def current_bet(self) -> int:
+        """The current bet amount that players need to call."""
+        return self._current_bet
+
+    @current_bet.setter
+    def current_bet(self, amount: int) -> None:
+        self._current_bet = amount
+        if not self._ring_stale:
+            self._collect_unmatched()
+
     def update(self, action_decision: ActionDecision, agent: "Agent") -> None:
         """Update the table state based on the agent's action decision."""
         self.mark_player_acted(agent, action_decision)
@@ -76,31 +113,21 @@ class Table:
             Optional[Player]: The next active player who can take an action.
                             Returns None if no active players remain.
         """
-        if not self.active_players():
+        self._ensure_ring()
+
+        if self.index >= len(self.players):
+            self.index = 0
+        seat = self._next_active_seat(self.index)
+        if seat is None:
             return None
 
-        # Find next active player
-        start_index = self.index  # Remember where we started
-        while True:
-            if self.index >= len(self.players):
-                self.index = 0
-            player = self.players[self.index]
-
-            # Only increment after we've checked the current player
-            if player in self.active_players():
-                self.index = (self.index + 1) % len(
-                    self.players
-                )  # Increment for next time
-                TableLogger.log_next_player(
-                    player.name, self.index - 1, [p.name for p in self.needs_to_act]
-                )
-                return player
-
-            self.index = (self.index + 1) % len(self.players)
-
-            # If we've gone full circle without finding an active player
-            if self.index == start_index:
-                return None
+        player = self.players[seat]
+        self.index = (seat + 1) % len(self.players)  # Increment for next time
+        if not loggers_silenced():
+            TableLogger.log_next_player(
+                player.name, seat, [p.name for p in self.needs_to_act]
+            )
+        return player
 
     def is_round_complete(self) -> Tuple[bool, str]:
         """Determine if the current betting round is complete.
@@ -118,39 +145,50 @@ class Table:
                 - bool: True if round is complete, False otherwise
                 - str: A message explaining why the round is complete or not
         """
-        active_players = self.active_players()
+        self._ensure_ring()
 
         # If only one player remains, round is complete
-        if len(active_players) <= 1:
+        first = self._next_active_seat(0)
+        if first is None or first == self._next_active_seat(
+            (first + 1) % len(self._link)
+        ):
             return True, "only one active player"
 
         # Check if any player still needs to act
         if self.needs_to_act:
             return False, "players still need to act"
 
-        # Check if all active players have either called or are all-in
-        for player in active_players:
-            if not player.folded and not player.is_all_in:
-                if player.bet < self.current_bet:
-                    return False, "not all players have called"
+        # Check if all active players have either called or are all-in. Only
+        # players short of the bet when last seen can still be; drop the rest
+        for player in list(self._unmatched):
+            if self._is_unmatched(player):
+                return False, "not all players have called"
+            self._unmatched.discard(player)
 
         return True, "betting round complete"
 
     def get_active_count(self) -> int:
         """Get the number of active players (not folded, not all-in).
 
+        Read from the seat ring, so folds and all-ins count once the table has
+        seen them through mark_player_acted() or a betting-round reset.
+
         Returns:
             int: Number of active players
         """
-        return len(self.active_players())
+        self._ensure_ring()
+        return self._ring_count
 
     def get_all_in_count(self) -> int:
         """Get the number of all-in players.
 
+        Kept alongside the seat ring, with the same caveat as get_active_count().
+
         Returns:
             int: Number of all-in players
         """
-        return len(self.all_in_players())
+        self._ensure_ring()
+        return len(self._all_in)
 
     def get_folded_count(self) -> int:
         """Get the number of folded players.
@@ -160,9 +198,16 @@ class Table:
         """
         return len(self.folded_players())
 
+    def add_player(self, player: Player) -> None:
+        """Seat a player in the last seat, e.g. one moved from another table."""
+        self.players.append(player)
+        self._ring_stale = True
+        TableLogger.log_player_added(player.name)
+
     def remove_player(self, player: Player) -> None:
         """Remove a player from the table."""
         self.players.remove(player)
+        self._ring_stale = True
         TableLogger.log_player_removed(player.name)
 
     def mark_player_acted(
@@ -180,15 +225,28 @@ class Table:
         """
         self.needs_to_act.discard(player)
 
+        # Take the seat out of the ring if this action folded it or used its last chips
+        self._ensure_ring()
+        seat = self._seat_of.get(player)
+        if seat is not None and self._in_ring[seat] and not self._can_act(player):
+            self._retire_seat(seat)
+        if player.is_all_in:
+            self._all_in.add(player)
+
         if action_decision.action_type == ActionType.RAISE:
-            # Update current bet amount
+            # Update current bet amount; this re-collects the unmatched players
             self.current_bet = action_decision.raise_amount
             self.last_raiser = player
             # Everyone else needs to act again (except folded/all-in players)
-            self.needs_to_act = set(p for p in self.active_players() if p != player)
+            self.needs_to_act = set(p for p in self._ring_players() if p != player)
 
-        elif action_decision.action_type == ActionType.CALL:
-            player.bet = self.current_bet
+        else:
+            if action_decision.action_type == ActionType.CALL:
+                player.bet = self.current_bet
+            if self._is_unmatched(player):
+                self._unmatched.add(player)
+            else:
+                self._unmatched.discard(player)
 
         self.action_tracking.append(action_decision)
 
@@ -201,11 +259,13 @@ class Table:
 
     def reset_action_tracking(self) -> None:
         """Reset the action tracking for a new betting round (street)."""
-        self.needs_to_act = set(self.active_players())
+        self._rebuild_ring()
+        self.needs_to_act = set(self._ring_players())
         self.current_bet = 0
         self.last_raiser = None
 
-        TableLogger.log_action_tracking_reset([p.name for p in self.active_players()])
+        if not loggers_silenced():
+            TableLogger.log_action_tracking_reset([p.name for p in self.needs_to_act])
 
     def active_players(self) -> List[Player]:
         """Get the list of active players who can take actions.
@@ -218,10 +278,11 @@ class Table:
         Returns:
             List[Player]: List of players who can still act in the current hand
         """
-        active = [p for p in self.players if not p.folded and p.chips > 0]
-        TableLogger.log_table_state(
-            len(active), len(self.all_in_players()), len(self.folded_players())
-        )
+        active = [p for p in self.players if self._can_act(p)]
+        if not loggers_silenced():
+            TableLogger.log_table_state(
+                len(active), len(self.all_in_players()), len(self.folded_players())
+            )
         return active
 
     def inactive_players(self) -> List[Player]:
@@ -253,6 +314,85 @@ class Table:
         """
         return [p for p in self.players if p.folded]
 
+    @staticmethod
+    def _can_act(player: Player) -> bool:
+        """Whether a player belongs in the active-seat ring."""
+        return not player.folded and player.chips > 0
+
+    def _ensure_ring(self) -> None:
+        """Rebuild the ring if the players changed since it was built."""
+        if self._ring_stale or len(self._link) != len(self._players):
+            self._rebuild_ring()
+
+    def _rebuild_ring(self) -> None:
+        """Rebuild the active-seat ring from the current player states."""
+        players = self._players
+        self._seat_of: Dict[Player, int] = {p: i for i, p in enumerate(players)}
+        self._in_ring = [self._can_act(p) for p in players]
+        # Seats in the ring link to themselves, others to the seat after them
+        self._link = [
+            i if active else (i + 1) % len(players)
+            for i, active in enumerate(self._in_ring)
+        ]
+        self._ring_count = sum(self._in_ring)
+        self._all_in = {p for p in players if p.is_all_in}
+        self._ring_stale = False
+        self._collect_unmatched()
+
+    def _collect_unmatched(self) -> None:
+        """Refill the set of ring players short of the current bet."""
+        self._unmatched = {p for p in self._ring_players() if self._is_unmatched(p)}
+
+    def _is_unmatched(self, player: Player) -> bool:
+        """Whether a player can still act and has not matched the current bet."""
+        seat = self._seat_of.get(player)
+        return (
+            seat is not None
+            and self._in_ring[seat]
+            and self._can_act(player)
+            and not player.is_all_in
+            and player.bet < self.current_bet
+        )
+
+    def _retire_seat(self, seat: int) -> None:
+        """Take an active seat out of the ring."""
+        if self._players[seat].is_all_in:
+            self._all_in.add(self._players[seat])
+        self._in_ring[seat] = False
+        self._link[seat] = (seat + 1) % len(self._link)
+        self._ring_count -= 1
+
+    def _next_active_seat(self, start: int) -> Optional[int]:
+        """Return the first active seat at or after start, wrapping around.
+
+        Seats whose player can no longer act are retired on the way, so each seat
+        is skipped at most once per ring build.
+        """
+        link = self._link
+        in_ring = self._in_ring
+        while self._ring_count:
+            # Follow links to the next ring seat, compressing the path behind us
+            seat = start
+            while not in_ring[seat]:
+                seat = link[seat]
+            while start != seat:
+                link[start], start = seat, link[start]
+
+            if self._can_act(self._players[seat]):
+                return seat
+            self._retire_seat(seat)
+            start = link[seat]
+        return None
+
+    def _ring_players(self) -> Iterator[Player]:
+        """Yield the players who can still act, in seat order from seat 0."""
+        previous = -1
+        seat = self._next_active_seat(0) if self._link else None
+        while seat is not None and seat > previous:
+            yield self._players[seat]
+            previous = seat
+            seat = self._next_active_seat((seat + 1) % len(self._link))
+
     def __iter__(self):
         """Make Table iterable through all players.
 
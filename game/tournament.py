@@ -1,142 +1,322 @@
-import logging
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
 
+from loggers.config import silenced_loggers
+from loggers.tournament_logger import TournamentLogger
+
+from .config import GameConfig
 from .game import AgenticPoker
+from .player import Player
+from .rng import GameRNG
 
 
 class PokerTournament:
     """
-    Manages a multi-table tournament structure using one or more AgenticPoker instances.
-
-    Handles:
-        - Multiple levels with increasing blinds and antes
-        - Player elimination across tables
-        - Scheduling and time-based logic for blind increases
-        - Final table creation when enough players are eliminated
-        - (Optional) Rebuys, seat reassignments, etc.
+    Runs a multi-table freezeout tournament on AgenticPoker tables.
+
+    The field is dealt round-robin onto tables of at most `table_size` players.
+    Play runs hand-for-hand: every table plays one hand, concurrently, and
+    between hands the tournament
+        - records busted players in finishing order,
+        - breaks the smallest tables while the rest can seat everyone,
+        - moves players from the largest to the smallest table until no two
+          tables differ by more than one player,
+        - raises the blinds and antes on schedule.
+    Tables therefore merge down to a single final table, which plays until one
+    player holds every chip.
+
+    Tables run in worker threads (start_tournament) or as tasks on one event
+    loop (start_tournament_async), which suits LLM agents waiting on the network.
+    Each table draws from its own child of the tournament's GameRNG, so a seeded
+    tournament of bots replays exactly whichever way it runs.
+
+    Attributes:
+        players (List[Player]): Every entrant, in registration order
+        buy_in (int): The buy-in cost, for tracking
+        starting_chips (int): Chips every entrant starts with
+        blind_schedule (List[Dict]): Blind/ante structure of each level
+        level_duration (timedelta): Clock time per level, unless hands_per_level is set
+        hands_per_level (Optional[int]): Hand-for-hand rounds per level
+        table_size (int): Maximum players per table
+        config (GameConfig): Base configuration for every table
+        max_workers (Optional[int]): Worker threads; None uses one per table
+        current_level_index (int): Index of the current blind level
+        hands_played (int): Hand-for-hand rounds played
+        tables (Dict[int, AgenticPoker]): Running tables by table number
+        eliminated (List[Player]): Busted players, first out first
     """
 
     def __init__(
         self,
-        players: List,
+        players: List[Player],
         buy_in: int,
         starting_chips: int,
         blind_schedule: List[Dict],
         level_duration_minutes: int = 15,
-        # ... other tournament parameters as desired ...
+        table_size: int = 9,
+        hands_per_level: Optional[int] = None,
+        config: Optional[GameConfig] = None,
+        max_workers: Optional[int] = None,
     ):
         """
-        Initialize the tournament.
+        Initialize the tournament and seat the field.
 
         Args:
-            players (List): List of player objects or names.
+            players (List[Player]): Entrants; each one's chips are set to starting_chips.
             buy_in (int): The buy-in cost (optional, for tracking).
             starting_chips (int): Number of chips each player starts with.
             blind_schedule (List[Dict]): Sequence of blind/ante structures,
                 e.g. [{'small_blind': 50, 'big_blind': 100, 'ante': 10}, ...]
             level_duration_minutes (int): How long each blind level lasts.
+            table_size (int): Maximum players per table.
+            hands_per_level (Optional[int]): Advance the level every this many
+                hand-for-hand rounds instead of by the clock, e.g. for
+                replayable simulations.
+            config (Optional[GameConfig]): Base table configuration; the blinds
+                and ante are taken from the schedule. Its seed seeds every table.
+            max_workers (Optional[int]): Threads for start_tournament; None
+                runs every table at once.
+
+        Raises:
+            ValueError: If there are fewer than two players, the table size is
+                below two, the schedule is empty or hands_per_level is not positive
         """
-        self.logger = logging.getLogger(__name__)
-        self.players = players
+        if len(players) < 2:
+            raise ValueError("A tournament needs at least 2 players")
+        if table_size < 2:
+            raise ValueError("Tables must seat at least 2 players")
+        if not blind_schedule:
+            raise ValueError("Blind schedule cannot be empty")
+        if hands_per_level is not None and hands_per_level <= 0:
+            raise ValueError("Hands per level must be positive")
+
+        self.players = list(players)
         self.buy_in = buy_in
         self.starting_chips = starting_chips
         self.blind_schedule = blind_schedule
         self.level_duration = timedelta(minutes=level_duration_minutes)
+        self.hands_per_level = hands_per_level
+        self.table_size = table_size
+        self.config = config or GameConfig()
+        self.max_workers = max_workers
         self.current_level_index = 0
+        self.hands_played = 0
         self.tournament_start_time = datetime.now()
-        self.tables: List[AgenticPoker] = []
-        self._init_tables()
+        self.rng = GameRNG(self.config.seed)
+        self.tables: Dict[int, AgenticPoker] = {}
+        self.eliminated: List[Player] = []
+        with self._logging():
+            self._init_tables()
 
     def _init_tables(self) -> None:
-        """
-        Create one or more AgenticPoker instances (tables) depending on
-        how many players you have, seating them accordingly.
-        This example starts as a single table with all players.
-        """
-        blind_info = self.blind_schedule[self.current_level_index]
-        # For simplicity, put all players at one table:
-        table = AgenticPoker(
-            players=self.players,
-            starting_chips=self.starting_chips,
-            small_blind=blind_info["small_blind"],
-            big_blind=blind_info["big_blind"],
-            ante=blind_info.get("ante", 0),
+        """Deal the field round-robin onto as few tables as can seat it."""
+        for player in self.players:
+            player.chips = self.starting_chips
+
+        num_tables = math.ceil(len(self.players) / self.table_size)
+        seats = [self.players[i::num_tables] for i in range(num_tables)]
+        for table_id, table_players in enumerate(seats, start=1):
+            self.tables[table_id] = self._create_table(table_id, table_players)
+
+    def _create_table(self, table_id: int, players: List[Player]) -> AgenticPoker:
+        """Create a table at the current blind level with its own random stream."""
+        level = self.blind_schedule[self.current_level_index]
+        config = replace(
+            self.config,
+            small_blind=level["small_blind"],
+            big_blind=level["big_blind"],
+            ante=level.get("ante", 0),
+            min_bet=None,
+            max_rounds=None,
+            seed=None,
+            # The database client is a single shared session, unsafe across threads
+            save_snapshots=False,
+        )
+        return AgenticPoker(
+            list(players), config=config, rng=self.rng.child("table", table_id)
         )
-        self.tables.append(table)
 
     def _update_structure(self) -> None:
         """
-        Transition to the next blind level if enough time has passed.
-        This method can be called periodically or after each hand/round.
+        Transition to the next blind level if enough time or hands have passed.
+        Called at every hand boundary; tables pick up the new level next hand.
         """
-        elapsed = datetime.now() - self.tournament_start_time
-        levels_passed = int(elapsed // self.level_duration)
-        if levels_passed > self.current_level_index and levels_passed < len(
-            self.blind_schedule
-        ):
+        if self.hands_per_level is not None:
+            levels_passed = self.hands_played // self.hands_per_level
+        else:
+            elapsed = datetime.now() - self.tournament_start_time
+            levels_passed = int(elapsed // self.level_duration)
+        levels_passed = min(levels_passed, len(self.blind_schedule) - 1)
+
+        if levels_passed > self.current_level_index:
             self.current_level_index = levels_passed
-            new_blind_info = self.blind_schedule[self.current_level_index]
-            self.logger.info(
-                f"=== ADVANCING TO LEVEL {self.current_level_index + 1} ===\n"
-                f"Blinds: {new_blind_info['small_blind']}/{new_blind_info['big_blind']}, "
-                f"Ante: {new_blind_info.get('ante', 0)}"
+            level = self.blind_schedule[self.current_level_index]
+            TournamentLogger.log_level_change(
+                self.current_level_index + 1,
+                level["small_blind"],
+                level["big_blind"],
+                level.get("ante", 0),
             )
             # Update each active table's blinds/antes for subsequent rounds
-            for table in self.tables:
-                table.small_blind = new_blind_info["small_blind"]
-                table.big_blind = new_blind_info["big_blind"]
-                table.ante = new_blind_info.get("ante", 0)
+            for table in self.tables.values():
+                table.config = replace(
+                    table.config,
+                    small_blind=level["small_blind"],
+                    big_blind=level["big_blind"],
+                    ante=level.get("ante", 0),
+                    min_bet=None,
+                )
+                table.small_blind = table.config.small_blind
+                table.big_blind = table.config.big_blind
+                table.ante = table.config.ante
+
+    def start_tournament(self) -> List[Player]:
+        """
+        Play the tournament to the end, running the tables in worker threads.
+
+        Returns:
+            List[Player]: Final standings, champion first
+        """
+        workers = self.max_workers or len(self.tables)
+        with self._logging(), ThreadPoolExecutor(max_workers=workers) as executor:
+            TournamentLogger.log_tournament_start(
+                len(self.players), self._table_sizes()
+            )
+            while not self._tournament_ended():
+                self._update_structure()
+                list(executor.map(AgenticPoker.play_hand, list(self.tables.values())))
+                self._end_hand_for_hand()
+            self._finalize_results()
+
+        return self.standings()
 
-    def start_tournament(self) -> None:
+    async def start_tournament_async(self) -> List[Player]:
         """
-        Main loop for running the tournament. In a real system, you'd handle
-        multi-table concurrency, user input, rebuys, etc.
+        Play the tournament to the end, running the tables as tasks on the event loop.
+
+        Returns:
+            List[Player]: Final standings, champion first
         """
-        self.logger.info("Starting the tournament!")
+        with self._logging():
+            TournamentLogger.log_tournament_start(
+                len(self.players), self._table_sizes()
+            )
+            while not self._tournament_ended():
+                self._update_structure()
+                await asyncio.gather(
+                    *(table.play_hand_async() for table in self.tables.values())
+                )
+                self._end_hand_for_hand()
+            self._finalize_results()
 
-        while not self._tournament_ended():
-            self._update_structure()
+        return self.standings()
 
-            # In a single-table scenario, just start the game or continue it:
-            for table in self.tables:
-                table.start_game()
+    def _logging(self):
+        """Silence the game loggers once for all tables when headless."""
+        return silenced_loggers() if self.config.headless else nullcontext()
 
-            # (Optional) If you had multiple tables:
-            # - Check elimination, seat guests, merge tables, etc.
+    def _end_hand_for_hand(self) -> None:
+        """Between hands: record busted players, then break and balance tables."""
+        self.hands_played += 1
+        self._record_eliminations()
+        self._break_tables()
+        self._balance_tables()
 
-        self.logger.info("Tournament has ended! Determining final results...")
-        self._finalize_results()
+    def _record_eliminations(self) -> None:
+        """
+        Unseat busted players and add them to the finishing order.
+
+        Players busting on the same hand are placed by the chips they started
+        that hand with, so the shorter stack finishes lower.
+        """
+        busted = []
+        for table in self.tables.values():
+            for player in list(table.table.players):
+                if player.chips <= 0:
+                    start = table.round_starting_stacks.get(player, 0)
+                    busted.append((start, player))
+                    table.unseat_player(player)
+
+        # Sort is stable, so equal stacks keep table order
+        for _, player in sorted(busted, key=lambda item: item[0]):
+            self.eliminated.append(player)
+            TournamentLogger.log_elimination(
+                player.name, len(self.players) - len(self.eliminated) + 1
+            )
+
+    def _break_tables(self) -> None:
+        """Break the smallest tables while the others have seats for everyone."""
+        remaining = sum(len(table.table) for table in self.tables.values())
+        needed = max(1, math.ceil(remaining / self.table_size))
+
+        while len(self.tables) > needed:
+            # Break the shortest table; on ties, the highest-numbered one
+            table_id = min(
+                reversed(self.tables), key=lambda t: len(self.tables[t].table)
+            )
+            broken = self.tables.pop(table_id)
+            TournamentLogger.log_table_broken(table_id, len(broken.table))
+            for player in list(broken.table.players):
+                broken.unseat_player(player)
+                self._smallest_table().seat_player(player)
+
+            if len(self.tables) == 1:
+                TournamentLogger.log_final_table(remaining)
+
+    def _balance_tables(self) -> None:
+        """Move players until no two tables differ by more than one player."""
+        while len(self.tables) > 1:
+            source_id = max(self.tables, key=lambda t: len(self.tables[t].table))
+            target_id = min(self.tables, key=lambda t: len(self.tables[t].table))
+            source = self.tables[source_id]
+            target = self.tables[target_id]
+            if len(source.table) - len(target.table) <= 1:
+                break
+
+            # Move the player due the big blind next, as live tournaments do
+            player = source.table[(source.dealer_index + 2) % len(source.table)]
+            source.unseat_player(player)
+            target.seat_player(player)
+            TournamentLogger.log_player_moved(player.name, source_id, target_id)
+
+    def _smallest_table(self) -> AgenticPoker:
+        """The table with the fewest players, lowest number first."""
+        return min(self.tables.values(), key=lambda table: len(table.table))
+
+    def _table_sizes(self) -> List[int]:
+        """Players at each table, in table order."""
+        return [len(table.table) for table in self.tables.values()]
 
     def _tournament_ended(self) -> bool:
         """
-        Check if the tournament is over: e.g., only one player remains,
-        or however else you want to define "end condition."
+        Check if the tournament is over: one player, or none, still has chips.
         """
-        active_players = []
-        for table in self.tables:
-            active_players.extend(table.players)
-        # If <= 1 player remains OR all but one are bankrupt, tournament is done:
-        return len([p for p in active_players if p.chips > 0]) <= 1
+        active_players = [
+            p for table in self.tables.values() for p in table.table if p.chips > 0
+        ]
+        return len(active_players) <= 1
 
-    def _finalize_results(self) -> None:
+    def standings(self) -> List[Player]:
         """
-        Collate final standings, handle payouts, etc.
-        """
-        # Example simplistic approach:
-        final_player = None
-        for table in self.tables:
-            for p in table.players:
-                if p.chips > 0:
-                    final_player = p
-                    break
-        if final_player:
-            self.logger.info(
-                f"{final_player.name} is the champion with {final_player.chips} chips!"
-            )
-        else:
-            self.logger.info("No winner could be determined (unusual situation).")
+        Players in finishing order, champion first.
 
+        Players still seated rank by chips, ahead of everyone eliminated.
+        """
+        seated = [p for table in self.tables.values() for p in table.table]
+        seated.sort(key=lambda p: p.chips, reverse=True)
+        return seated + self.eliminated[::-1]
 
-# ... you could add advanced features like rebuys, multi-table merging,
-# payouts, or final table logic
+    def _finalize_results(self) -> None:
+        """
+        Log the champion.
+        """
+        standings = self.standings()
+        if standings and standings[0].chips > 0:
+            TournamentLogger.log_champion(standings[0].name, standings[0].chips)
+        else:
+            TournamentLogger.log_no_winner()
@@ -1,5 +1,7 @@
 import logging
-from typing import Dict, Optional, Union
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 # Default log levels for each logger
 DEFAULT_LOG_LEVELS = {
@@ -40,4 +42,112 @@ def configure_loggers(log_levels: Optional[Dict[str, Union[int, str]]] = None) -
         if isinstance(level, str):
             level = getattr(logging, level.upper())
             
-        logger.setLevel(level) 
\ No newline at end of file
+        logger.setLevel(level)
+
+
+# Guards the logger swap; silenced_loggers() may be entered from several threads
+_silence_lock = threading.Lock()
+# Number of silenced_loggers() contexts currently open, across all threads
+_silence_depth = 0
+# Set while silenced_loggers() has replaced the game logger methods
+_silenced = False
+# Methods and logger levels to restore when the last context exits
+_saved_methods: List[Tuple[type, str, staticmethod]] = []
+_saved_levels: List[Tuple[logging.Logger, int]] = []
+
+# Module loggers silenced alongside the logger classes, e.g. the bots'
+# logging.getLogger(__name__) loggers, which inherit from these parents
+SILENCED_MODULE_LOGGERS = ("agents", "game")
+
+
+def loggers_silenced() -> bool:
+    """Return True while game logging is compiled out by silenced_loggers().
+
+    Call sites whose log arguments are expensive to build (hand descriptions,
+    player name lists) check this first, since a no-op sink cannot skip
+    evaluating its arguments.
+    """
+    return _silenced
+
+
+def _noop(*args, **kwargs) -> None:
+    """Log sink that discards everything."""
+
+
+def _game_logger_classes() -> list:
+    """Logger classes used by the rules engine on every hand."""
+    from loggers.betting_logger import BettingLogger
+    from loggers.deck_logger import DeckLogger
+    from loggers.draw_logger import DrawLogger
+    from loggers.game_logger import GameLogger
+    from loggers.player_logger import PlayerLogger
+    from loggers.pot_logger import PotLogger
+    from loggers.showdown_logger import ShowdownLogger
+    from loggers.table_logger import TableLogger
+    from loggers.tournament_logger import TournamentLogger
+
+    return [
+        BettingLogger,
+        DeckLogger,
+        DrawLogger,
+        GameLogger,
+        PlayerLogger,
+        PotLogger,
+        ShowdownLogger,
+        TableLogger,
+        TournamentLogger,
+    ]
+
+
+@contextmanager
+def silenced_loggers() -> Iterator[None]:
+    """Replace every game logger method with a no-op sink for the duration.
+
+    Used by headless games, where f-string formatting in the loggers would
+    otherwise cost more than the game logic. The module loggers under
+    SILENCED_MODULE_LOGGERS are raised above CRITICAL at the same time, so
+    plain logger calls (such as the bots') are dropped before formatting.
+
+    The swap is process-wide and reference-counted under a lock: the first
+    context to enter swaps the methods, and the last one to exit restores
+    them, whichever threads they run on. Normal games running in other
+    threads meanwhile are silenced too.
+    """
+    global _silence_depth, _silenced
+    with _silence_lock:
+        _silence_depth += 1
+        if _silence_depth == 1:
+            _silence()
+            _silenced = True
+    try:
+        yield
+    finally:
+        with _silence_lock:
+            _silence_depth -= 1
+            if _silence_depth == 0:
+                _silenced = False
+                _restore()
+
+
+def _silence() -> None:
+    """Swap in the no-op sinks and raise the module loggers' levels."""
+    for cls in _game_logger_classes():
+        for name, attr in list(vars(cls).items()):
+            if isinstance(attr, staticmethod):
+                _saved_methods.append((cls, name, attr))
+                setattr(cls, name, staticmethod(_noop))
+
+    for name in SILENCED_MODULE_LOGGERS:
+        logger = logging.getLogger(name)
+        _saved_levels.append((logger, logger.level))
+        logger.setLevel(logging.CRITICAL + 1)
+
+
+def _restore() -> None:
+    """Put back the methods and levels saved by _silence()."""
+    for cls, name, attr in _saved_methods:
+        setattr(cls, name, attr)
+    for logger, level in _saved_levels:
+        logger.setLevel(level)
+    _saved_methods.clear()
+    _saved_levels.clear()
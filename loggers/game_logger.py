@@ -127,6 +127,12 @@ class GameLogger:
         context_str = f" for {context}" if context else ""
         logger.info(f"Cards remaining{context_str}: {remaining_cards}")
 
+    @staticmethod
+    def log_audit_violation(message: str, replay: object) -> None:
+        """Log a failed chip audit with the record needed to replay the hand."""
+        logger.error(f"Chip audit failed: {message}")
+        logger.error(f"Replay record: {replay}")
+
     @staticmethod
     def log_game_ended_after_rounds(max_rounds: int) -> None:
         """Log the game ended after a certain number of rounds."""
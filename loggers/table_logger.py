@@ -87,6 +87,11 @@ class TableLogger:
         """Log when a player is removed from the table."""
         logger.info(f"Player {player_name} removed from table")
 
+    @staticmethod
+    def log_player_added(player_name: str) -> None:
+        """Log when a player is seated at the table."""
+        logger.info(f"Player {player_name} seated at table")
+
     @staticmethod
     def log_debug(message: str) -> None:
         """Log a debug message."""
@@ -0,0 +1,54 @@
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+
+class TournamentLogger:
+    """Handles all logging operations for multi-table tournaments."""
+
+    @staticmethod
+    def log_tournament_start(num_players: int, table_sizes: List[int]) -> None:
+        """Log the field and the opening table layout."""
+        logger.info(
+            f"Starting the tournament: {num_players} players at "
+            f"{len(table_sizes)} tables ({', '.join(map(str, table_sizes))})"
+        )
+
+    @staticmethod
+    def log_level_change(level: int, small_blind: int, big_blind: int, ante: int) -> None:
+        """Log a move to the next blind level."""
+        logger.info(
+            f"=== ADVANCING TO LEVEL {level} ===\n"
+            f"Blinds: {small_blind}/{big_blind}, Ante: {ante}"
+        )
+
+    @staticmethod
+    def log_elimination(player_name: str, place: int) -> None:
+        """Log a player busting out of the tournament."""
+        logger.info(f"{player_name} eliminated in place {place}")
+
+    @staticmethod
+    def log_table_broken(table_id: int, num_players: int) -> None:
+        """Log a table being broken up and its players reseated."""
+        logger.info(f"Breaking table {table_id}; reseating {num_players} players")
+
+    @staticmethod
+    def log_player_moved(player_name: str, from_table: int, to_table: int) -> None:
+        """Log a player moving tables to balance them."""
+        logger.info(f"Moving {player_name} from table {from_table} to table {to_table}")
+
+    @staticmethod
+    def log_final_table(num_players: int) -> None:
+        """Log the tournament reaching its final table."""
+        logger.info(f"Final table reached with {num_players} players")
+
+    @staticmethod
+    def log_champion(player_name: str, chips: int) -> None:
+        """Log the tournament winner."""
+        logger.info(f"{player_name} is the champion with {chips} chips!")
+
+    @staticmethod
+    def log_no_winner() -> None:
+        """Log a tournament that ended without a winner."""
+        logger.info("No winner could be determined (unusual situation).")
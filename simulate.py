@@ -0,0 +1,77 @@
+import argparse
+import logging
+
+from game import GameConfig
+from game.simulation import PlayerSpec, roster_from_configs, simulate
+from util import load_agent_configs
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Play many headless poker games in parallel and report results."
+    )
+    parser.add_argument("--games", type=int, default=1000, help="Games to play")
+    parser.add_argument("--rounds", type=int, default=200, help="Max rounds per game")
+    parser.add_argument("--seed", type=int, default=0, help="Root seed")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: CPUs)"
+    )
+    parser.add_argument(
+        "--agent",
+        choices=["random", "agent"],
+        default="random",
+        help="Agent type for every player in agent_configs.json",
+    )
+    parser.add_argument(
+        "--audit-every",
+        type=int,
+        default=0,
+        help="Chip-audit every Nth hand (default: never)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # One player per configured agent; fall back to random bots
+    agent_configs = load_agent_configs()
+    roster = roster_from_configs(agent_configs, agent=args.agent)
+    if len(roster) < 2:
+        roster = [PlayerSpec(name=f"Random{i}") for i in range(1, 5)]
+
+    config = GameConfig(
+        small_blind=50,
+        big_blind=100,
+        ante=10,
+        max_rounds=args.rounds,
+        min_bet=100,
+        audit_every=args.audit_every,
+    )
+
+    logger.info(
+        f"Simulating {args.games} games of {len(roster)} players "
+        f"({', '.join(spec.name for spec in roster)})"
+    )
+    summary = simulate(
+        args.games,
+        roster,
+        config,
+        seed=args.seed,
+        max_workers=args.workers,
+        agent_configs=agent_configs,
+    )
+
+    logger.info(f"Games: {summary.games}, hands: {summary.hands}")
+    per_hand = summary.chips_per_hand()
+    for name, delta, wins in zip(summary.names, summary.chip_deltas, summary.wins):
+        logger.info(
+            f"{name:>12}: net {delta:+d} chips, {per_hand[name]:+.2f}/hand, {wins} wins"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -158,6 +159,38 @@ class TestAgent:
         assert not hasattr(basic_agent, "conversation_history")
         assert not hasattr(basic_agent, "opponent_stats")
 
+    def test_async_decisions_use_async_queries(self, basic_agent, mock_llm_client):
+        """Test that async decisions await the client's async query.
+
+        Assumptions:
+        - Planning and action generation both go through query_async
+        - The sync query is never called on the async path
+        - A failing discard query falls back to the discard solver
+        """
+        mock_game = Mock()
+        mock_game.get_state.return_value = "Current game state"
+        mock_game.table.current_bet = 20
+        mock_game.config.min_bet = 20
+        basic_agent.hand = None
+        mock_llm_client.query_async = AsyncMock(return_value="DECISION: fold")
+
+        with patch(
+            "agents.llm_response_generator.PlanResponse.parse_llm_response",
+            return_value={"approach": "aggressive"},
+        ):
+            response = asyncio.run(basic_agent.decide_action_async(mock_game))
+
+        assert response.action_type == ActionType.FOLD
+        tags = [call.kwargs["tags"] for call in mock_llm_client.query_async.mock_calls]
+        assert tags == [["planning"], ["action_generation"]]
+        mock_llm_client.query.assert_not_called()
+
+        basic_agent.hand = Mock(cards=[])
+        mock_llm_client.query_async.side_effect = Exception("LLM Error")
+        with patch("agents.agent.solve_discard") as mock_solve:
+            discard = asyncio.run(basic_agent.decide_discard_async())
+        assert discard is mock_solve.return_value
+
     def test_error_handling(self, basic_agent, mock_llm_client):
         """Test error handling in decision making."""
         mock_game = Mock()
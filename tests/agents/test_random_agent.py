@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import Mock, patch
 
@@ -163,6 +164,20 @@ class TestRandomAgent(unittest.TestCase):
         # Should fall back to call since minimum raise would equal all chips
         self.assertEqual(decision.action_type, ActionType.CALL)
 
+    def test_seeded_agents_repeat_decisions(self):
+        """Test that agents with identically seeded streams make the same choices."""
+        agent1 = RandomAgent("Bot1", rng=random.Random(3))
+        agent2 = RandomAgent("Bot2", rng=random.Random(3))
+
+        for _ in range(10):
+            self.assertEqual(
+                agent1.decide_discard().discard, agent2.decide_discard().discard
+            )
+            self.assertEqual(
+                agent1.decide_action(self.mock_game),
+                agent2.decide_action(self.mock_game),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
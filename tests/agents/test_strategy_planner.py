@@ -1,5 +1,7 @@
+import asyncio
+import threading
 import time
-from unittest.mock import patch, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -19,6 +21,14 @@ def strategy_planner():
     return StrategyPlanner(strategy_style="aggressive")
 
 
+@pytest.fixture
+def planning_player(mock_player):
+    """A mock player with the style and client a planning prompt is built from."""
+    mock_player.strategy_style = "aggressive"
+    mock_player.llm_client = Mock()
+    return mock_player
+
+
 @pytest.fixture
 def mock_plan():
     """Create a mock plan for testing.
@@ -380,3 +390,99 @@ def test_plan_strategy_with_hand_eval(
     mock_generate_plan.assert_called_once_with(
         player=mock_player, game_state=mock_game.get_state(), hand_eval=mock_hand_eval
     )
+
+
+@patch("agents.llm_response_generator.LLMResponseGenerator.query_plan")
+def test_start_planning_in_background(
+    mock_generate_plan, strategy_planner, mock_game, planning_player
+):
+    """Test that a plan started at the deal is adopted at the player's turn.
+
+    Assumptions:
+        - Without an event loop the plan is queried on the planner thread
+        - plan_strategy adopts that plan without querying the LLM again
+        - A plan started in an earlier hand is discarded and replanned
+    """
+    planner_threads = []
+
+    def generate_plan(*args):
+        planner_threads.append(threading.current_thread().name)
+        return {"approach": "aggressive", "bet_sizing": "large"}
+
+    mock_generate_plan.side_effect = generate_plan
+    mock_game.round_number = 1
+
+    strategy_planner.start_planning(planning_player, mock_game)
+    strategy_planner.plan_strategy(planning_player, mock_game)
+
+    assert strategy_planner.current_plan.bet_sizing == BetSizing.LARGE
+    assert mock_generate_plan.call_count == 1
+    assert planner_threads[0].startswith("planner")
+
+    strategy_planner.current_plan = None
+    strategy_planner.start_planning(planning_player, mock_game)
+    mock_game.round_number = 2
+    strategy_planner.plan_strategy(planning_player, mock_game)
+
+    # Replanned on the caller's thread, whether or not the stale request ran
+    assert planner_threads[-1] == threading.current_thread().name
+    strategy_planner.close()
+
+
+def test_start_planning_on_event_loop(strategy_planner, mock_game, planning_player):
+    """Test that a background plan runs as a task when an event loop is running.
+
+    Assumptions:
+        - The plan request is scheduled on the loop, not on a thread
+        - plan_strategy_async awaits that request instead of querying again
+    """
+    mock_game.round_number = 1
+    plan_data = {"approach": "defensive", "bet_sizing": "small"}
+
+    async def play_turn():
+        strategy_planner.start_planning(planning_player, mock_game)
+        await strategy_planner.plan_strategy_async(planning_player, mock_game)
+
+    with patch(
+        "agents.llm_response_generator.LLMResponseGenerator.query_plan_async",
+        new=AsyncMock(return_value=plan_data),
+    ) as mock_generate_plan:
+        asyncio.run(play_turn())
+
+    assert strategy_planner.current_plan.approach == Approach.DEFENSIVE
+    mock_generate_plan.assert_awaited_once()
+    assert strategy_planner._executor is None
+
+
+@patch("agents.llm_response_generator.LLMResponseGenerator.query_plan")
+def test_background_plan_is_rechecked_when_adopted(
+    mock_query_plan, strategy_planner, mock_game, planning_player
+):
+    """Test that an adopted background plan is replaced if it no longer fits.
+
+    Assumptions:
+        - The planner thread is handed the prompt, not the player or the game
+        - The prompt is built from the state when planning started
+        - requires_replanning() is consulted after the background plan is adopted
+    """
+    mock_game.round_number = 1
+    mock_game.get_state.return_value = "state at the deal"
+    mock_query_plan.side_effect = [
+        {"approach": "aggressive", "bet_sizing": "large"},
+        {"approach": "defensive", "bet_sizing": "small"},
+    ]
+
+    strategy_planner.start_planning(planning_player, mock_game)
+    background_prompt = mock_query_plan.call_args.args[1]
+    assert "state at the deal" in background_prompt
+
+    mock_game.get_state.return_value = "state at the turn"
+    with patch.object(
+        strategy_planner, "requires_replanning", side_effect=[True, True]
+    ):
+        strategy_planner.plan_strategy(planning_player, mock_game)
+
+    assert mock_query_plan.call_count == 2
+    assert "state at the turn" in mock_query_plan.call_args.args[1]
+    assert strategy_planner.current_plan.approach == Approach.DEFENSIVE
+    strategy_planner.close()
@@ -0,0 +1,99 @@
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from game.canonical import (
+    NUM_CLASSES,
+    NUM_HANDS,
+    _class_tables,
+    canonicalize,
+    class_representative,
+    colex_index,
+    hand_class,
+    hand_classes,
+)
+from game.card import Card
+
+
+@pytest.fixture
+def four_flush():
+    return [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("2", "♦")]
+
+
+@pytest.fixture
+def relabelled():
+    """The four-flush with suits swapped and cards reordered."""
+    return [Card("2", "♣"), Card("J", "♥"), Card("Q", "♥"), Card("K", "♥"), Card("A", "♥")]
+
+
+def test_class_table_covers_every_hand():
+    """Test that every hand maps to one of the 134,459 classes."""
+    table, forms = _class_tables()
+
+    assert len(table) == NUM_HANDS
+    assert len(forms) == NUM_CLASSES
+    assert table.min() == 0 and table.max() == NUM_CLASSES - 1
+
+
+def test_colex_index_is_dense():
+    """Test that colex indices of small sets enumerate without gaps."""
+    indices = sorted(colex_index(combo) for combo in combinations(range(8), 3))
+    assert indices == list(range(56))
+    assert colex_index(range(47, 52)) == NUM_HANDS - 1
+
+
+def test_isomorphic_hands_share_class(four_flush, relabelled):
+    """Test that suit relabelling and card order do not change the class."""
+    assert hand_class(four_flush) == hand_class(relabelled)
+    assert canonicalize(four_flush).hand == canonicalize(relabelled).hand
+
+    offsuit = four_flush[:3] + [Card("J", "♥"), four_flush[4]]
+    assert hand_class(offsuit) != hand_class(four_flush)
+
+
+def test_positions_map_back_to_original_order(relabelled):
+    """Test that positions point at the original card of each canonical card."""
+    canonical = canonicalize(relabelled)
+
+    assert sorted(canonical.positions) == list(range(5))
+    for card_id, position in zip(canonical.hand, canonical.positions):
+        assert card_id % 13 == relabelled[position].value - 2
+
+
+def test_dead_cards_refine_the_form(four_flush):
+    """Test that dead cards distinguish otherwise equivalent suits."""
+    dead_spade = canonicalize(four_flush, [Card("10", "♠")])
+    dead_heart = canonicalize(four_flush, [Card("10", "♥")])
+    dead_club = canonicalize(four_flush, [Card("10", "♣")])
+
+    assert dead_spade.hand == dead_heart.hand == canonicalize(four_flush).hand
+    assert dead_spade.key != dead_heart.key
+    assert dead_heart.key == dead_club.key  # Hearts and clubs are interchangeable here
+
+
+def test_representative_round_trip(four_flush):
+    """Test that a class representative belongs to its own class."""
+    index = hand_class(four_flush)
+    representative = class_representative(index)
+
+    assert representative == canonicalize(four_flush).hand
+    assert hand_class(representative) == index
+    with pytest.raises(ValueError):
+        class_representative(NUM_CLASSES)
+
+
+def test_batch_matches_single(four_flush, relabelled):
+    """Test that the vectorized lookup agrees with hand_class."""
+    hands = np.array([[c.id for c in four_flush], [c.id for c in relabelled], [0, 13, 26, 39, 1]])
+
+    classes = hand_classes(hands)
+
+    assert classes.tolist() == [hand_class(hand) for hand in hands.tolist()]
+    with pytest.raises(ValueError):
+        hand_classes(np.array([[0, 0, 1, 2, 3]]))
+
+
+def test_invalid_hand_raises(four_flush):
+    with pytest.raises(ValueError):
+        hand_class(four_flush[:4])
@@ -0,0 +1,58 @@
+import copy
+import pickle
+
+import pytest
+
+from game.card import CARDS, Card
+
+
+class TestCard:
+    def test_cards_are_interned(self):
+        """Test that constructing a card returns the shared instance."""
+        assert Card("A", "♠") is Card("A", "♠")
+        assert Card("A", "♠") is not Card("A", "♥")
+        assert len(CARDS) == 52
+        assert len(set(CARDS)) == 52
+
+    def test_rank_and_suit_normalization(self):
+        """Test that int ranks, numeric face ranks and suit names map to one card."""
+        assert Card(10, "♥") is Card("10", "♥")
+        assert Card("11", "♠") is Card("J", "♠")
+        assert Card(14, "Spades") is Card("a", "s")
+        assert Card(2, "♣").rank == "2"
+
+    def test_unknown_rank_or_suit_raises(self):
+        """Test that unknown ranks and suits are rejected."""
+        with pytest.raises(KeyError):
+            Card("Z", "♠")
+        with pytest.raises(KeyError):
+            Card("A", "X")
+
+    def test_precomputed_fields(self):
+        """Test the integer encodings carried by each card."""
+        ace = Card("A", "♠")
+        assert ace.value == 14
+        assert ace.id == 51
+        assert ace.rank_bit == 1 << 12
+        assert ace.suit_bit == 1 << 3
+        assert ace.prime == 41
+        assert all(Card.from_id(i).id == i for i in range(52))
+
+    def test_cards_are_immutable(self):
+        """Test that card attributes cannot be changed."""
+        card = Card("K", "♦")
+        with pytest.raises(AttributeError):
+            card.rank = "Q"
+        with pytest.raises(AttributeError):
+            card.extra = 1
+
+    def test_copy_and_pickle_preserve_identity(self):
+        """Test that copies and unpickled cards resolve to the interned instance."""
+        card = Card("Q", "♣")
+        assert copy.copy(card) is card
+        assert copy.deepcopy([card])[0] is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+    def test_repr(self):
+        """Test the string representation."""
+        assert str(Card("10", "♥")) == "10 of ♥"
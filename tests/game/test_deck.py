@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from game.deck import Deck
+from game.deck import Deck, DeckFactory
 
 
 class TestDeck:
@@ -107,3 +108,132 @@ class TestDeck:
 
         expected = "Deck: 50 cards remaining, 2 dealt, 1 discarded"
         assert str(deck) == expected
+
+    def test_deal_takes_cards_from_top(self):
+        """Test that dealt cards are the first remaining cards, in order."""
+        deck = Deck()
+        deck.shuffle()
+        top = deck.cards[:5]
+
+        assert deck.deal(5) == top
+        assert deck.dealt_cards == top
+
+    def test_reshuffle_discards_keeps_held_cards_out(self):
+        """Test that only discarded cards return to the deck."""
+        deck = Deck()
+        deck.shuffle()
+        hand = deck.deal(5)
+        deck.add_discarded(hand[:2])
+        deck.deal(2)
+
+        deck.reshuffle_discards()
+
+        assert deck.remaining() == 47
+        assert not set(hand[2:]) & set(deck.cards)
+        assert set(hand[:2]) <= set(deck.cards)
+        assert len(set(deck.cards) | set(deck.dealt_cards)) == 52
+
+    def test_dealt_count_survives_reshuffling_discards(self):
+        """Test that returning discards to the deck does not undo the dealt count."""
+        deck = Deck()
+        deck.shuffle()
+        hand = deck.deal(5)
+        deck.add_discarded(hand[:3])
+        deck.reshuffle_discards()
+        deck.deal(3)
+
+        state = deck.get_state()
+        assert state.cards_dealt == 8
+        assert state.cards_remaining == 47
+        assert str(deck) == "Deck: 47 cards remaining, 8 dealt, 0 discarded"
+
+        deck.reset()
+        assert deck.get_state().cards_dealt == 0
+
+    def test_assigning_cards_stages_the_deck(self):
+        """Test that assigning cards replaces the remaining deck, top first."""
+        deck = Deck()
+        deck.shuffle()
+        hand = deck.deal(5)
+        deck.add_discarded(hand[:1])
+        staged = [deck.cards[3], hand[0], deck.cards[0]]
+
+        deck.cards = staged
+
+        assert deck.cards == staged
+        assert deck.discarded_cards == []
+        assert deck.remaining() == 3
+        assert sorted(c.id for c in deck.dealt_cards + deck.cards) == list(range(52))
+        assert deck.deal(2) == staged[:2]
+        with pytest.raises(ValueError):
+            deck.cards = [hand[1], hand[1]]
+
+    def test_add_discarded_card_still_in_deck(self):
+        """Test that discarding a card that was never dealt takes it out of the deck."""
+        deck = Deck()
+        card = deck.cards[10]
+        deck.add_discarded([card])
+        deck.add_discarded([card])  # Discarding twice is a no-op
+
+        assert card not in deck.cards
+        assert deck.discarded_cards == [card]
+        assert deck.remaining() == 51
+
+    def test_reset_and_reshuffle_all(self):
+        """Test that a new round returns every card to the deck."""
+        deck = Deck()
+        deck.shuffle()
+        deck.add_discarded(deck.deal(10)[:3])
+
+        deck.reset()
+        assert str(deck) == "Deck: 52 cards remaining, 0 dealt, 0 discarded"
+
+        deck.deal(7)
+        deck.reshuffle_all()
+        assert deck.get_state().cards_remaining == 52
+        assert sorted(card.id for card in deck.cards) == list(range(52))
+
+
+class TestDeckFactory:
+    def test_shuffles_are_permutations(self):
+        """Test that every generated order holds each card id exactly once."""
+        orders = DeckFactory(np.random.default_rng(3)).shuffles(200)
+
+        assert orders.shape == (200, 52)
+        assert (np.sort(orders, axis=1) == np.arange(52)).all()
+        assert len({row.tobytes() for row in orders}) == 200
+
+    def test_seeded_factories_replay(self):
+        """Test that factories with the same seed stage the same orders."""
+        first = DeckFactory(np.random.default_rng(5), batch_size=4)
+        second = DeckFactory(np.random.default_rng(5), batch_size=4)
+
+        for _ in range(10):  # Crosses several batch refills
+            assert (first.next_order() == second.next_order()).all()
+
+    def test_deal_into_loads_order(self):
+        """Test that a loaded deck deals its order from the top and starts fresh."""
+        factory = DeckFactory(np.random.default_rng(9), batch_size=2)
+        deck = Deck()
+        deck.add_discarded(deck.deal(6)[:2])
+
+        order = factory.shuffles(1)[0]
+        deck.load(order)
+        assert str(deck) == "Deck: 52 cards remaining, 0 dealt, 0 discarded"
+        assert [card.id for card in deck.deal(5)] == order[:5].tolist()
+
+        # Discarding after a load still finds cards by id
+        card = deck.cards[3]
+        deck.add_discarded([card])
+        assert card not in deck.cards
+
+    def test_invalid_arguments(self):
+        """Test that bad batch sizes and deck orders are rejected."""
+        with pytest.raises(ValueError):
+            DeckFactory(batch_size=0)
+        with pytest.raises(ValueError):
+            Deck().load(np.arange(10))
+        with pytest.raises(ValueError):
+            Deck().load(np.array([0] * 2 + list(range(2, 52))))  # Card 0 twice
+        with pytest.raises(ValueError):
+            Deck().load(np.arange(1, 53))
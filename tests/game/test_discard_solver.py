@@ -0,0 +1,82 @@
+import pytest
+
+from game.card import Card
+from game.discard_solver import analyze_discards, solve_discard
+
+
+@pytest.fixture
+def four_flush():
+    """A♠ K♠ Q♠ J♠ with a 2♦ kicker."""
+    return [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("2", "♦")]
+
+
+def test_four_flush_draw_is_exact(four_flush):
+    """Test the exact outcome distribution of drawing one card to a four-flush."""
+    best = analyze_discards(four_flush)[0]
+
+    assert best.discard == [4]
+    assert best.outcomes == 47
+    assert best.category_probabilities == pytest.approx(
+        {
+            "High Card": 23 / 47,
+            "One Pair": 12 / 47,
+            "Straight": 3 / 47,
+            "Flush": 8 / 47,
+            "Royal Flush": 1 / 47,
+        }
+    )
+
+
+def test_pair_draws_three():
+    """Test that a lone pair keeps the pair and draws three."""
+    hand = [Card("5", "♣"), Card("9", "♥"), Card("K", "♦"), Card("9", "♠"), Card("2", "♦")]
+    decision = solve_discard(hand)
+
+    assert decision.discard == [0, 2, 4]
+    assert decision.reasoning
+
+
+def test_made_straight_stands_pat():
+    """Test that a made straight keeps all five cards."""
+    hand = [Card("9", "♥"), Card("8", "♠"), Card("7", "♦"), Card("6", "♣"), Card("5", "♦")]
+    assert solve_discard(hand).discard == []
+
+
+def test_suit_isomorphic_hands_share_result(four_flush):
+    """Test that relabelled suits and reordered cards give the mapped decision."""
+    relabelled = [Card("2", "♣"), Card("J", "♥"), Card("Q", "♥"), Card("K", "♥"), Card("A", "♥")]
+
+    original = analyze_discards(four_flush)
+    mapped = analyze_discards(relabelled)
+
+    assert mapped[0].discard == [0]
+    assert [o.expected_percentile for o in mapped] == [
+        o.expected_percentile for o in original
+    ]
+
+
+def test_dead_cards_are_removed_from_deck(four_flush):
+    """Test that known dead cards are excluded from the draws."""
+    dead = [Card("10", "♠"), Card("9", "♠")]
+    options = {tuple(o.discard): o for o in analyze_discards(four_flush, dead_cards=dead)}
+
+    flush_draw = options[(4,)]
+    assert flush_draw.outcomes == 45
+    assert "Royal Flush" not in flush_draw.category_probabilities
+    assert flush_draw.category_probabilities["Flush"] == pytest.approx(7 / 45)
+
+
+def test_option_count_respects_max_discard(four_flush):
+    """Test that every legal subset is analyzed once."""
+    assert len(analyze_discards(four_flush)) == 26  # 1 + 5 + 10 + 10
+    assert len(analyze_discards(four_flush, max_discard=1)) == 6
+    assert analyze_discards(four_flush, max_discard=0)[0].discard == []
+
+
+def test_invalid_hand_raises(four_flush):
+    """Test that malformed hands are rejected."""
+    with pytest.raises(ValueError):
+        analyze_discards(four_flush[:4])
+    with pytest.raises(ValueError):
+        analyze_discards(four_flush[:4] + [four_flush[0]])
+
@@ -1,10 +1,14 @@
+import asyncio
 import logging
+import threading
 from unittest.mock import MagicMock
 
 import pytest
 
+from data.types.discard_decision import DiscardDecision
 from game.card import Card
-from game.draw import handle_draw_phase
+from game.deck import Deck
+from game.draw import handle_draw_phase, handle_draw_phase_async
 
 
 @pytest.fixture
@@ -538,3 +542,48 @@ def test_handle_draw_phase_duplicate_and_unordered_indices(setup_mock_hands, cap
         for i, card in enumerate(setup_mock_hands.players[0].hand.cards)
         if i > 0
     )
+
+
+def test_blocking_discard_decisions_collected_concurrently(setup_mock_hands):
+    """Test that blocking discard decisions are made together but dealt in seat order.
+
+    Assumptions:
+    - Players with blocking_decisions are asked at the same time; a barrier that
+      needs all three would time out if they were asked one after another
+    - Replacement cards are dealt in seat order, whichever decision finished first
+    - The async draw phase deals the same cards
+    """
+    barrier = threading.Barrier(3, timeout=5)
+    for player in setup_mock_hands.players:
+        player.blocking_decisions = True
+        player.decide_discard.side_effect = lambda: (
+            barrier.wait(),
+            DiscardDecision(discard=[0]),
+        )[1]
+
+    deck = Deck()
+    setup_mock_hands.deck = deck
+
+    def deal_hands():
+        deck.reset()
+        for player in setup_mock_hands.players:
+            player.hand.cards = deck.deal(5)
+        return deck.cards[:3]
+
+    expected = deal_hands()
+    handle_draw_phase(setup_mock_hands)
+
+    assert [p.hand.cards[-1] for p in setup_mock_hands.players] == expected
+
+    expected = deal_hands()
+    for seat, player in enumerate(setup_mock_hands.players):
+
+        async def decide(delay=0.01 * (2 - seat)):  # Later seats finish first
+            await asyncio.sleep(delay)
+            return DiscardDecision(discard=[0])
+
+        player.decide_discard_async.side_effect = decide
+
+    asyncio.run(handle_draw_phase_async(setup_mock_hands))
+
+    assert [p.hand.cards[-1] for p in setup_mock_hands.players] == expected
@@ -0,0 +1,78 @@
+import pytest
+
+from game.card import Card
+from game.equity import estimate_equity
+
+
+@pytest.fixture
+def four_flush():
+    """A♠ K♠ Q♠ J♠ with a 2♦ to discard."""
+    return [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("2", "♦")]
+
+
+@pytest.fixture
+def pair_of_twos():
+    return [Card("2", "♣"), Card("2", "♥"), Card("7", "♦"), Card("8", "♣"), Card("9", "♥")]
+
+
+def test_no_draw_showdown_is_exact(four_flush, pair_of_twos):
+    """Test that known hands without draws give a deterministic result."""
+    result = estimate_equity([four_flush, pair_of_twos], samples=500, seed=1)
+
+    assert result.equities == [0.0, 1.0]
+    assert result.samples == 500
+
+
+def test_drawing_to_a_hand(four_flush, pair_of_twos):
+    """Test one-card draw equity against the exact count of winning cards."""
+    result = estimate_equity(
+        [four_flush, pair_of_twos], draws=[[4], 0], samples=20000, seed=3
+    )
+
+    # 9 spades, 3 tens and 12 A/K/Q/J of the 42 unseen cards beat a pair of twos
+    assert result.equities[0] == pytest.approx(24 / 42, abs=0.02)
+    assert sum(result.equities) == pytest.approx(1.0)
+
+
+def test_ties_are_split():
+    """Test that identical hand strengths split the pot."""
+    hand1 = [Card("A", "♠"), Card("K", "♠"), Card("Q", "♠"), Card("J", "♠"), Card("9", "♦")]
+    hand2 = [Card("A", "♥"), Card("K", "♥"), Card("Q", "♥"), Card("J", "♥"), Card("9", "♣")]
+    result = estimate_equity([hand1, hand2], samples=100, seed=1)
+
+    assert result.equities == [0.5, 0.5]
+    assert result.tie_rates == [1.0, 1.0]
+
+
+def test_unknown_opponents_are_reproducible(four_flush):
+    """Test that seeded estimates against unknown hands repeat exactly."""
+    first = estimate_equity([four_flush, None, None], draws=[1, 3, 2], samples=3000, seed=9)
+    second = estimate_equity([four_flush, None, None], draws=[1, 3, 2], samples=3000, seed=9)
+
+    assert first == second
+    assert sum(first.equities) == pytest.approx(1.0)
+    assert first.equities[0] > first.equities[1]
+
+
+def test_time_budget_stops_after_first_batch(four_flush):
+    """Test that an exhausted time budget still returns at least one batch."""
+    result = estimate_equity(
+        [four_flush, None], samples=10000, time_budget=0.0, batch_size=64, seed=1
+    )
+    assert result.samples == 64
+
+
+def test_invalid_inputs(four_flush, pair_of_twos):
+    """Test that malformed hands, draws and decks are rejected."""
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush[:4], None])
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush, four_flush])
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush, None], draws=[[5], 0])
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush, None], draws=[0, [1]])
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush, None], deck=four_flush)
+    with pytest.raises(ValueError):
+        estimate_equity([four_flush, None], draws=[0, 1], deck=pair_of_twos)
@@ -1,8 +1,19 @@
+from itertools import combinations
+
+import numpy as np
 import pytest
 
 from data.types.hand_rank import HandRank
-from game.card import Card
-from game.evaluator import evaluate_hand
+from game.card import CARDS, Card
+from game.evaluator import (
+    _FLUSH_LOOKUP,
+    _PRODUCT_LOOKUP,
+    HandEvaluation,
+    evaluate_hand,
+    evaluate_hands_batch,
+    hand_strength,
+    pack_strength,
+)
 
 
 @pytest.fixture
@@ -870,17 +881,9 @@ def test_wheel_straight_flush_vs_regular_straight_flush():
 
 
 def test_invalid_card_rank():
-    """Test that invalid card ranks are caught"""
-    hand = [
-        Card("Z", "♠"),  # Invalid rank
-        Card("K", "♠"),
-        Card("Q", "♠"),
-        Card("J", "♠"),
-        Card("10", "♠"),
-    ]
-
+    """Test that invalid card ranks are caught when the card is created"""
     with pytest.raises(KeyError):
-        evaluate_hand(hand)
+        Card("Z", "♠")  # Invalid rank
 
 
 def test_one_pair_ace_kicker_comparison():
@@ -919,3 +922,204 @@ def test_one_pair_ace_kicker_comparison():
     # Verify descriptions
     assert "Aces" in charlie_desc  # Pair of Aces
     assert "Aces" in alice_desc  # Pair of Aces
+
+
+def test_lookup_tables_cover_all_hand_classes():
+    """Test that the lookup tables hold every distinct 5-card hand class"""
+    assert len(_FLUSH_LOOKUP) == 1287  # 13 choose 5 suited rank sets
+    assert len(_PRODUCT_LOOKUP) == 6175  # Rank multisets without five of a kind
+
+    distinct = {(ev.rank, tuple(ev.tiebreakers)) for ev in _FLUSH_LOOKUP.values()}
+    distinct |= {(ev.rank, tuple(ev.tiebreakers)) for ev in _PRODUCT_LOOKUP.values()}
+    assert len(distinct) == 7462
+
+
+def test_lookup_tables_hand_frequencies():
+    """Test that the tables reproduce the category counts of all 2,598,960 hands"""
+    expected = {
+        HandRank.ROYAL_FLUSH: 4,
+        HandRank.STRAIGHT_FLUSH: 36,
+        HandRank.FOUR_OF_KIND: 624,
+        HandRank.FULL_HOUSE: 3744,
+        HandRank.FLUSH: 5108,
+        HandRank.STRAIGHT: 10200,
+        HandRank.THREE_OF_KIND: 54912,
+        HandRank.TWO_PAIR: 123552,
+        HandRank.ONE_PAIR: 1098240,
+        HandRank.HIGH_CARD: 1302540,
+    }
+    counts = {rank: 0 for rank in HandRank}
+
+    # Each suited rank set occurs once per suit
+    for evaluation in _FLUSH_LOOKUP.values():
+        counts[evaluation.rank] += 4
+
+    # Each rank multiset occurs once per suit assignment (minus the 4 flushes
+    # when all five ranks are distinct)
+    ways = {1: 4, 2: 6, 3: 4, 4: 1}
+    for evaluation in _PRODUCT_LOOKUP.values():
+        rank_counts = {}
+        for rank in _ranks_of(evaluation):
+            rank_counts[rank] = rank_counts.get(rank, 0) + 1
+        total = 1
+        for count in rank_counts.values():
+            total *= ways[count]
+        if len(rank_counts) == 5:
+            total -= 4
+        counts[evaluation.rank] += total
+
+    assert counts == expected
+    assert sum(counts.values()) == 2598960
+
+
+def _ranks_of(evaluation):
+    """Rebuild the five card ranks of a non-flush evaluation from its tiebreakers"""
+    tiebreakers = evaluation.tiebreakers
+    if evaluation.rank == HandRank.FOUR_OF_KIND:
+        return [tiebreakers[0]] * 4 + [tiebreakers[1]]
+    if evaluation.rank == HandRank.FULL_HOUSE:
+        return [tiebreakers[0]] * 3 + [tiebreakers[1]] * 2
+    if evaluation.rank == HandRank.THREE_OF_KIND:
+        return [tiebreakers[0]] * 2 + tiebreakers
+    if evaluation.rank == HandRank.TWO_PAIR:
+        return [tiebreakers[0], tiebreakers[1]] + tiebreakers
+    if evaluation.rank == HandRank.ONE_PAIR:
+        return [tiebreakers[0]] + tiebreakers
+    return [14 if rank == 1 else rank for rank in tiebreakers]
+
+
+def test_lookup_matches_card_order_and_suit():
+    """Test that evaluation does not depend on card order or the suits used"""
+    hand = [
+        Card("9", "♥"),
+        Card("K", "♣"),
+        Card("9", "♠"),
+        Card("2", "♦"),
+        Card("K", "♥"),
+    ]
+    expected = evaluate_hand(hand)
+    assert evaluate_hand(list(reversed(hand))) == expected
+    assert expected.rank == HandRank.TWO_PAIR
+    assert expected.tiebreakers == [13, 9, 2]
+
+
+def test_batch_matches_single_evaluation():
+    """Test that batch ranks and keys agree with evaluate_hand"""
+    rng = np.random.default_rng(7)
+    ids = np.array([rng.choice(52, 5, replace=False) for _ in range(5000)])
+    ranks, keys = evaluate_hands_batch(ids)
+
+    for row, rank, key in zip(ids, ranks, keys):
+        evaluation = evaluate_hand([CARDS[card_id] for card_id in row])
+        assert rank == evaluation.rank.value
+        assert key == evaluation.strength
+
+
+def test_batch_special_hands():
+    """Test royal flush, wheel straight and keys ordering across categories"""
+    hands = [
+        [Card(r, "♠") for r in ["A", "K", "Q", "J", "10"]],
+        [Card("A", "♥"), Card("2", "♠"), Card("3", "♦"), Card("4", "♣"), Card("5", "♥")],
+        [Card("6", "♥"), Card("2", "♠"), Card("3", "♦"), Card("4", "♣"), Card("5", "♥")],
+        [Card("A", "♥"), Card("A", "♠"), Card("K", "♦"), Card("Q", "♣"), Card("J", "♥")],
+    ]
+    ranks, keys = evaluate_hands_batch(hands)
+
+    assert list(ranks) == [
+        HandRank.ROYAL_FLUSH.value,
+        HandRank.STRAIGHT.value,
+        HandRank.STRAIGHT.value,
+        HandRank.ONE_PAIR.value,
+    ]
+    assert keys[1] == (HandRank.STRAIGHT.value << 20) | 0x54321
+    assert keys[0] > keys[2] > keys[1] > keys[3]
+
+
+def test_batch_all_hands_frequencies():
+    """Test category counts over every 5-card hand in one batch"""
+    ids = np.array(list(combinations(range(52), 5)), dtype=np.int16)
+    ranks, keys = evaluate_hands_batch(ids)
+
+    counts = np.bincount(ranks, minlength=11)
+    assert counts[HandRank.ROYAL_FLUSH.value] == 4
+    assert counts[HandRank.STRAIGHT_FLUSH.value] == 36
+    assert counts[HandRank.FOUR_OF_KIND.value] == 624
+    assert counts[HandRank.FULL_HOUSE.value] == 3744
+    assert counts[HandRank.FLUSH.value] == 5108
+    assert counts[HandRank.STRAIGHT.value] == 10200
+    assert counts[HandRank.THREE_OF_KIND.value] == 54912
+    assert counts[HandRank.TWO_PAIR.value] == 123552
+    assert counts[HandRank.ONE_PAIR.value] == 1098240
+    assert counts[HandRank.HIGH_CARD.value] == 1302540
+    assert len(np.unique(keys)) == 7462
+
+
+def test_batch_invalid_input():
+    """Test that malformed batches are rejected"""
+    with pytest.raises(ValueError):
+        evaluate_hands_batch(np.zeros((3, 4), dtype=int))
+    with pytest.raises(ValueError):
+        evaluate_hands_batch(np.array([[0, 1, 2, 3, 52]]))
+    with pytest.raises(ValueError):
+        evaluate_hands_batch(np.array([[0, 1, 2, 3, 3]]))
+
+
+def test_strength_key_packing():
+    """Test the layout of packed strength keys"""
+    assert pack_strength(HandRank.TWO_PAIR, [13, 9, 2]) == 0x3D9200
+    assert pack_strength(HandRank.ROYAL_FLUSH, [14, 13, 12, 11, 10]) == 0xAEDCBA
+
+
+def test_strength_key_orders_like_tiebreakers():
+    """Test that strength keys order hands exactly like (rank, tiebreakers)"""
+    evaluations = list(_FLUSH_LOOKUP.values()) + list(_PRODUCT_LOOKUP.values())
+    by_tuple = sorted(evaluations, key=lambda ev: (ev.rank.value, ev.tiebreakers))
+    by_key = sorted(evaluations, key=lambda ev: ev.strength)
+    assert [ev.strength for ev in by_tuple] == [ev.strength for ev in by_key]
+
+
+def test_hand_strength_matches_evaluation():
+    """Test that hand_strength agrees with evaluate_hand"""
+    hand = [
+        Card("A", "♥"),
+        Card("A", "♠"),
+        Card("K", "♦"),
+        Card("9", "♦"),
+        Card("8", "♦"),
+    ]
+    assert hand_strength(hand) == evaluate_hand(hand).strength
+    with pytest.raises(ValueError):
+        hand_strength(hand[:4])
+
+
+def test_description_is_lazy():
+    """Test that descriptions are only formatted when read"""
+    evaluation = HandEvaluation(HandRank.FULL_HOUSE, [10, 4])
+    assert evaluation._description is None
+    assert evaluation[0] == HandRank.FULL_HOUSE
+    assert evaluation._description is None
+
+    assert evaluation.description == "Full House, 10s over 4s"
+    assert evaluation[2] == evaluation.description
+
+
+def test_evaluation_is_tuple_compatible():
+    """Test unpacking, indexing and tuple equality of evaluations"""
+    evaluation = evaluate_hand(
+        [Card("9", "♥"), Card("9", "♠"), Card("K", "♦"), Card("K", "♣"), Card("2", "♦")]
+    )
+    rank, tiebreakers, description = evaluation
+
+    assert len(evaluation) == 3
+    assert evaluation == (HandRank.TWO_PAIR, [13, 9, 2], "Two Pair, 13s and 9s")
+    assert (rank, tiebreakers, description) == tuple(evaluation)
+    assert evaluation[-1] == description
+    assert "Two Pair, 13s and 9s" in repr(evaluation)
+
+
+def test_evaluation_from_strength():
+    """Test rebuilding evaluations from packed strength keys"""
+    for evaluation in list(_FLUSH_LOOKUP.values()) + list(_PRODUCT_LOOKUP.values()):
+        rebuilt = HandEvaluation.from_strength(evaluation.strength)
+        assert rebuilt == evaluation
+        assert rebuilt.description == evaluation.description
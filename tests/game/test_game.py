@@ -1,13 +1,23 @@
+import asyncio
+import logging
+import random
+import threading
 from datetime import datetime
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from agents.agent import Agent
+from agents.random_agent import RandomAgent
 from data.types.action_decision import ActionType
 from data.types.pot_types import SidePot
-from game import AgenticPoker
+from exceptions import ChipAuditError
+from game import AgenticPoker, GameConfig
+from game.deck import DeckFactory
 from game.hand import Hand
+from loggers.config import loggers_silenced, silenced_loggers
+from loggers.game_logger import GameLogger
 
 
 @pytest.fixture
@@ -110,6 +120,167 @@ def test_round_initialization(game, mock_players):
     assert all(hasattr(player, "hand") for player in game.table)
 
 
+def test_seeded_rounds_replay(mock_players):
+    """Test that games with the same seed deal the same hands each round."""
+
+    def deal_round(round_number):
+        game = AgenticPoker(players=mock_players, config=GameConfig(seed=11))
+        game.round_number = round_number
+        game._initialize_round()
+        return {p.name: [str(c) for c in p.hand.cards] for p in game.table}
+
+    assert deal_round(1) == deal_round(1)
+    assert deal_round(1) != deal_round(2)
+
+
+def test_explicit_player_rng_wins_over_round_streams():
+    """Test that a player's own rng is kept while the others get round streams."""
+    own_rng = random.Random(8)
+    pinned = RandomAgent("Pinned", rng=own_rng)
+    seeded = RandomAgent("Seeded")
+    game = AgenticPoker(players=[pinned, seeded], config=GameConfig(seed=3))
+
+    game._initialize_round()
+
+    assert pinned.rng is own_rng
+    assert seeded.rng is not random
+    first_round_rng = seeded.rng
+    game.round_number += 1
+    game._initialize_round()
+    assert pinned.rng is own_rng
+    assert seeded.rng is not first_round_rng
+
+
+def test_deck_provider_supplies_rounds(mock_players):
+    """Test that a deck provider's orders replace the per-round shuffle."""
+    factory = DeckFactory(np.random.default_rng(4), batch_size=8)
+    expected = DeckFactory(np.random.default_rng(4), batch_size=8).next_order()
+
+    game = AgenticPoker(players=mock_players, deck_provider=factory)
+    game._initialize_round()
+
+    dealt = [card.id for player in game.table for card in player.hand.cards]
+    assert dealt == expected[: len(dealt)].tolist()
+
+
+def test_deck_provider_reshuffles_replay(mock_players):
+    """Test that reshuffles of a provided deck still draw from the seeded round stream."""
+
+    def reshuffled():
+        game = AgenticPoker(
+            players=mock_players,
+            config=GameConfig(seed=1),
+            deck_provider=DeckFactory(np.random.default_rng(9)),
+        )
+        game._initialize_round()
+        game.deck.reshuffle_all()  # As the draw phase does when the deck runs low
+        return [card.id for card in game.deck.cards]
+
+    assert reshuffled() == reshuffled()
+
+
+def test_headless_game_matches_logged_game(caplog):
+    """Test that headless mode plays the same game without logging or snapshots."""
+
+    def play(headless):
+        players = [RandomAgent(name, chips=1000) for name in ["A", "B", "C"]]
+        game = AgenticPoker(
+            players, config=GameConfig(seed=5, max_rounds=10, headless=headless)
+        )
+        caplog.clear()  # Keep only records from the hands themselves
+        game.play_game()
+        return game, {p.name: p.chips for p in players}
+
+    caplog.set_level(logging.DEBUG)
+    game, headless_chips = play(headless=True)
+    assert game.db_client is None
+    assert not game.pot.validate_chips
+    assert not [
+        r for r in caplog.records if r.name.startswith(("loggers.", "agents."))
+    ]
+    assert not loggers_silenced()
+
+    with patch("game.game.DatabaseClient"):
+        _, logged_chips = play(headless=False)
+    assert caplog.records
+    assert headless_chips == logged_chips
+
+
+def test_overlapping_silences_across_threads():
+    """Test that logging stays silenced until the last overlapping context exits.
+
+    Assumptions:
+    - Contexts on different threads share one process-wide swap
+    - The first thread to exit does not restore logging early
+    - The originals, not the no-op sinks, are restored at the end
+    """
+    original = GameLogger.log_game_summary
+    agents_level = logging.getLogger("agents").level
+    entered = threading.Barrier(2)
+    first_exited = threading.Event()
+    seen = {}
+
+    def first():
+        with silenced_loggers():
+            entered.wait()
+        first_exited.set()
+
+    def second():
+        with silenced_loggers():
+            entered.wait()
+            first_exited.wait()
+            seen["silenced"] = loggers_silenced()
+            seen["method"] = GameLogger.log_game_summary
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert seen["silenced"]
+    assert seen["method"] is not original
+    assert not loggers_silenced()
+    assert GameLogger.log_game_summary is original
+    assert logging.getLogger("agents").level == agents_level
+
+
+def test_chip_auditor_samples_hands_and_reports_replay():
+    """Test that the chip auditor checks sampled hands and reports violations.
+
+    Assumptions:
+    - Games audit every hand by default and no hands when headless
+    - Only rounds that are multiples of the interval are audited
+    - A violation raises ChipAuditError carrying the hand's replay record
+    """
+    players = [RandomAgent(name, chips=1000) for name in ["A", "B", "C"]]
+    assert AgenticPoker(players, config=GameConfig(headless=True)).auditor.every == 0
+
+    with patch("game.game.DatabaseClient"):
+        game = AgenticPoker(players, config=GameConfig(seed=3, audit_every=2))
+    assert [game.auditor.should_audit(n) for n in range(1, 5)] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+    game.round_number = 2
+    game._start_new_round()
+    game.auditor.begin_hand(game)
+    replay = game.auditor.replay
+    assert replay.seed == game.rng.seed
+    assert replay.round_number == 2
+    assert replay.hands["A"] == [str(card) for card in players[0].hand.cards]
+
+    game.auditor.before_showdown(game)
+    players[0].chips += 5  # Chips appearing from nowhere
+    with pytest.raises(ChipAuditError) as error:
+        game.auditor.end_hand(game)
+    assert error.value.replay is replay
+    assert "Total chips changed" in str(error.value)
+
+
 def test_collect_blinds_and_antes(game, player_factory):
     """Test that blinds and antes are collected correctly and pot is updated properly."""
     # Create players with known chip stacks
@@ -367,3 +538,74 @@ def test_game_ends_when_one_player_remains(game):
 
     # Verify game summary was logged
     game._log_game_summary.assert_called_once()
+
+
+def test_get_state_reuses_unchanged_snapshots():
+    """Test that game state snapshots are cached until the game changes.
+
+    Assumptions:
+    - get_state returns the same snapshot while nothing has changed
+    - A change to one player rebuilds the snapshot but shares the others' states
+    - Unchanged pot and deck states are shared between snapshots
+    """
+    players = [RandomAgent(name, chips=1000) for name in ["A", "B", "C"]]
+    with patch("game.game.DatabaseClient"):
+        game = AgenticPoker(players, config=GameConfig(seed=2))
+    game._initialize_round()
+
+    state = game.get_state()
+    assert game.get_state() is state
+
+    players[1].chips -= 50
+    rebuilt = game.get_state()
+    assert rebuilt is not state
+    assert rebuilt.players[1].chips == 950
+    assert rebuilt.players[0] is state.players[0]
+    assert rebuilt.players[2] is state.players[2]
+    assert rebuilt.pot_state is state.pot_state
+    assert rebuilt.deck_state is state.deck_state
+
+    game.pot.add_to_pot(30)
+    assert game.get_state().pot_state.main_pot == 30
+
+
+def test_async_games_match_sync_games():
+    """Test that concurrent async games play the same hands as the sync loop.
+
+    Assumptions:
+    - Agents that yield to the event loop mid-decision interleave the tables
+    - Each table's result depends only on its seed, not on the interleaving
+    """
+
+    turns = []
+
+    class YieldingAgent(RandomAgent):
+        async def decide_action_async(self, game):
+            await asyncio.sleep(0)
+            turns.append(game.config.seed)
+            return self.decide_action(game)
+
+        async def decide_discard_async(self):
+            await asyncio.sleep(0)
+            return self.decide_discard()
+
+    def make_game(seed, agent_class):
+        players = [agent_class(name, chips=1000) for name in ["A", "B", "C"]]
+        config = GameConfig(seed=seed, max_rounds=8, headless=True, audit_every=1)
+        return AgenticPoker(list(players), config=config), players
+
+    expected = []
+    for seed in range(3):
+        game, players = make_game(seed, RandomAgent)
+        game.play_game()
+        expected.append([p.chips for p in players])
+
+    tables = [make_game(seed, YieldingAgent) for seed in range(3)]
+
+    async def play_all():
+        with silenced_loggers():
+            await asyncio.gather(*(game.play_game_async() for game, _ in tables))
+
+    asyncio.run(play_all())
+    assert [[p.chips for p in players] for _, players in tables] == expected
+    assert turns != sorted(turns)  # The tables took turns on the loop
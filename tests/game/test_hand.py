@@ -1,9 +1,11 @@
 import copy
+from unittest.mock import patch
 
 import pytest
 
 from data.types.hand_rank import HandRank
 from game.card import Card
+from game.evaluator import evaluate_hand
 from game.hand import Hand
 
 
@@ -398,15 +400,13 @@ class TestHand:
             ]
         )
 
-        # Deep copy should create new hand with new card objects
+        # Deep copy should create new hand sharing the interned card objects
         copied = copy.deepcopy(original)
 
         assert original == copied  # Should be equal in value
         assert original is not copied  # Should be different objects
         assert original.cards is not copied.cards  # Should have different card lists
-        assert (
-            original.cards[0] is not copied.cards[0]
-        )  # Should have different card objects
+        assert original.cards[0] is copied.cards[0]  # Cards are interned singletons
 
     def test_memory_management(self):
         """Test memory management with large number of hands."""
@@ -617,3 +617,44 @@ class TestHand:
         assert (
             charlie_tiebreakers > alice_tiebreakers
         ), "Charlie's kickers should be higher"
+
+    def test_strength(self, royal_flush, straight_flush):
+        """Test integer strength keys and comparisons built on them."""
+        assert royal_flush.strength > straight_flush.strength > 0
+        assert royal_flush.compare_to(straight_flush) > 0
+        assert Hand().strength == 0
+        assert Hand().compare_to(Hand()) == 0
+        assert Hand() < straight_flush
+
+    def test_evaluation_cached_per_card_configuration(self, royal_flush):
+        """Test that rank, show and state APIs share a single evaluation."""
+        with patch("game.hand.evaluate_hand", wraps=evaluate_hand) as mock_evaluate:
+            royal_flush.show()
+            royal_flush.evaluate()
+            royal_flush.get_state()
+            royal_flush.get_rank()
+            assert royal_flush.strength > 0
+            assert mock_evaluate.call_count == 1
+
+    def test_cache_refreshes_on_direct_mutation(self, royal_flush):
+        """Test that replacing cards in place invalidates the cached evaluation."""
+        assert royal_flush.get_rank() == HandRank.ROYAL_FLUSH
+
+        # Mimic the draw phase: pop a card and append a replacement
+        royal_flush.cards.pop(0)
+        royal_flush.cards.append(Card("2", "♥"))
+
+        assert royal_flush.get_rank() == HandRank.HIGH_CARD
+        assert royal_flush.get_state().rank_value == HandRank.HIGH_CARD
+
+    def test_percentile(self, royal_flush, straight_flush):
+        """Test percentile lookups and their inclusion in the hand state."""
+        assert royal_flush.percentile() > straight_flush.percentile() > 0.99
+        assert 0 < royal_flush.percentile(after_draw=True) <= 1
+        assert Hand().percentile() == 0.0
+
+        state = straight_flush.get_state()
+        assert state.percentile == straight_flush.percentile()
+        assert state.draw_percentile == straight_flush.percentile(after_draw=True)
+        assert state.to_dict()["evaluation"]["percentile"] == state.percentile
+        assert Hand().get_state().percentile is None
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from game.card import Card
+from game.evaluator import hand_strength
+from game.percentile import (
+    _PERCENTILES,
+    _SORTED_KEYS,
+    build_draw_percentiles,
+    draw_percentiles,
+    hand_percentile,
+    percentiles_of,
+)
+
+
+def strength(*cards):
+    return hand_strength([Card(rank, suit) for rank, suit in cards])
+
+
+def test_percentile_table():
+    """Test that percentiles cover every hand class and increase with strength."""
+    assert len(_SORTED_KEYS) == 7462
+    assert np.all(np.diff(_PERCENTILES) > 0)
+    assert 0 < _PERCENTILES[0] < 0.001
+    assert _PERCENTILES[-1] > 0.999999
+
+
+def test_category_boundaries():
+    """Test percentiles against the exact category frequencies."""
+    # 1,302,540 of the 2,598,960 hands are high-card hands
+    best_high_card = strength(("A", "♠"), ("K", "♠"), ("Q", "♠"), ("J", "♠"), ("9", "♦"))
+    worst_pair = strength(("2", "♠"), ("2", "♦"), ("3", "♠"), ("4", "♠"), ("5", "♦"))
+
+    assert hand_percentile(best_high_card) < 1302540 / 2598960 < hand_percentile(worst_pair)
+
+
+def test_draw_percentiles():
+    """Test that hands rank lower once everyone has drawn."""
+    pair_of_jacks = strength(("J", "♠"), ("J", "♦"), ("3", "♠"), ("7", "♥"), ("9", "♦"))
+
+    table = draw_percentiles()
+    assert len(table) == len(_SORTED_KEYS)
+    assert np.all(np.diff(table) >= 0)
+    assert hand_percentile(pair_of_jacks, after_draw=True) < hand_percentile(pair_of_jacks)
+
+
+def test_shipped_draw_table_matches_build():
+    """Test that the shipped post-draw table is what the sampler builds."""
+    assert np.array_equal(draw_percentiles(), build_draw_percentiles())
+
+
+def test_vectorized_lookup_matches_scalar():
+    keys = _SORTED_KEYS[[0, 100, 5000, -1]]
+
+    assert percentiles_of(keys).tolist() == [hand_percentile(int(k)) for k in keys]
+    assert percentiles_of(keys, after_draw=True).tolist() == [
+        hand_percentile(int(k), after_draw=True) for k in keys
+    ]
+
+
+def test_invalid_strength():
+    assert hand_percentile(0) == 0.0
+    with pytest.raises(ValueError):
+        hand_percentile(12345)
@@ -293,6 +293,14 @@ class TestPlayer:
         assert state.bet == player.bet
         assert state.folded == player.folded
 
+    def test_get_state_with_position(self, player):
+        """Test that a state can report a position other than the player's own"""
+        player.position = PlayerPosition.DEALER
+        state = player.get_state(position=PlayerPosition.BIG_BLIND)
+        assert state.position == PlayerPosition.BIG_BLIND
+        assert player.position == PlayerPosition.DEALER
+        assert player.get_state().position == PlayerPosition.DEALER
+
     def test_player_equality(self):
         """Test player equality comparison"""
         player1 = Player("TestPlayer", 1000)
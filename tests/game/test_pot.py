@@ -1802,3 +1802,38 @@ class TestPot:
 
         # Verify logging was called
         assert PotLogger.log_pot_update.called
+
+    def test_contribution_ledger_side_pots(self, pot, mock_players):
+        """Test that side pots are derived from the contribution ledger.
+
+        Assumptions:
+        - Contributions add to the main pot and accumulate per player across rounds
+        - Side pots split the main pot by contribution level, smallest first
+        - Folding is picked up when side pots are next read
+        - Chips above every live player's contribution join the pot below
+        """
+        alice, bob, charlie = mock_players
+        pot.add_contribution(alice, 100)
+        pot.add_contribution(bob, 100)
+        pot.add_contribution(charlie, 100)  # Charlie is all-in for 100 in total
+        pot.add_contribution(alice, 400)
+        pot.add_contribution(bob, 250)
+
+        assert pot.pot == 950
+        assert pot.contributions == {alice: 500, bob: 350, charlie: 100}
+        assert [(p.amount, p.eligible_players) for p in pot.side_pots] == [
+            (300, ["Alice", "Bob", "Charlie"]),
+            (500, ["Alice", "Bob"]),
+            (150, ["Alice"]),
+        ]
+        assert pot.get_state().total_pot == 950  # Side pots split the main pot
+
+        alice.folded = True
+        assert [(p.amount, p.eligible_players) for p in pot.side_pots] == [
+            (300, ["Bob", "Charlie"]),
+            (650, ["Bob"]),
+        ]
+
+        pot.reset_pot()
+        assert pot.contributions == {}
+        assert pot.side_pots == []
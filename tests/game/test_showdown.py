@@ -0,0 +1,90 @@
+import pytest
+
+from game.card import Card
+from game.hand import Hand
+from game.player import Player
+from game.pot import Pot
+from game.showdown import handle_showdown
+
+
+def make_player(name: str, chips: int, cards: str) -> Player:
+    """Create a player holding the hand described by e.g. "A♠ K♠ Q♠ J♠ 10♠"."""
+    player = Player(name, chips)
+    player.hand = Hand([Card(card[:-1], card[-1]) for card in cards.split()])
+    return player
+
+
+@pytest.fixture
+def pot():
+    """Create a fresh Pot instance for each test."""
+    return Pot()
+
+
+class TestShowdown:
+    def test_side_pots_go_to_best_eligible_hand(self, pot):
+        """Test that each side pot is paid to the best hand eligible for it.
+
+        Assumptions:
+        - The short stack with the best hand wins only the pot it covered
+        - The second best hand among the bigger stacks wins the side pot
+        - Chips nobody else matched return to the player who put them in
+        """
+        short = make_player("Short", 0, "A♠ A♥ A♦ K♣ K♠")  # Full house
+        middle = make_player("Middle", 0, "Q♠ Q♥ 9♦ 9♣ 2♠")  # Two pair
+        big = make_player("Big", 0, "J♠ 9♥ 7♦ 4♣ 2♦")  # High card
+        pot.add_contribution(short, 100)
+        pot.add_contribution(middle, 300)
+        pot.add_contribution(big, 500)
+        players = [short, middle, big]
+
+        handle_showdown(players, {p: p.chips for p in players}, pot)
+
+        assert short.chips == 300  # Main pot: 100 from each player
+        assert middle.chips == 400  # Side pot: 200 from Middle and Big
+        assert big.chips == 200  # Uncalled chips
+        assert sum(p.chips for p in players) == pot.pot
+
+    def test_folded_players_chips_stay_in_pot(self, pot):
+        """Test that folded players' contributions go to the live hands.
+
+        Assumptions:
+        - A folded player is never paid, even holding the best cards
+        - A side pot with no live contributor above it is merged downwards
+        """
+        folder = make_player("Folder", 0, "A♠ A♥ A♦ A♣ K♠")
+        short = make_player("Short", 0, "Q♠ Q♥ 9♦ 9♣ 2♠")
+        big = make_player("Big", 0, "J♠ 9♥ 7♦ 4♣ 2♦")
+        pot.add_contribution(folder, 400)
+        pot.add_contribution(short, 100)
+        pot.add_contribution(big, 200)
+        folder.folded = True
+        players = [folder, short, big]
+
+        handle_showdown(players, {p: p.chips for p in players}, pot)
+
+        assert folder.chips == 0
+        assert short.chips == 300  # 100 from each player
+        assert big.chips == 400  # Everything above Short's all-in
+        assert sum(p.chips for p in players) == pot.pot
+
+    def test_split_pot_odd_chip_goes_first_in_seat_order(self, pot):
+        """Test that tied hands split each pot with the odd chip by seat.
+
+        Assumptions:
+        - Equal strength hands share the pot
+        - The remainder goes to the tied winner seated first
+        - Chips added outside the ledger are shared by all live players
+        """
+        loser = make_player("Loser", 0, "J♠ 9♥ 7♦ 4♣ 2♦")
+        first = make_player("First", 0, "A♠ K♥ Q♦ J♣ 10♠")
+        second = make_player("Second", 0, "A♥ K♠ Q♣ J♦ 10♥")
+        for player in (loser, first, second):
+            pot.add_contribution(player, 100)
+        pot.add_to_pot(1)  # Odd chip, e.g. a dead blind
+        players = [loser, second, first]
+
+        handle_showdown(players, {p: p.chips for p in players}, pot)
+
+        assert loser.chips == 0
+        assert second.chips == 151  # Seated before First
+        assert first.chips == 150
@@ -0,0 +1,93 @@
+import pytest
+
+from game import GameConfig
+from game.simulation import (
+    PlayerSpec,
+    SimulationSummary,
+    iter_hands,
+    iter_simulations,
+    play_simulated_game,
+    roster_from_configs,
+    simulate,
+)
+
+
+@pytest.fixture
+def roster():
+    """Three random bots with default stacks."""
+    return [PlayerSpec(name=name) for name in ["Alice", "Bob", "Charlie"]]
+
+
+@pytest.fixture
+def config():
+    """Short games so the pool tests stay fast."""
+    return GameConfig(max_rounds=15, audit_every=1)
+
+
+def test_simulated_game_records_hands(roster, config):
+    """Test that a simulated game records every hand's chip changes.
+
+    Assumptions:
+    - Every hand's deltas sum to zero, and auditing every hand finds no violation
+    - The per-hand deltas add up to the final chip counts
+    - The same seed and game index replay the same game
+    """
+    result = play_simulated_game(3, 7, roster, config)
+
+    assert result.game_index == 3
+    assert result.hands
+    assert all(sum(hand.deltas) == 0 for hand in result.hands)
+    totals = [1000 + sum(hand.deltas[i] for hand in result.hands) for i in range(3)]
+    assert tuple(totals) == result.final_chips
+    assert play_simulated_game(3, 7, roster, config) == result
+
+
+def test_simulation_pool_matches_serial_games(roster, config):
+    """Test that games played across worker processes match in-process games.
+
+    Assumptions:
+    - Results stream back once per game, in any order
+    - Each game depends only on the seed and its index
+    - The summary aggregates chips and wins over all games
+    """
+    results = list(iter_simulations(4, roster, config, seed=1, max_workers=2))
+
+    assert sorted(r.game_index for r in results) == [0, 1, 2, 3]
+    for result in results:
+        assert result == play_simulated_game(result.game_index, 1, roster, config)
+
+    summary = simulate(4, roster, config, seed=1, max_workers=2)
+    expected = SimulationSummary(names=["Alice", "Bob", "Charlie"])
+    for result in sorted(results, key=lambda r: r.game_index):
+        expected.add(result, [1000, 1000, 1000])
+    assert summary == expected
+    assert sum(summary.chip_deltas) == 0
+
+
+def test_hands_stream_from_workers(roster, config):
+    """Test that workers stream every hand back as it is played.
+
+    Assumptions:
+    - Each hand arrives on its own, tagged with its game index and round number
+    - Hands of one game arrive in the order they were played
+    - The streamed hands are exactly the hands an in-process game records
+    """
+    streamed = list(iter_hands(3, roster, config, seed=2, max_workers=2))
+
+    assert {hand.game_index for hand in streamed} == {0, 1, 2}
+    for index in range(3):
+        hands = [hand for hand in streamed if hand.game_index == index]
+        assert hands == play_simulated_game(index, 2, roster, config).hands
+
+
+def test_roster_from_configs():
+    """Test that a roster has one player per configured agent."""
+    configs = {"Alice": {"strategy_style": "Tight"}, "Bob": {}}
+
+    assert roster_from_configs(configs) == [
+        PlayerSpec(name="Alice"),
+        PlayerSpec(name="Bob"),
+    ]
+    assert roster_from_configs(configs, agent="agent")[0].options == {
+        "strategy_style": "Tight"
+    }
@@ -281,14 +281,26 @@ def test_player_count_methods(mock_players):
     assert table.get_all_in_count() == 0
     assert table.get_folded_count() == 0
 
-    # After some state changes
+    # After a fold and an all-in call, as the table sees them
     mock_players[0].folded = True
+    table.mark_player_acted(
+        mock_players[0], ActionDecision(action_type=ActionType.FOLD)
+    )
+    mock_players[1].chips = 0
     mock_players[1].is_all_in = True
+    table.mark_player_acted(
+        mock_players[1], ActionDecision(action_type=ActionType.CALL)
+    )
 
-    assert table.get_active_count() == len(mock_players) - 1  # Folded player not active
+    assert table.get_active_count() == len(mock_players) - 2
     assert table.get_all_in_count() == 1
     assert table.get_folded_count() == 1
 
+    # Changes made behind the table's back count from the next betting round
+    mock_players[2].folded = True
+    table.reset_action_tracking()
+    assert table.get_active_count() == len(mock_players) - 3
+
 
 def test_inactive_players(mock_players):
     """Test identification of inactive players."""
@@ -381,3 +393,84 @@ def test_betting_edge_cases(mock_players):
 
     assert mock_players[1] in table.all_in_players()
     assert table.current_bet == 150  # Highest bet remains unchanged
+
+
+def test_rotation_skips_players_leaving_the_ring(player_factory):
+    """Test that folds and busted stacks leave the rotation, however they happen.
+
+    Verifies:
+    - A fold reported through mark_player_acted takes the seat out at once
+    - A player who folded or ran out of chips unseen is skipped when reached
+    - The ring is rebuilt for the next betting round and after seating changes
+    """
+    players = [player_factory(name=f"Seat{i}") for i in range(10)]
+    table = Table(list(players))
+
+    players[1].folded = True
+    table.mark_player_acted(players[1], ActionDecision(action_type=ActionType.FOLD))
+    players[2].chips = 0  # All-in without telling the table
+    players[9].folded = True
+
+    order = [table.get_next_player() for _ in range(8)]
+    assert order == [players[i] for i in [0, 3, 4, 5, 6, 7, 8, 0]]
+
+    # Only one player left who can act
+    for player in players[3:]:
+        player.folded = True
+    complete, reason = table.is_round_complete()
+    assert complete
+    assert reason == "only one active player"
+
+    # A new street starts from the players' current states
+    for player in players:
+        player.folded = False
+    table.reset_action_tracking()
+    assert table.needs_to_act == set(players) - {players[2]}
+
+    table.remove_player(players[0])
+    assert table.get_next_player() == players[3]
+
+
+def test_replacing_players_rebuilds_rotation(mock_players, player_factory):
+    """Test that assigning a new players list resets the rotation."""
+    table = Table(mock_players)
+    assert table.get_next_player() == mock_players[0]
+
+    replacements = [player_factory(name="New1"), player_factory(name="New2")]
+    table.players = replacements
+    table.index = 0
+    assert [table.get_next_player() for _ in range(3)] == [
+        replacements[0],
+        replacements[1],
+        replacements[0],
+    ]
+
+
+def test_round_completion_does_not_walk_the_ring(monkeypatch):
+    """Test that completion checks only look at players short of the bet.
+
+    Assumptions:
+    - A raise collects the players short of the new bet once
+    - Calls and folds take players out of that set as they act
+    - Checking completion never iterates over every active seat
+    """
+    players = [Player(f"P{i}", 1000) for i in range(9)]
+    table = Table(players)
+    table.reset_action_tracking()
+
+    table.mark_player_acted(
+        players[0], ActionDecision(action_type=ActionType.RAISE, raise_amount=100)
+    )
+    players[0].bet = 100
+
+    def walk():
+        raise AssertionError("is_round_complete walked the ring")
+
+    monkeypatch.setattr(table, "_ring_players", walk)
+    for player in players[1:8]:
+        table.mark_player_acted(player, ActionDecision(action_type=ActionType.CALL))
+        assert table.is_round_complete() == (False, "players still need to act")
+
+    players[8].folded = True
+    table.mark_player_acted(players[8], ActionDecision(action_type=ActionType.FOLD))
+    assert table.is_round_complete() == (True, "betting round complete")
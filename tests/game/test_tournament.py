@@ -0,0 +1,149 @@
+import asyncio
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from agents.random_agent import RandomAgent
+from game import GameConfig
+from game.tournament import PokerTournament
+
+BLIND_SCHEDULE = [
+    {"small_blind": 25, "big_blind": 50, "ante": 0},
+    {"small_blind": 50, "big_blind": 100, "ante": 10},
+    {"small_blind": 100, "big_blind": 200, "ante": 25},
+]
+
+
+def make_tournament(num_players, seed=3, **kwargs):
+    """A headless tournament of random bots."""
+    players = [RandomAgent(f"Bot{i}") for i in range(num_players)]
+    kwargs.setdefault("hands_per_level", 10)
+    return PokerTournament(
+        players,
+        buy_in=100,
+        starting_chips=2000,
+        blind_schedule=BLIND_SCHEDULE,
+        config=GameConfig(seed=seed, headless=True, audit_every=1),
+        **kwargs,
+    )
+
+
+def test_field_is_dealt_evenly_across_tables():
+    """Test that the field is seated on as few, evenly filled tables as possible.
+
+    Assumptions:
+    - 20 players at 9-handed tables need 3 tables of 7, 7 and 6
+    - Every player starts with the tournament stack
+    - Each table plays at the first level's blinds
+    """
+    tournament = make_tournament(20, table_size=9)
+
+    assert tournament._table_sizes() == [7, 7, 6]
+    assert all(p.chips == 2000 for p in tournament.players)
+    for table in tournament.tables.values():
+        assert table.small_blind == 25
+        assert table.big_blind == 50
+
+
+def test_invalid_tournament_settings():
+    """Test that unplayable settings are rejected."""
+    with pytest.raises(ValueError):
+        make_tournament(1)
+    with pytest.raises(ValueError):
+        make_tournament(10, table_size=1)
+    with pytest.raises(ValueError):
+        make_tournament(10, hands_per_level=0)
+
+
+def test_busted_players_break_and_balance_tables():
+    """Test that tables are broken and balanced between hands.
+
+    Assumptions:
+    - Busted players are unseated and recorded, shortest starting stack first
+    - The shortest table breaks once the others can seat everyone
+    - No two remaining tables differ by more than one player
+    """
+    tournament = make_tournament(18, table_size=6)
+    assert tournament._table_sizes() == [6, 6, 6]
+
+    # No hand has been dealt, so record the stacks a hand would have
+    for table in tournament.tables.values():
+        table.round_starting_stacks = {p: p.chips for p in table.table}
+
+    table_one = tournament.tables[1]
+    busted = list(table_one.table.players[:4])
+    for stack, player in zip([300, 100, 200, 400], busted):
+        table_one.round_starting_stacks[player] = stack
+        player.chips = 0
+
+    tournament._end_hand_for_hand()
+
+    assert tournament.eliminated == [busted[1], busted[2], busted[0], busted[3]]
+    assert len(tournament.tables) == 3
+    assert sorted(tournament._table_sizes()) == [4, 5, 5]
+
+    # Two more busts leave 12 players, who fit on two tables
+    for player in list(tournament.tables[2].table.players[:2]):
+        player.chips = 0
+    tournament._end_hand_for_hand()
+
+    assert len(tournament.tables) == 2
+    assert tournament._table_sizes() == [6, 6]
+    seated = [p for t in tournament.tables.values() for p in t.table]
+    assert len(set(seated)) == 12
+    assert not set(seated) & set(tournament.eliminated)
+
+
+def test_async_tournament_matches_threaded_tournament():
+    """Test that a seeded tournament plays out identically with threads or asyncio.
+
+    Assumptions:
+    - Each table draws from its own random stream, so scheduling does not matter
+    - Chips are conserved and the last table holds them all
+    - The standings rank every entrant, champion first
+    """
+    threaded = make_tournament(24, table_size=6)
+    standings = threaded.start_tournament()
+
+    assert len(threaded.tables) == 1
+    assert [p.chips for p in standings].count(0) == len(standings) - 1
+    assert standings[0].chips == 24 * 2000
+    assert set(standings) == set(threaded.players)
+    assert len(threaded.eliminated) == 23
+
+    gathered = make_tournament(24, table_size=6)
+    async_standings = asyncio.run(gathered.start_tournament_async())
+
+    assert [p.name for p in async_standings] == [p.name for p in standings]
+    assert gathered.hands_played == threaded.hands_played
+    assert gathered.current_level_index == threaded.current_level_index
+
+
+def test_tables_are_built_without_a_database_client():
+    """Test that logged tournament tables never open a database connection."""
+    players = [RandomAgent(f"Bot{i}") for i in range(4)]
+    with patch("game.game.DatabaseClient") as client:
+        tournament = PokerTournament(
+            players, buy_in=100, starting_chips=2000, blind_schedule=BLIND_SCHEDULE
+        )
+
+    client.assert_not_called()
+    assert all(table.db_client is None for table in tournament.tables.values())
+
+
+def test_headless_tournament_setup_is_silent(caplog):
+    """Test that seating a headless field logs nothing."""
+    players = [RandomAgent(f"Bot{i}") for i in range(30)]
+    caplog.set_level(logging.DEBUG)
+    caplog.clear()
+
+    PokerTournament(
+        players,
+        buy_in=100,
+        starting_chips=2000,
+        blind_schedule=BLIND_SCHEDULE,
+        config=GameConfig(headless=True),
+    )
+
+    assert not caplog.records
@@ -46,6 +46,7 @@ class MockPot:
 
     Default Behaviors:
         - add_to_pot: Adds amount to main pot, raises ValueError for negative amounts
+        - add_contribution: Adds a player's bet through add_to_pot
         - calculate_side_pots: Creates side pots based on player bets and all-ins,
           merging with existing pots and maintaining chip consistency
         - validate_pot_state: Validates pot consistency and total chips in play
@@ -76,6 +77,9 @@ class MockPot:
 
         # Create mock methods that can be configured in tests
         self.add_to_pot = MagicMock()
+        self.add_contribution = MagicMock(
+            side_effect=lambda player, amount: self.add_to_pot(amount)
+        )
         self.calculate_side_pots = MagicMock(return_value=[])
         self.reset_pot = MagicMock()
         self.validate_pot_state = MagicMock(return_value=True)
@@ -119,13 +119,16 @@ def run_tournament():
     tournament = PokerTournament(
         players=players,
         buy_in=100,  # Buy-in amount (for tracking)
-        starting_chips=1000,  # Starting stack
+        starting_chips=5000,  # Starting stack
         blind_schedule=blind_schedule,
-        level_duration_minutes=1,  # 15 minutes per level
+        level_duration_minutes=15,  # 15 minutes per level
+        table_size=6,
     )
 
     # Run the tournament
-    tournament.start_tournament()
+    standings = tournament.start_tournament()
+    for place, player in enumerate(standings, start=1):
+        logger.info(f"{place}. {player.name} ({player.chips} chips)")
 
 
 if __name__ == "__main__":